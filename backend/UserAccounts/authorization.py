@@ -0,0 +1,189 @@
+"""
+=========================================================
+AUTHORIZATION (who may edit/delete which event)
+=========================================================
+
+Purpose:
+- Single home for the "creator OR Faculty" rule used by update_event,
+  soft_delete_event and hard_delete_event (previously three copies of
+  _is_authorized).
+- Batched check for the My Events page: can_edit_many(requester, ids).
+- Who may see a Private event: can_view_event() (creator, Faculty or
+  invited; used by events/read.py).
+
+What Changed:
+- New module. Requesters may be an accountID or a session token
+  (session.py); tokens are authorized from their signed claims.
+- Account roles (accountType) and event creatorIDs are read through a
+  small TTL cache (ROLE_TTL / CREATOR_TTL seconds), so repeated checks
+  skip the DB. delete_account(), change_account_type() and hard deletes
+  invalidate the affected entries once their transaction commits.
+- Lookups that do hit the DB run on the caller's connection (pass conn,
+  or rely on get_conn() joining the caller's transaction), never on a
+  second connection.
+
+Frontend Use:
+- Not called directly. The My Events page can ask the API for
+  can_edit_many(token, eventIDs) to decide which Edit/Delete buttons to show.
+"""
+
+import json
+import sqlite3
+import threading
+from contextlib import nullcontext
+
+from backend.db.connection import after_commit, get_conn
+from backend.events.cache import MISSING, LocalLRUBackend
+from backend.UserAccounts.session import verify_token
+
+ROLE_TTL = 60.0         # seconds a cached accountType stays valid
+CREATOR_TTL = 300.0     # seconds a cached creatorID stays valid (creators never change)
+MAX_ENTRIES = 10_000
+
+ADMIN_ROLE = "Faculty"  # may edit any event
+
+_roles = LocalLRUBackend(MAX_ENTRIES)     # accountID → accountType
+_creators = LocalLRUBackend(MAX_ENTRIES)  # eventID → creatorID
+_epoch = 0  # bumped by every invalidation; loads that overlap one are not cached
+_epoch_lock = threading.Lock()  # guards _epoch, and makes check-then-store atomic with _forget
+
+
+# -----------------------------
+# CACHED LOOKUPS
+# (missing accounts/events are not cached: their IDs may be created later)
+# -----------------------------
+def _current_epoch() -> int:
+    with _epoch_lock:
+        return _epoch
+
+
+def _store(store: LocalLRUBackend, items, ttl: float, epoch: int):
+    """Cache (key, value) pairs loaded at `epoch`, unless an invalidation happened since."""
+    with _epoch_lock:
+        if epoch == _epoch:
+            for key, value in items:
+                store.set(str(key), value, ttl)
+
+
+def _use(conn: sqlite3.Connection | None):
+    """The caller's connection as-is, or a pooled one (which joins the caller's transaction)."""
+    return get_conn() if conn is None else nullcontext(conn)
+
+
+def account_role(accountID: int, conn: sqlite3.Connection | None = None) -> str | None:
+    """accountType of an account, or None if it does not exist."""
+    role = _roles.get(str(accountID))
+    if role is not MISSING:
+        return role
+    epoch = _current_epoch()
+    with _use(conn) as conn:
+        row = conn.execute("SELECT accountType FROM accounts WHERE accountID = ?", (accountID,)).fetchone()
+    if row is None:
+        return None
+    _store(_roles, [(accountID, row[0])], ROLE_TTL, epoch)
+    return row[0]
+
+
+def event_creators(eventIDs, conn: sqlite3.Connection | None = None) -> dict[int, int]:
+    """{eventID: creatorID} for the events that exist (one query for all cache misses)."""
+    found, missing = {}, []
+    for eventID in eventIDs:
+        creator = _creators.get(str(eventID))
+        if creator is MISSING:
+            missing.append(eventID)
+        else:
+            found[eventID] = creator
+    if missing:
+        epoch = _current_epoch()
+        with _use(conn) as conn:
+            rows = conn.execute(
+                "SELECT eventID, creatorID FROM events WHERE eventID IN (SELECT value FROM json_each(?))",
+                (json.dumps(missing),),
+            ).fetchall()
+        _store(_creators, rows, CREATOR_TTL, epoch)
+        found.update(rows)
+    return found
+
+
+# -----------------------------
+# CHECKS
+# -----------------------------
+def principal(requester: int | str, conn: sqlite3.Connection | None = None) -> tuple[int, str] | None:
+    """
+    (accountID, accountType) for an accountID or a session token;
+    None for unknown accounts and invalid/expired/revoked tokens.
+    """
+    if isinstance(requester, str):
+        claims = verify_token(requester)
+        return None if claims is None else (claims["accountID"], claims["accountType"])
+    role = account_role(requester, conn)
+    return None if role is None else (requester, role)
+
+
+def can_edit(requester: int | str, creatorID: int, conn: sqlite3.Connection | None = None) -> bool:
+    """True if the requester created the event or is Faculty."""
+    who = principal(requester, conn)
+    return who is not None and (who[0] == creatorID or who[1] == ADMIN_ROLE)
+
+
+def can_edit_many(requester: int | str, eventIDs: list[int],
+                  conn: sqlite3.Connection | None = None) -> dict[int, bool]:
+    """
+    {eventID: may edit} for every requested ID (False for missing events).
+    One role lookup and at most one events query for the whole batch.
+    """
+    who = principal(requester, conn)
+    if who is None:
+        return {eventID: False for eventID in eventIDs}
+    creators = event_creators(eventIDs, conn)
+    return {eventID: eventID in creators and (who[1] == ADMIN_ROLE or creators[eventID] == who[0])
+            for eventID in eventIDs}
+
+
+def can_view_event(viewer: int | str, event_id: int, creator_id: int, event_access: str,
+                   conn: sqlite3.Connection | None = None) -> bool:
+    """
+    Whether `viewer` (accountID or session token) may see an event:
+    Public → anyone; Private → its creator, Faculty, or an invited account
+    (inviteLog); Inactive → creator or Faculty only.
+    Runs on `conn` (or the caller's pooled connection), never a second one.
+    """
+    if event_access == "Public":
+        return True
+    with _use(conn) as conn:
+        who = principal(viewer, conn)
+        if who is None:
+            return False
+        if who[0] == creator_id or who[1] == ADMIN_ROLE:
+            return True
+        if event_access != "Private":
+            return False
+        row = conn.execute(
+            "SELECT 1 FROM inviteLog WHERE accountID=? AND eventID=? LIMIT 1", (who[0], event_id)
+        ).fetchone()
+        return row is not None
+
+
+# -----------------------------
+# INVALIDATION
+# (applied after the writer's transaction commits, like events/cache.py)
+# -----------------------------
+def _forget(store: LocalLRUBackend, key: int):
+    global _epoch
+    with _epoch_lock:
+        _epoch += 1
+        store.delete(str(key))
+
+
+def invalidate_account(accountID: int):
+    """Forget a cached role (account deleted or accountType changed)."""
+    after_commit(lambda: _forget(_roles, accountID))
+
+
+def invalidate_event_creator(eventID: int):
+    """Forget a cached creatorID (event deleted; its ID may be reused)."""
+    after_commit(lambda: _forget(_creators, eventID))
+
+
+def authorization_stats() -> dict:
+    return {"roles": _roles.stats(), "creators": _creators.stats()}
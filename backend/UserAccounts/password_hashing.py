@@ -0,0 +1,228 @@
+"""
+=========================================================
+PASSWORD HASHING SERVICE (bounded bcrypt worker pool)
+=========================================================
+
+Purpose:
+- Runs bcrypt hashpw/checkpw (100-300 ms of CPU each) on a fixed-size
+  worker pool instead of on whatever request thread called them, so a
+  registration/login rush cannot starve every other request of CPU.
+- Applies backpressure: at most MAX_PENDING hashes may be queued or
+  running; further callers wait up to QUEUE_TIMEOUT seconds, then get a
+  TimeoutError ("try again") instead of piling up.
+
+What Changed:
+- New module used by userAccount.create_account() / login().
+- Cost factor is configurable (BCRYPT_ROUNDS env var or configure());
+  login() re-hashes a password whose stored cost differs from the current
+  one (needs_rehash), so raising the cost upgrades accounts as they log in.
+- Workers are threads by default (bcrypt releases the GIL while hashing);
+  configure(kind="process") switches to a process pool.
+- hashing_stats() exposes pool saturation (in flight / capacity,
+  rejections) and queue-wait and hash latency.
+
+Frontend Use:
+- Not called directly. A TimeoutError from create_account()/login()
+  should become HTTP 503 "Server busy, please retry".
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+
+import bcrypt
+
+# -----------------------------
+# SETTINGS
+# -----------------------------
+BCRYPT_ROUNDS = int(os.environ.get("BCRYPT_ROUNDS", "12"))   # cost factor (2^rounds iterations)
+HASH_WORKERS = os.cpu_count() or 2                           # concurrent hashes
+MAX_PENDING = HASH_WORKERS * 8                               # queued + running hashes
+QUEUE_TIMEOUT = 5.0                                          # seconds to wait for a free slot
+EXECUTOR_KIND = "thread"                                     # "thread" or "process"
+
+
+# -----------------------------
+# WORKER FUNCTIONS
+# (top-level so a process pool can pickle them; return their own timing)
+# -----------------------------
+def _hash(password: bytes, rounds: int) -> tuple[bytes, float]:
+    start = time.perf_counter()
+    hashed = bcrypt.hashpw(password, bcrypt.gensalt(rounds))
+    return hashed, time.perf_counter() - start
+
+
+def _check(password: bytes, stored: bytes) -> tuple[bool, float]:
+    start = time.perf_counter()
+    ok = bcrypt.checkpw(password, stored)
+    return ok, time.perf_counter() - start
+
+
+# -----------------------------
+# POOL
+# -----------------------------
+class HashingPool:
+    """Executor + bounded admission (semaphore) + latency counters."""
+
+    def __init__(self, workers: int = HASH_WORKERS, max_pending: int = MAX_PENDING,
+                 kind: str = EXECUTOR_KIND, timeout: float = QUEUE_TIMEOUT):
+        if kind not in ("thread", "process"):
+            raise ValueError("kind must be 'thread' or 'process'")
+        if max_pending < workers:
+            raise ValueError("max_pending must be >= workers")
+        executor_cls = ThreadPoolExecutor if kind == "thread" else ProcessPoolExecutor
+        self._executor = executor_cls(max_workers=workers)
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._lock = threading.Lock()
+        self.workers, self.max_pending, self.kind, self.timeout = workers, max_pending, kind, timeout
+        self._in_flight = 0
+        self._completed = 0
+        self._rejected = 0
+        self._hash_total = 0.0
+        self._hash_max = 0.0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+
+    def submit(self, func, *args) -> Future:
+        """
+        Queue func(*args) (a worker function returning (result, seconds)).
+        Blocks up to `timeout` for a slot; raises TimeoutError when saturated.
+        The returned future resolves to the result only.
+        """
+        if not self._slots.acquire(timeout=self.timeout):
+            with self._lock:
+                self._rejected += 1
+            raise TimeoutError(f"Password hashing busy ({self.max_pending} requests pending)")
+        submitted = time.perf_counter()
+        with self._lock:
+            self._in_flight += 1
+        result = Future()
+
+        def done(inner: Future):
+            self._slots.release()
+            elapsed = time.perf_counter() - submitted
+            with self._lock:
+                self._in_flight -= 1
+            if inner.exception() is not None:
+                result.set_exception(inner.exception())
+                return
+            value, hash_seconds = inner.result()
+            with self._lock:
+                self._completed += 1
+                self._hash_total += hash_seconds
+                self._hash_max = max(self._hash_max, hash_seconds)
+                self._wait_total += elapsed - hash_seconds
+                self._wait_max = max(self._wait_max, elapsed - hash_seconds)
+            result.set_result(value)
+
+        try:
+            self._executor.submit(func, *args).add_done_callback(done)
+        except BaseException:
+            self._slots.release()
+            with self._lock:
+                self._in_flight -= 1
+            raise
+        return result
+
+    def stats(self) -> dict:
+        with self._lock:
+            done = self._completed
+            return {
+                "kind": self.kind,
+                "workers": self.workers,
+                "max_pending": self.max_pending,
+                "in_flight": self._in_flight,
+                "saturation": self._in_flight / self.max_pending,
+                "completed": done,
+                "rejected": self._rejected,
+                "hash_avg_s": self._hash_total / done if done else 0.0,
+                "hash_max_s": self._hash_max,
+                "queue_wait_avg_s": self._wait_total / done if done else 0.0,
+                "queue_wait_max_s": self._wait_max,
+            }
+
+    def shutdown(self, wait: bool = True):
+        self._executor.shutdown(wait=wait)
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool() -> HashingPool:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = HashingPool()
+        return _pool
+
+
+def configure(rounds: int | None = None, workers: int | None = None, max_pending: int | None = None,
+              kind: str | None = None, timeout: float | None = None):
+    """Change the cost factor and/or rebuild the pool (running hashes finish on the old one)."""
+    global _pool, BCRYPT_ROUNDS
+    if rounds is not None:
+        if not 4 <= rounds <= 31:
+            raise ValueError("bcrypt rounds must be between 4 and 31")
+        BCRYPT_ROUNDS = rounds
+    if workers is None and max_pending is None and kind is None and timeout is None:
+        return
+    with _pool_lock:
+        old = _pool
+        workers = workers or (old.workers if old else HASH_WORKERS)
+        _pool = HashingPool(
+            workers=workers,
+            max_pending=max_pending or workers * 8,
+            kind=kind or (old.kind if old else EXECUTOR_KIND),
+            timeout=timeout if timeout is not None else (old.timeout if old else QUEUE_TIMEOUT),
+        )
+    if old is not None:
+        old.shutdown(wait=False)
+
+
+def hashing_stats() -> dict:
+    """Pool saturation + latency metrics, plus the current cost factor."""
+    return dict(_get_pool().stats(), rounds=BCRYPT_ROUNDS)
+
+
+# -----------------------------
+# PUBLIC HELPERS
+# -----------------------------
+def _as_bytes(value: str | bytes) -> bytes:
+    return value.encode("utf-8") if isinstance(value, str) else value
+
+
+def submit_hash(password: str) -> Future:
+    """Queue a hash at the current cost; the future resolves to the bcrypt hash (bytes)."""
+    return _get_pool().submit(_hash, _as_bytes(password), BCRYPT_ROUNDS)
+
+
+def submit_check(password: str, stored: str | bytes) -> Future:
+    """Queue a password check; the future resolves to True/False."""
+    return _get_pool().submit(_check, _as_bytes(password), _as_bytes(stored))
+
+
+def hash_password(password: str) -> bytes:
+    """Hash on the pool and wait for the result."""
+    return submit_hash(password).result()
+
+
+def check_password(password: str, stored: str | bytes) -> bool:
+    """Check on the pool and wait for the result."""
+    return submit_check(password, stored).result()
+
+
+def hash_rounds(stored: str | bytes) -> int | None:
+    """Cost factor of a stored "$2b$12$..." hash (None if not a bcrypt hash)."""
+    parts = _as_bytes(stored).split(b"$")
+    try:
+        return int(parts[2])
+    except (IndexError, ValueError):
+        return None
+
+
+def needs_rehash(stored: str | bytes) -> bool:
+    """True if the stored hash uses a different cost than BCRYPT_ROUNDS."""
+    rounds = hash_rounds(stored)
+    return rounds is not None and rounds != BCRYPT_ROUNDS
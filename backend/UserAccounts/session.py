@@ -0,0 +1,164 @@
+"""
+=========================================================
+SESSION TOKENS (signed, stateless login sessions)
+=========================================================
+
+Purpose:
+- After login, the backend hands out one signed token that carries the
+  accountID and accountType, so later privileged calls (edit/delete
+  event) can be authorized without reading the accounts table again.
+- Tokens expire, and can be revoked individually (logout) or per account
+  (account deleted / password changed).
+
+What Changed:
+- New module, standard library only (hmac + hashlib + base64 + json).
+- Token = base64url(JSON claims) + "." + base64url(HMAC-SHA256 signature).
+  Claims: accountID, accountType, iat, exp, jti (random token id).
+- Signatures are checked with hmac.compare_digest (constant time) on bytes;
+  malformed or non-ASCII tokens are rejected (None), never raised on.
+- Revocation list is in memory: revoked jti values plus a per-account
+  "revoked before" timestamp. Both are pruned (at most every
+  PRUNE_INTERVAL seconds, on revoke/verify) once every token they could
+  reject has expired anyway, so they stay bounded.
+- The signing key comes from the SESSION_SECRET env var. Without it a
+  random key is generated per process, so tokens stop working after a
+  restart; set SESSION_SECRET in production and when running several
+  worker processes.
+
+Frontend Use:
+- Login screen → userAccount.login_session(email, password)
+  → (True, token): keep it and send it with every request
+    (e.g. "Authorization: Bearer <token>").
+- Edit/Delete Event → pass the token where an accountID was passed before
+  (update_event, soft_delete_event, hard_delete_event accept either).
+- Logout → userAccount.logout(token).
+"""
+
+import base64
+import hashlib
+import hmac
+import json
+import os
+import secrets
+import threading
+import time
+
+SESSION_TTL = 12 * 3600   # seconds a token stays valid
+PRUNE_INTERVAL = 60.0     # seconds between sweeps of the revocation lists
+
+_secret = os.environ.get("SESSION_SECRET", "").encode("utf-8") or secrets.token_bytes(32)
+_lock = threading.Lock()
+_revoked_tokens = {}      # jti → exp (dropped once expired)
+_revoked_before = {}      # accountID → tokens issued at or before this time are invalid
+_longest_ttl = SESSION_TTL  # longest ttl issued so far: older revocations can no longer match
+_next_prune = 0.0
+
+
+def configure(secret: str | bytes | None = None):
+    """Set the signing key (tokens signed with the previous key become invalid)."""
+    global _secret
+    if secret is None:
+        _secret = secrets.token_bytes(32)
+    else:
+        _secret = secret.encode("utf-8") if isinstance(secret, str) else secret
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _b64decode(text: str) -> bytes:
+    return base64.urlsafe_b64decode(text + "=" * (-len(text) % 4))
+
+
+def _sign(payload: str) -> str:
+    return _b64encode(hmac.new(_secret, payload.encode("ascii"), hashlib.sha256).digest())
+
+
+# -----------------------------
+# ISSUE / VERIFY
+# -----------------------------
+def issue_token(accountID: int, accountType: str, ttl: int = SESSION_TTL) -> str:
+    """Create a signed token for an authenticated account."""
+    global _longest_ttl
+    now = time.time()
+    if ttl > _longest_ttl:
+        with _lock:
+            _longest_ttl = max(_longest_ttl, ttl)
+    claims = {
+        "accountID": accountID,
+        "accountType": accountType,
+        "iat": now,
+        "exp": now + ttl,
+        "jti": secrets.token_urlsafe(12),
+    }
+    payload = _b64encode(json.dumps(claims, separators=(",", ":")).encode("utf-8"))
+    return f"{payload}.{_sign(payload)}"
+
+
+def verify_token(token: str) -> dict | None:
+    """
+    Return the token's claims if it is well-formed, correctly signed,
+    unexpired and not revoked; otherwise None. No database access.
+    """
+    if not isinstance(token, str) or not token.isascii() or token.count(".") != 1:
+        return None  # client-supplied: anything non-ASCII cannot be one of ours
+    payload, signature = token.split(".")
+    if not hmac.compare_digest(signature.encode("ascii"), _sign(payload).encode("ascii")):
+        return None
+    try:
+        claims = json.loads(_b64decode(payload))
+    except ValueError:
+        return None
+    if not isinstance(claims, dict):
+        return None
+    now = time.time()
+    if claims.get("exp", 0) <= now:
+        return None
+    with _lock:
+        _prune(now)
+        if claims.get("jti") in _revoked_tokens:
+            return None
+        if claims.get("iat", 0) <= _revoked_before.get(claims.get("accountID"), float("-inf")):
+            return None
+    return claims
+
+
+# -----------------------------
+# REVOCATION
+# -----------------------------
+def _prune(now: float):
+    """Drop revocations no unexpired token can match. Caller holds _lock."""
+    global _next_prune
+    if now < _next_prune:
+        return
+    _next_prune = now + PRUNE_INTERVAL
+    for jti in [j for j, exp in _revoked_tokens.items() if exp <= now]:
+        del _revoked_tokens[jti]
+    horizon = now - _longest_ttl  # every token issued before this has expired
+    for accountID in [a for a, before in _revoked_before.items() if before <= horizon]:
+        del _revoked_before[accountID]
+
+
+def revoke_token(token: str) -> bool:
+    """Invalidate one token (logout). Returns False if it was already invalid."""
+    claims = verify_token(token)
+    if claims is None:
+        return False
+    with _lock:
+        _prune(time.time())
+        _revoked_tokens[claims["jti"]] = claims["exp"]
+    return True
+
+
+def revoke_account(accountID: int):
+    """Invalidate every token issued so far for an account (deletion, password change)."""
+    now = time.time()
+    with _lock:
+        _prune(now)
+        _revoked_before[accountID] = now
+
+
+def session_stats() -> dict:
+    with _lock:
+        return {"revoked_tokens": len(_revoked_tokens), "revoked_accounts": len(_revoked_before)}
@@ -0,0 +1,60 @@
+"""
+Tests for UserAccounts/session.py (run: python -m pytest -q).
+"""
+
+import pytest
+
+from backend.UserAccounts import session
+
+
+class Clock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(session.time, "time", clock)
+    monkeypatch.setattr(session, "_revoked_tokens", {})
+    monkeypatch.setattr(session, "_revoked_before", {})
+    monkeypatch.setattr(session, "_next_prune", 0.0)
+    monkeypatch.setattr(session, "_longest_ttl", session.SESSION_TTL)
+    return clock
+
+
+def test_revoked_token_and_account_are_rejected(clock):
+    token = session.issue_token(1, "Student")
+    assert session.verify_token(token)["accountID"] == 1
+    assert session.revoke_token(token)
+    assert session.verify_token(token) is None
+
+    other = session.issue_token(2, "Student")
+    clock.now += 1
+    session.revoke_account(2)
+    assert session.verify_token(other) is None
+    clock.now += 1
+    assert session.verify_token(session.issue_token(2, "Student"))
+
+
+def test_revocations_are_dropped_once_their_tokens_expire(clock):
+    for accountID in range(100):
+        session.revoke_token(session.issue_token(accountID, "Student"))
+        session.revoke_account(accountID)
+    assert session.session_stats() == {"revoked_tokens": 100, "revoked_accounts": 100}
+
+    clock.now += session.SESSION_TTL + session.PRUNE_INTERVAL
+    session.verify_token(session.issue_token(1, "Student"))
+    assert session.session_stats() == {"revoked_tokens": 0, "revoked_accounts": 0}
+
+
+def test_long_lived_tokens_keep_their_account_revocation(clock):
+    token = session.issue_token(5, "Faculty", ttl=3 * session.SESSION_TTL)
+    clock.now += 1
+    session.revoke_account(5)
+    clock.now += 2 * session.SESSION_TTL
+    assert session.verify_token(token) is None
+    assert session.session_stats()["revoked_accounts"] == 1
@@ -17,22 +17,45 @@ What Changed:
 - Added account verification flow (generate code, validate, mark verified).
 - Added login with bcrypt check + verification status.
 - Added delete_account helper.
+- DB access goes through the shared connection pool instead of a relative DB path.
+- bcrypt runs on the bounded pool in password_hashing.py (configurable cost,
+  backpressure, metrics); login upgrades hashes made with an old cost.
+- login_session() issues a signed session token (session.py) so later
+  authorization checks skip the accounts table; delete_account() revokes
+  the account's tokens.
+- delete_account() / change_account_type() drop the cached role used by
+  authorization.py.
+- delete_account() relies on ON DELETE CASCADE: the account's events,
+  likes, RSVPs and invites go with it in one transaction.
+- search_accounts() finds verified accounts by email prefix for invite
+  autocomplete: one range read on the lower(email) index.
 
 Frontend Use:
 - Register screen → create_account()
-- Login screen → login()
+- Login screen → login(), or login_session() to get a session token
+- Logout → logout(token)
 - Email verification screen → verify_code()
 - Account settings → delete_account()
+- Admin tools → change_account_type()
+- InviteUserSearch → search_accounts(typedText) on each keystroke
 """
 
-import sqlite3
 import re
-import bcrypt
 import random
 from datetime import datetime, timedelta
 
-# Path to SQLite DB
-DB_PATH = "../db/EventPlannerDB.db"
+from backend.db.connection import get_conn, unit_of_work
+from backend.events.cache import clear_cache
+from backend.images.image_store import release_image
+from backend.UserAccounts.password_hashing import check_password, hash_password, needs_rehash
+from backend.UserAccounts.authorization import invalidate_account, invalidate_event_creator
+from backend.UserAccounts.session import issue_token, revoke_account, revoke_token
+
+# -----------------------------
+# SETTINGS
+# -----------------------------
+SEARCH_LIMIT_MAX = 50   # most suggestions search_accounts() returns
+
 
 class userAccount:
     # ===========================================================
@@ -47,35 +70,38 @@ class userAccount:
         - Inserts into accounts table.
         Returns: verification code (string).
         """
-        if accountType == "Student" and not re.match(r".+@bears\.unco\.edu$", email):
-            raise ValueError("Students must use a bears.unco.edu email")
-        if accountType == "Faculty" and not re.match(r".+@unco\.edu$", email):
-            raise ValueError("Faculty must use a unco.edu email")
+        self._check_email_domain(accountType, email)
 
-        hashed = bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt())
+        hashed = hash_password(password)  # runs on the bounded hashing pool
         code = str(random.randint(100000, 999999))
         expiry = (datetime.now() + timedelta(minutes=15)).strftime("%Y-%m-%d %H:%M:%S")
 
-        with sqlite3.connect(DB_PATH) as conn:
+        with get_conn() as conn:
             cur = conn.cursor()
             cur.execute("""
                 INSERT INTO accounts (accountID, accountType, email, password, isVerified, verificationCode, verificationExpiry)
                 VALUES (?, ?, ?, ?, 0, ?, ?)
             """, (accountID, accountType, email, hashed, code, expiry))
-            conn.commit()
         return code
 
+    def _check_email_domain(self, accountType, email):
+        if accountType == "Student" and not re.match(r".+@bears\.unco\.edu$", email):
+            raise ValueError("Students must use a bears.unco.edu email")
+        if accountType == "Faculty" and not re.match(r".+@unco\.edu$", email):
+            raise ValueError("Faculty must use a unco.edu email")
+
     # ===========================================================
     # Login
     # ===========================================================
     def login(self, email, inputPass):
         """
         Attempt login with email + password.
-        - Verifies bcrypt hash.
+        - Verifies bcrypt hash (on the hashing pool).
+        - Re-hashes the password if it was stored with an old cost factor.
         - Fails if not verified yet.
         Returns: (True, accountID) or (False, reason).
         """
-        with sqlite3.connect(DB_PATH) as conn:
+        with get_conn() as conn:
             cur = conn.cursor()
             cur.execute("SELECT accountID, password, isVerified FROM accounts WHERE email = ?", (email,))
             row = cur.fetchone()
@@ -84,12 +110,41 @@ class userAccount:
             return False, "No such account"
 
         accountID, storedHash, isVerified = row
-        if bcrypt.checkpw(inputPass.encode("utf-8"), storedHash):
+        if check_password(inputPass, storedHash):
+            if needs_rehash(storedHash):
+                self._upgrade_hash(accountID, storedHash, hash_password(inputPass))
             if not isVerified:
                 return False, "Account not verified"
             return True, accountID
         return False, "Incorrect password"
 
+    def login_session(self, email, inputPass):
+        """
+        Same checks as login(), but returns a signed session token that
+        carries accountID + accountType (see session.py).
+        Returns: (True, token) or (False, reason).
+        """
+        ok, result = self.login(email, inputPass)
+        if not ok:
+            return ok, result
+        with get_conn() as conn:
+            row = conn.execute("SELECT accountType FROM accounts WHERE accountID = ?", (result,)).fetchone()
+        if row is None:  # deleted between the two reads
+            return False, "No such account"
+        return True, issue_token(result, row[0])
+
+    def logout(self, token):
+        """Revoke a session token. Returns False if it was already invalid."""
+        return revoke_token(token)
+
+    def _upgrade_hash(self, accountID, oldHash, newHash):
+        """Store a re-hashed password unless it was changed in the meantime."""
+        with get_conn() as conn:
+            conn.execute(
+                "UPDATE accounts SET password = ? WHERE accountID = ? AND password = ?",
+                (newHash, accountID, oldHash),
+            )
+
     # ===========================================================
     # Verify Code
     # ===========================================================
@@ -99,7 +154,7 @@ class userAccount:
         - Fails if code expired, invalid, or account missing.
         - On success: marks account as verified in DB.
         """
-        with sqlite3.connect(DB_PATH) as conn:
+        with get_conn() as conn:
             cur = conn.cursor()
             cur.execute("""
                 SELECT verificationCode, verificationExpiry
@@ -117,22 +172,79 @@ class userAccount:
         if dbCode != codeInput:
             return False, "Invalid code"
 
-        with sqlite3.connect(DB_PATH) as conn:
+        with get_conn() as conn:
             cur = conn.cursor()
             cur.execute("""
                 UPDATE accounts
                 SET isVerified = 1, verificationCode = NULL, verificationExpiry = NULL
                 WHERE accountID = ?
             """, (accountID,))
-            conn.commit()
         return True, "Verified successfully"
 
     # ===========================================================
     # Delete Account
     # ===========================================================
     def delete_account(self, accountID):
-        """Permanently delete account from DB (careful: no undo)."""
-        with sqlite3.connect(DB_PATH) as conn:
+        """
+        Permanently delete account from DB (careful: no undo). Revokes its sessions.
+        Its events, likes, RSVPs and invites are removed by the cascade.
+        """
+        with unit_of_work() as conn:
             cur = conn.cursor()
+            events = cur.execute("SELECT eventID, imageHash FROM events WHERE creatorID = ?",
+                                 (accountID,)).fetchall()
             cur.execute("DELETE FROM accounts WHERE accountID = ?", (accountID,))
-            conn.commit()
+            for eventID, image in events:
+                release_image(conn, image)
+                invalidate_event_creator(eventID)
+            invalidate_account(accountID)
+            clear_cache()  # their events + counts on everything they liked/RSVP'd
+        revoke_account(accountID)
+
+    # ===========================================================
+    # Change Account Type
+    # ===========================================================
+    def change_account_type(self, accountID, accountType):
+        """
+        Switch an account between Student and Faculty (email domain rules apply).
+        Drops the cached role and revokes sessions, whose tokens carry the old type.
+        Returns: True if the account exists.
+        """
+        if accountType not in ("Student", "Faculty"):
+            raise ValueError("accountType must be 'Student' or 'Faculty'")
+        with get_conn() as conn:
+            row = conn.execute("SELECT email FROM accounts WHERE accountID = ?", (accountID,)).fetchone()
+            if row is None:
+                return False
+            self._check_email_domain(accountType, row[0])
+            conn.execute("UPDATE accounts SET accountType = ? WHERE accountID = ?", (accountType, accountID))
+            invalidate_account(accountID)
+        revoke_account(accountID)
+        return True
+
+    # ===========================================================
+    # Search Accounts (invite autocomplete)
+    # ===========================================================
+    def search_accounts(self, prefix, limit=10):
+        """
+        Verified accounts whose email starts with `prefix` (case-insensitive),
+        in email order. Uses idx_accounts_email_lower: the prefix becomes the
+        range [prefix, prefix with its last character bumped).
+        Only ASCII prefixes are searched (SQLite's lower() folds ASCII only,
+        so anything else could not match consistently); others return [].
+        Returns: [{"accountID", "accountType", "email"}] (no password/codes).
+        """
+        prefix = prefix.strip().lower()
+        if not prefix or not prefix.isascii():
+            return []
+        upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)  # at most chr(128): sorts above all ASCII
+        limit = max(1, min(int(limit), SEARCH_LIMIT_MAX))
+        with get_conn() as conn:
+            cur = conn.cursor()
+            cur.execute("""
+                SELECT accountID, accountType, email FROM accounts
+                WHERE lower(email) >= ? AND lower(email) < ? AND isVerified = 1
+                ORDER BY lower(email)
+                LIMIT ?
+            """, (prefix, upper, limit))
+            return [dict(row) for row in cur.fetchall()]
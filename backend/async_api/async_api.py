@@ -0,0 +1,281 @@
+"""
+=========================================================
+ASYNC API (asyncio facade over the sqlite3 backend modules)
+=========================================================
+
+Purpose:
+- Lets an async web layer (FastAPI/uvicorn) call the events, rsvp,
+  liking_log and userAccount modules without blocking its event loop:
+      event = await async_api.read_event_by_id(5)
+      liked, count = await async_api.toggle_like(user_id, 5)
+- Identical reads that are in flight at the same time share one DB call
+  (e.g. hundreds of clients opening the same event page).
+
+What Changed:
+- New module. Every call runs on a dedicated DB executor: a thread pool
+  with one worker per pooled connection (connection.POOL_SIZE), so each
+  worker holds at most one connection and DB work never queues on the
+  connection pool itself.
+- Reads are coalesced per event loop by (function, arguments). A read
+  never joins one that started before a write completed through this
+  facade, so a client always sees its own writes.
+- Every caller of a coalesced read gets its own copy of the shared result
+  (followers always, the first caller whenever anyone joined it), so one
+  handler mutating its data cannot change another's.
+- Cancelling an awaiting request does not cancel the shared DB call
+  (other callers may still be waiting on it).
+- Streams (iter_events, read_event_image) are exposed as async
+  iterators that pull batches on the executor.
+- async_stats() reports calls, coalesced reads and executor size.
+
+Frontend Use:
+- Not called by the frontend directly; API route handlers await these
+  instead of calling the sync modules.
+"""
+
+import asyncio
+import copy
+import functools
+import itertools
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
+from backend.db import connection
+from backend.events import categories, create, hard_delete, read, soft_delete, trending, update
+from backend.invites import invite_log
+from backend.liking_log import liking_log
+from backend.recommendations import recommendations
+from backend.rsvp import rsvp
+from backend.UserAccounts import authorization
+from backend.UserAccounts.userAccount import userAccount
+
+STREAM_BATCH_SIZE = 200   # rows (or image chunks) pulled per executor hop
+
+_executor = None
+_workers = 0
+_executor_lock = threading.Lock()
+_inflight = weakref.WeakKeyDictionary()   # event loop → {read key: [future, followers]}
+_write_generation = 0                     # bumped after every write through this facade
+_stats = {"calls": 0, "reads": 0, "coalesced": 0, "writes": 0}
+
+
+# -----------------------------
+# DB EXECUTOR
+# -----------------------------
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor, _workers
+    with _executor_lock:
+        if _executor is None:
+            _workers = connection.POOL_SIZE
+            _executor = ThreadPoolExecutor(max_workers=_workers, thread_name_prefix="db")
+        return _executor
+
+
+def configure_executor(workers: int | None = None):
+    """Replace the DB executor (e.g. after connection.configure(pool_size=...))."""
+    global _executor, _workers
+    with _executor_lock:
+        _workers = workers or connection.POOL_SIZE
+        old, _executor = _executor, ThreadPoolExecutor(max_workers=_workers, thread_name_prefix="db")
+    if old is not None:
+        old.shutdown(wait=False)
+
+
+def shutdown(wait: bool = True):
+    """Stop the DB executor (call from the web app's shutdown hook)."""
+    global _executor
+    with _executor_lock:
+        old, _executor = _executor, None
+    if old is not None:
+        old.shutdown(wait=wait)
+
+
+async def run_db(func, *args, **kwargs):
+    """Run any blocking backend function on the DB executor and await its result."""
+    _stats["calls"] += 1
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), functools.partial(func, *args, **kwargs))
+
+
+def async_stats() -> dict:
+    """Counters for health/metrics endpoints."""
+    return dict(_stats, executor_workers=_workers,
+                in_flight=sum(len(v) for v in _inflight.values()))
+
+
+# -----------------------------
+# READ COALESCING
+# -----------------------------
+def _freeze(value):
+    """Hashable form of call arguments (lists/dicts become tuples)."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+async def coalesced(func, *args, **kwargs):
+    """
+    Await func(*args, **kwargs) on the DB executor, sharing the call with
+    any identical one already in flight on this loop (and started after
+    the last write).
+    """
+    _stats["reads"] += 1
+    loop = asyncio.get_running_loop()
+    pending = _inflight.setdefault(loop, {})
+    key = (func.__module__, func.__qualname__, _freeze(args), _freeze(kwargs), _write_generation)
+
+    entry = pending.get(key)
+    if entry is not None:
+        _stats["coalesced"] += 1
+        entry[1] += 1
+        return copy.deepcopy(await asyncio.shield(entry[0]))
+
+    future = asyncio.ensure_future(run_db(func, *args, **kwargs))
+    entry = pending[key] = [future, 0]   # [shared call, followers]
+    future.add_done_callback(lambda _: pending.pop(key, None))
+    result = await asyncio.shield(future)
+    # Followers copy the shared result when they resume, which may be after
+    # this caller has changed it: give the caller its own copy if any joined.
+    return copy.deepcopy(result) if entry[1] else result
+
+
+def _reader(func):
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        return await coalesced(func, *args, **kwargs)
+    return wrapper
+
+
+def _direct(func, on_db_executor: bool = True):
+    run = run_db if on_db_executor else asyncio.to_thread
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        return await run(func, *args, **kwargs)
+    return wrapper
+
+
+def _writer(func, on_db_executor: bool = True):
+    run = run_db if on_db_executor else asyncio.to_thread
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        global _write_generation
+        _stats["writes"] += 1
+        try:
+            return await run(func, *args, **kwargs)
+        finally:
+            _write_generation += 1
+    return wrapper
+
+
+# -----------------------------
+# STREAMS
+# -----------------------------
+async def _aiter(generator, batch_size: int = STREAM_BATCH_SIZE):
+    """Drive a blocking generator from the executor, `batch_size` items per hop."""
+    def pull():
+        return list(itertools.islice(generator, batch_size))
+
+    try:
+        while True:
+            batch = await run_db(pull)
+            if not batch:
+                return
+            for item in batch:
+                yield item
+    finally:
+        await run_db(generator.close)  # returns its connection to the pool
+
+
+def iter_events(include_inactive: bool = False, columns: str | list[str] | None = None,
+                batch_size: int = STREAM_BATCH_SIZE):
+    """Async version of read.iter_events(): `async for event in iter_events(): ...`"""
+    return _aiter(read.iter_events(include_inactive, columns, batch_size), batch_size)
+
+
+def read_event_image(eventID: int, include_inactive: bool = False, chunk_size: int = read.CHUNK_SIZE,
+                     viewer_id: int | str | None = None):
+    """Async version of read.read_event_image(): yields image byte chunks."""
+    return _aiter(read.read_event_image(eventID, include_inactive, chunk_size, viewer_id), batch_size=4)
+
+
+# -----------------------------
+# EVENTS
+# -----------------------------
+read_events = _reader(read.read_events)
+read_event_by_id = _reader(read.read_event_by_id)
+read_events_by_creator = _reader(read.read_events_by_creator)
+read_popular_events = _reader(read.read_popular_events)
+read_events_page = _reader(read.read_events_page)
+read_event_field = _reader(read.read_event_field)
+trending_events = _reader(trending.trending_events)
+get_event_categories = _reader(categories.get_event_categories)
+events_in_categories = _reader(categories.events_in_categories)
+
+create_event = _writer(create.create_event)
+update_event = _writer(update.update_event)
+soft_delete_event = _writer(soft_delete.soft_delete_event)
+hard_delete_event = _writer(hard_delete.hard_delete_event)
+
+# -----------------------------
+# LIKES
+# -----------------------------
+has_liked = _reader(liking_log.has_liked)
+has_liked_many = _reader(liking_log.has_liked_many)
+get_event_likes = _reader(liking_log.get_event_likes)
+get_event_like_count = _reader(liking_log.get_event_like_count)
+get_user_likes = _reader(liking_log.get_user_likes)
+
+add_like = _writer(liking_log.add_like)
+remove_like = _writer(liking_log.remove_like)
+toggle_like = _writer(liking_log.toggle_like)
+
+# -----------------------------
+# RSVPS
+# -----------------------------
+has_rsvp = _reader(rsvp.has_rsvp)
+has_rsvp_many = _reader(rsvp.has_rsvp_many)
+get_event_rsvps = _reader(rsvp.get_event_rsvps)
+get_event_rsvp_count = _reader(rsvp.get_event_rsvp_count)
+get_user_rsvps = _reader(rsvp.get_user_rsvps)
+
+add_rsvp = _writer(rsvp.add_rsvp)
+cancel_rsvp = _writer(rsvp.cancel_rsvp)
+toggle_rsvp = _writer(rsvp.toggle_rsvp)
+
+# -----------------------------
+# INVITES
+# -----------------------------
+get_inbox = _reader(invite_log.get_inbox)
+has_invite_many = _reader(invite_log.has_invite_many)
+
+invite_users = _writer(invite_log.invite_users)
+remove_invites_bulk = _writer(invite_log.remove_invites_bulk)
+
+# -----------------------------
+# RECOMMENDATIONS
+# (served from memory; only the first call builds the model from the DB)
+# -----------------------------
+recommend = _reader(recommendations.recommend)
+
+# -----------------------------
+# ACCOUNTS
+# login is never coalesced (it checks a password per request). Calls that
+# hash run on asyncio's default executor: they spend most of their time
+# waiting on the bcrypt pool and should not hold a DB executor worker.
+# -----------------------------
+_accounts = userAccount()
+
+create_account = _writer(_accounts.create_account, on_db_executor=False)
+login = _direct(_accounts.login, on_db_executor=False)
+login_session = _direct(_accounts.login_session, on_db_executor=False)
+logout = _direct(_accounts.logout)
+verify_code = _writer(_accounts.verify_code)
+delete_account = _writer(_accounts.delete_account)
+change_account_type = _writer(_accounts.change_account_type)
+can_edit_many = _reader(authorization.can_edit_many)
+search_accounts = _reader(_accounts.search_accounts)
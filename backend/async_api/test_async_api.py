@@ -0,0 +1,38 @@
+"""
+Tests for async_api/async_api.py (run: python -m pytest -q).
+"""
+
+import asyncio
+import threading
+
+from backend.async_api import async_api
+
+
+def test_coalesced_callers_never_share_a_mutable_result():
+    release = threading.Event()
+    calls = []
+
+    def load(eventID):
+        calls.append(eventID)
+        release.wait(5)
+        return {"eventID": eventID, "tags": ["a"]}
+
+    async def leader():
+        result = await async_api.coalesced(load, 1)
+        result["tags"].append("leader")   # mutate before yielding to the loop
+        return result
+
+    async def follower():
+        await asyncio.sleep(0)            # join the leader's call in flight
+        return await async_api.coalesced(load, 1)
+
+    async def main():
+        tasks = [asyncio.create_task(leader()), asyncio.create_task(follower())]
+        await asyncio.sleep(0.05)
+        release.set()
+        return await asyncio.gather(*tasks)
+
+    first, second = asyncio.run(main())
+    assert calls == [1]
+    assert first["tags"] == ["a", "leader"]
+    assert second["tags"] == ["a"]
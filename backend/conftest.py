@@ -0,0 +1,53 @@
+"""
+=========================================================
+PYTEST FIXTURES (shared by the backend test_*.py modules)
+=========================================================
+
+Purpose:
+- Runs every test against its own scratch database instead of
+  backend/db/EventPlannerDB.db, so tests never touch development data.
+
+What Changed:
+- New module. `db` points the shared connection pool at a fresh file
+  (migrated to the latest schema on first use), seeds the same accounts
+  the events flow script uses, and clears the in-process caches.
+
+Frontend Use:
+- Not used by the frontend. Run with:  python -m pytest -q
+"""
+
+import pytest
+
+from backend.db import connection
+from backend.events import cache
+from backend.UserAccounts import authorization
+
+ACCOUNTS = [
+    (1, "Student", "alice@unco.edu"),
+    (2, "Student", "bob@unco.edu"),
+    (3, "Student", "charlie@unco.edu"),
+    (99, "Faculty", "prof@unco.edu"),
+]
+
+
+def _clear_caches():
+    cache.set_backend(cache.LocalLRUBackend())
+    authorization._roles.clear()
+    authorization._creators.clear()
+
+
+@pytest.fixture
+def db(tmp_path):
+    """Scratch database with ACCOUNTS; yields its path."""
+    previous = connection._pool.db_path
+    path = str(tmp_path / "EventPlannerDB.db")
+    connection.configure(db_path=path)
+    _clear_caches()
+    with connection.get_conn() as conn:
+        conn.executemany(
+            "INSERT INTO accounts (accountID, accountType, email, password, isVerified) VALUES (?, ?, ?, 'x', 1)",
+            ACCOUNTS,
+        )
+    yield path
+    connection.configure(db_path=previous)
+    _clear_caches()
@@ -0,0 +1,296 @@
+"""
+=========================================================
+SHARED DATABASE CONNECTIONS (pooled sqlite3 connections)
+=========================================================
+
+Purpose:
+- Single place where backend modules get a SQLite connection.
+- Keeps a small pool of open connections instead of calling
+  sqlite3.connect() (and redoing PRAGMA setup) on every call.
+- Exposes pool metrics (size, idle, checkouts, checkout wait).
+
+What Changed:
+- Replaces the per-module `_get_conn()` copies in events/, rsvp/,
+  liking_log/ and UserAccounts/.
+- Connections are opened once with WAL journaling, synchronous=NORMAL
+  and a large prepared-statement cache (`cached_statements`), so repeated
+  queries skip re-parsing their SQL.
+- Checkouts are re-entrant per thread: a helper called while its caller
+  already holds a connection (e.g. update_event → _is_authorized) reuses
+  that connection instead of opening a second one.
+- The outermost `with get_conn()` block commits on success and rolls back
+  on error, so nested helpers no longer commit their caller's work early.
+- The first connection a pool opens runs currentDB.migrate(), so the DB
+  file is always at the latest schema version.
+- after_commit() lets writers schedule work (e.g. cache invalidation) that
+  must only happen once their transaction is durable.
+- Foreign keys are enforced on every connection (deletes cascade, see
+  currentDB migration 7).
+- Every connection gets a casefold(text) SQL function (Python's
+  str.casefold), so SQL text filters fold case exactly like the in-memory
+  search helpers (SQLite's LIKE/lower() only fold ASCII).
+- unit_of_work() opens the transaction with BEGIN IMMEDIATE, so a group of
+  writes (create event + categories + invites) takes the write lock once,
+  up front, instead of upgrading a read lock mid-way and failing with
+  "database is locked" when another writer got in first.
+
+Frontend Use:
+- Not called by the frontend directly.
+- API endpoints call the CRUD modules, which all go through get_conn().
+"""
+
+import os
+import queue
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+from backend.db.currentDB import migrate
+
+# -----------------------------
+# DATABASE PATH + POOL SETTINGS
+# -----------------------------
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DB_PATH = os.path.join(BASE_DIR, "EventPlannerDB.db")
+
+POOL_SIZE = 8                 # max open connections per process
+CHECKOUT_TIMEOUT = 30.0       # seconds to wait for a free connection
+BUSY_TIMEOUT_MS = 5000        # how long SQLite waits on a locked DB
+STATEMENT_CACHE_SIZE = 256    # prepared statements kept per connection
+
+PRAGMAS = (
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -8000",   # ~8 MB page cache per connection
+    "PRAGMA mmap_size = 268435456",  # memory-map up to 256 MB of the DB file (image reads)
+    f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}",
+    "PRAGMA foreign_keys = ON",    # enforce REFERENCES + ON DELETE CASCADE (per connection)
+)
+
+
+def _casefold(text):
+    """SQL casefold(x): full Unicode case folding (SQLite's own lower() is ASCII-only)."""
+    return None if text is None else str(text).casefold()
+
+
+def _open_connection(db_path: str) -> sqlite3.Connection:
+    """Open one connection and apply the shared PRAGMA setup."""
+    conn = sqlite3.connect(
+        db_path,
+        timeout=BUSY_TIMEOUT_MS / 1000,
+        cached_statements=STATEMENT_CACHE_SIZE,
+        check_same_thread=False,  # pool hands connections to any thread, one at a time
+    )
+    conn.row_factory = sqlite3.Row  # return dict-like rows
+    for pragma in PRAGMAS:
+        conn.execute(pragma)
+    conn.create_function("casefold", 1, _casefold, deterministic=True)
+    return conn
+
+
+# -----------------------------
+# CONNECTION POOL
+# -----------------------------
+class ConnectionPool:
+    """
+    Fixed-size pool of sqlite3 connections.
+    - Connections are created lazily, up to `size`.
+    - Idle connections are reused most-recently-used first (warm caches).
+    - Callers wait up to `timeout` seconds when every connection is busy.
+    """
+
+    def __init__(self, db_path: str = DB_PATH, size: int = POOL_SIZE, timeout: float = CHECKOUT_TIMEOUT):
+        self.db_path = db_path
+        self.size = size
+        self.timeout = timeout
+        self._idle = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._all = []
+        self._migrated = False
+        self._checkouts = 0
+        self._waits = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+
+    def _acquire(self) -> sqlite3.Connection:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            if len(self._all) < self.size:
+                conn = _open_connection(self.db_path)
+                if not self._migrated:
+                    migrate(conn)  # bring the DB up to the latest schema once per pool
+                    self._migrated = True
+                self._all.append(conn)
+                return conn
+
+        # Pool exhausted: wait for another thread to give one back
+        start = time.perf_counter()
+        try:
+            conn = self._idle.get(timeout=self.timeout)
+        except queue.Empty:
+            raise TimeoutError(f"No database connection free after {self.timeout}s (pool size {self.size})")
+        waited = time.perf_counter() - start
+        with self._lock:
+            self._waits += 1
+            self._wait_total += waited
+            self._wait_max = max(self._wait_max, waited)
+        return conn
+
+    def _release(self, conn: sqlite3.Connection):
+        self._idle.put(conn)
+
+    @contextmanager
+    def checkout(self, shared: bool = True):
+        """
+        Borrow a connection for the duration of a `with` block.
+        - shared=True: re-use the connection this thread already holds
+          (nested helpers join the caller's transaction).
+        - shared=False: always take a separate connection (used for
+          long-lived read cursors that must not hold up the caller's writes).
+        The outermost block commits on success and rolls back on error.
+        """
+        held = getattr(self._local, "conn", None) if shared else None
+        if held is not None:
+            yield held  # nested block: the outermost one commits and releases
+            return
+
+        conn = self._acquire()
+        with self._lock:
+            self._checkouts += 1
+        if shared:
+            self._local.conn = conn
+            self._local.after_commit = []
+        callbacks = []
+        try:
+            yield conn
+            if conn.in_transaction:
+                conn.commit()
+            if shared:
+                callbacks = self._local.after_commit
+        except BaseException:
+            if conn.in_transaction:
+                conn.rollback()
+            raise
+        finally:
+            if shared:
+                self._local.conn = None
+                self._local.after_commit = []
+            self._release(conn)
+        for callback in callbacks:
+            callback()
+
+    def after_commit(self, callback):
+        """
+        Run `callback` once this thread's outermost checkout has committed
+        (dropped on rollback). Runs immediately if no checkout is open.
+        """
+        if getattr(self._local, "conn", None) is None:
+            callback()
+        else:
+            self._local.after_commit.append(callback)
+
+    def in_transaction(self) -> bool:
+        """True if this thread's shared checkout has uncommitted work open."""
+        conn = getattr(self._local, "conn", None)
+        return conn is not None and conn.in_transaction
+
+    def stats(self) -> dict:
+        """Snapshot of pool metrics for health/metrics endpoints."""
+        with self._lock:
+            return {
+                "pool_size": self.size,
+                "open": len(self._all),
+                "idle": self._idle.qsize(),
+                "in_use": len(self._all) - self._idle.qsize(),
+                "checkouts": self._checkouts,
+                "waits": self._waits,
+                "wait_total_s": self._wait_total,
+                "wait_max_s": self._wait_max,
+                "wait_avg_s": self._wait_total / self._waits if self._waits else 0.0,
+            }
+
+    def close(self):
+        """Close every idle connection (call on shutdown or before swapping DB files)."""
+        with self._lock:
+            while True:
+                try:
+                    conn = self._idle.get_nowait()
+                except queue.Empty:
+                    break
+                conn.close()
+                self._all.remove(conn)
+
+
+_pool = ConnectionPool()
+
+
+# -----------------------------
+# MODULE-LEVEL HELPERS
+# Backend modules use these instead of the pool object
+# -----------------------------
+def get_conn(shared: bool = True):
+    """
+    Context manager yielding a pooled connection:
+
+        with get_conn() as conn:
+            conn.execute(...)
+
+    Commits when the outermost block exits without error.
+    """
+    return _pool.checkout(shared=shared)
+
+
+@contextmanager
+def unit_of_work():
+    """
+    One write transaction for a group of mutations:
+
+        with unit_of_work() as conn:
+            eventID = create_event(...)
+            add_invites_bulk([(user, eventID) for user in invitees])
+
+    Takes the write lock immediately (BEGIN IMMEDIATE) and commits once at
+    the end; everything called inside joins it through get_conn(), and an
+    exception rolls all of it back. Inside an already-open transaction it
+    simply joins that one.
+    """
+    with get_conn() as conn:
+        if not conn.in_transaction:
+            conn.execute("BEGIN IMMEDIATE")
+        yield conn
+
+
+def after_commit(callback):
+    """Run `callback` after the current transaction commits (see ConnectionPool.after_commit)."""
+    _pool.after_commit(callback)
+
+
+def in_transaction() -> bool:
+    """True if this thread is inside an open transaction (see ConnectionPool.in_transaction)."""
+    return _pool.in_transaction()
+
+
+def pool_stats() -> dict:
+    """Return current pool metrics (see ConnectionPool.stats)."""
+    return _pool.stats()
+
+
+def configure(db_path: str | None = None, pool_size: int | None = None, timeout: float | None = None):
+    """
+    Point the shared pool at a different DB file or resize it.
+    Mainly for tests / scripts that use a scratch database.
+    """
+    global _pool
+    _pool.close()
+    _pool = ConnectionPool(
+        db_path=db_path or _pool.db_path,
+        size=pool_size or _pool.size,
+        timeout=timeout if timeout is not None else _pool.timeout,
+    )
@@ -1,16 +1,21 @@
-import sqlite3
+import argparse
+import hashlib
 import os
+import sqlite3
 
 """
 =========================================================
-DATABASE CREATION SCRIPT (EventPlannerDB.db)
+DATABASE SCHEMA + MIGRATIONS (EventPlannerDB.db)
 =========================================================
 
 Purpose:
-- Creates the SQLite database schema for the event browsing app.
-- Defines all core tables: accounts, events, eventCategories, rsvpLog, likesLog, inviteLog.
-- Drops and recreates tables on each run (for clean dev/test cycles).
-- Provides a consistent structure for backend CRUD modules to use.
+- Defines the SQLite schema for the event browsing app as an ordered list
+  of versioned migrations: accounts, events, eventCategories, rsvpLog,
+  likesLog, inviteLog, plus search/lookup indexes.
+- Tracks the applied version in `PRAGMA user_version`, so existing
+  databases are upgraded in place instead of being dropped and recreated.
+- Provides a query-plan check that every public hot-path query is served
+  by an index (no full table scans).
 
 What Changed:
 - Added stricter constraints:
@@ -20,13 +25,46 @@ What Changed:
 - Foreign keys link accounts to events and logs.
 - RSVP, likes, and invite logs implemented as join tables.
 - Number of likes stored directly in `events` (denormalized for faster access).
-- Extended comments and dev notes for clarity.
-- Built-in DROP statements for dev convenience (remove/comment in production).
+- Added eventsSearch (FTS5 full-text index over eventName, eventDescription,
+  location) kept in sync with `events` by triggers.
+- Replaced the drop-and-recreate script with MIGRATIONS + migrate().
+  Each migration runs in one transaction and bumps user_version.
+- Migration 3 adds secondary indexes for the lookup paths
+  (user → likes/RSVPs/invites, active events by date, events by creator).
+- The shared connection pool runs migrate() once per process, so code
+  always sees the latest schema.
+- Migration 4 moves event images out of the events row into imageStore
+  (content-addressed by SHA-256, deduplicated); events keep imageHash.
+- Migration 5 keeps events.numberLikes / events.rsvpCount in step with the
+  logs via triggers (numberLikes used to stay at 0).
+- Migration 6 adds eventsCalendar (R*Tree over each event's start/end
+  span) for the calendar view's overlap queries.
+- Migration 7 rebuilds events and the log/category tables with
+  ON DELETE CASCADE; connections enforce foreign keys, so deleting an
+  event (or account) removes its dependent rows in one statement.
+- Migration 8 timestamps likes and RSVPs (createdAt) for trending scores.
+- Migration 9 timestamps invites and indexes each user's invite inbox.
+- Migration 10 indexes verified accounts by lower(email) for prefix search.
+- Migration 11 makes eventCategories the full category set of each event
+  (eventType mirrored by triggers) and indexes it by (category, eventID).
+- Migration 12 adds engagementLog, an append-only like/RSVP feed with a
+  never-reused AUTOINCREMENT key, for trending's incremental reads.
+- Migration 13 flags user-picked categories (isExplicit) so an eventType
+  change only drops the old primary category if it was not also picked.
+- Migration 14 records unlikes/cancelled RSVPs in engagementLog as
+  retractions (delta = -1) and prunes entries past the retention horizon.
+
+How To Add A Migration:
+- Append (next_version, "short name", SQL script or function(conn)) to
+  MIGRATIONS. Never edit a migration that has already shipped.
+- If it adds a public query, add that query to PUBLIC_QUERIES as well.
 
 Frontend Use:
 - This file is not called directly by the frontend.
-- Used during setup/reset to prepare a clean database for testing.
-- Must be run before backend CRUD functions or integration tests.
+- Run it before backend CRUD functions or integration tests:
+    python backend/db/currentDB.py           → upgrade to latest schema
+    python backend/db/currentDB.py --reset   → wipe + rebuild (dev only!)
+    python backend/db/currentDB.py --check   → verify query plans use indexes
 - Frontend depends on the schema defined here: 
   - Accounts handle login/verification.
   - Events populate listings and detail pages.
@@ -38,24 +76,15 @@ BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 DB_PATH = os.path.join(BASE_DIR, "EventPlannerDB.db")
 
 
-sqliteConnection = sqlite3.connect(DB_PATH)
-cursor = sqliteConnection.cursor()
-
-# Drop old tables if they exist (for clean re-runs during development, running this will create a "fresh" database for testing, delete or comment in production)
-cursor.execute("DROP TABLE IF EXISTS likesLog;")
-cursor.execute("DROP TABLE IF EXISTS rsvpLog;")
-cursor.execute("DROP TABLE IF EXISTS inviteLog;")
-cursor.execute("DROP TABLE IF EXISTS eventCategories;")
-cursor.execute("DROP TABLE IF EXISTS events;")
-cursor.execute("DROP TABLE IF EXISTS accounts;")
-
-sql_command = """
-
+# =========================================================
+# MIGRATION 1: BASE SCHEMA
+# =========================================================
+BASE_SCHEMA = """
 -- =============================
 -- ACCOUNTS TABLE
 -- Stores user login data and verification codes
 -- =============================
-CREATE TABLE accounts (
+CREATE TABLE IF NOT EXISTS accounts (
     accountID INTEGER PRIMARY KEY,
     accountType TEXT CHECK(accountType IN ('Student','Faculty')),
     email TEXT UNIQUE NOT NULL,  -- acts as username
@@ -70,7 +99,7 @@ CREATE TABLE accounts (
 -- EVENTS TABLE
 -- Stores all event details
 -- =============================
-CREATE TABLE events (
+CREATE TABLE IF NOT EXISTS events (
     eventID INTEGER NOT NULL PRIMARY KEY,
     creatorID INTEGER NOT NULL,
     eventName TEXT NOT NULL,
@@ -100,7 +129,7 @@ CREATE TABLE events (
 -- EVENT CATEGORIES JOIN TABLE
 -- Allows multiple categories per event
 -- =============================
-CREATE TABLE eventCategories (
+CREATE TABLE IF NOT EXISTS eventCategories (
     eventID INTEGER NOT NULL,
     category TEXT NOT NULL,
     PRIMARY KEY (eventID, category),
@@ -111,7 +140,7 @@ CREATE TABLE eventCategories (
 -- RSVP LOG
 -- Tracks which users RSVPed to which events
 -- =============================
-CREATE TABLE rsvpLog (
+CREATE TABLE IF NOT EXISTS rsvpLog (
     eventID INTEGER NOT NULL,
     accountID INTEGER NOT NULL,
     PRIMARY KEY (eventID, accountID),
@@ -123,7 +152,7 @@ CREATE TABLE rsvpLog (
 -- LIKES LOG
 -- Tracks which users liked which events
 -- =============================
-CREATE TABLE likesLog (
+CREATE TABLE IF NOT EXISTS likesLog (
     eventID INTEGER NOT NULL,
     accountID INTEGER NOT NULL,
     PRIMARY KEY (eventID, accountID),
@@ -135,7 +164,7 @@ CREATE TABLE likesLog (
 -- INVITE LOG
 -- Tracks invitations (which user was invited to which event)
 -- =============================
-CREATE TABLE inviteLog (
+CREATE TABLE IF NOT EXISTS inviteLog (
     eventID INTEGER NOT NULL,
     accountID INTEGER NOT NULL,
     PRIMARY KEY (eventID, accountID),
@@ -144,9 +173,697 @@ CREATE TABLE inviteLog (
 );
 """
 
-cursor.executescript(sql_command)
+# =========================================================
+# MIGRATION 2: EVENTS FULL-TEXT SEARCH
+# =========================================================
+EVENTS_SEARCH = """
+-- =============================
+-- EVENTS FULL-TEXT SEARCH (FTS5)
+-- External-content index over events; rowid = eventID.
+-- Triggers below keep it in sync on insert/update/delete.
+-- =============================
+CREATE VIRTUAL TABLE IF NOT EXISTS eventsSearch USING fts5(
+    eventName, eventDescription, location,
+    content='events', content_rowid='eventID',
+    tokenize='unicode61 remove_diacritics 2',
+    prefix='2 3'
+);
+
+CREATE TRIGGER IF NOT EXISTS events_search_ai AFTER INSERT ON events BEGIN
+    INSERT INTO eventsSearch(rowid, eventName, eventDescription, location)
+    VALUES (new.eventID, new.eventName, new.eventDescription, new.location);
+END;
+
+CREATE TRIGGER IF NOT EXISTS events_search_ad AFTER DELETE ON events BEGIN
+    INSERT INTO eventsSearch(eventsSearch, rowid, eventName, eventDescription, location)
+    VALUES ('delete', old.eventID, old.eventName, old.eventDescription, old.location);
+END;
+
+CREATE TRIGGER IF NOT EXISTS events_search_au AFTER UPDATE OF eventName, eventDescription, location ON events BEGIN
+    INSERT INTO eventsSearch(eventsSearch, rowid, eventName, eventDescription, location)
+    VALUES ('delete', old.eventID, old.eventName, old.eventDescription, old.location);
+    INSERT INTO eventsSearch(rowid, eventName, eventDescription, location)
+    VALUES (new.eventID, new.eventName, new.eventDescription, new.location);
+END;
+
+-- Backfill rows that existed before the index did
+INSERT INTO eventsSearch(eventsSearch) VALUES ('rebuild');
+"""
+
+# =========================================================
+# MIGRATION 3: LOOKUP INDEXES
+# =========================================================
+LOOKUP_INDEXES = """
+-- user → liked / RSVP'd / invited events (PKs are (eventID, accountID),
+-- which only helps event → users lookups)
+CREATE INDEX IF NOT EXISTS idx_likesLog_account   ON likesLog  (accountID, eventID);
+CREATE INDEX IF NOT EXISTS idx_rsvpLog_account    ON rsvpLog   (accountID, eventID);
+CREATE INDEX IF NOT EXISTS idx_inviteLog_account  ON inviteLog (accountID, eventID);
+
+-- active listing: eventAccess IN ('Public','Private') ORDER BY startDateTime
+CREATE INDEX IF NOT EXISTS idx_events_access_start ON events (eventAccess, startDateTime);
+
+-- chronological listing / keyset pagination on (startDateTime, eventID)
+CREATE INDEX IF NOT EXISTS idx_events_start        ON events (startDateTime, eventID);
+
+-- "My Events" / creator lookups
+CREATE INDEX IF NOT EXISTS idx_events_creator      ON events (creatorID, startDateTime);
+"""
+
+
+# =========================================================
+# MIGRATION 4: CONTENT-ADDRESSED IMAGE STORE
+# Moves events.images BLOBs into imageStore (keyed by SHA-256, so
+# identical images are stored once) and leaves events.imageHash as the
+# reference. Listing queries no longer drag image bytes along.
+# =========================================================
+IMAGE_STORE = """
+CREATE TABLE IF NOT EXISTS imageStore (
+    imageHash TEXT PRIMARY KEY,  -- sha256 hex digest of data
+    byteSize INTEGER NOT NULL,
+    data BLOB NOT NULL
+);
+
+ALTER TABLE events ADD COLUMN imageHash TEXT REFERENCES imageStore(imageHash);
+
+INSERT OR IGNORE INTO imageStore (imageHash, byteSize, data)
+SELECT sha256(images), length(CAST(images AS BLOB)), CAST(images AS BLOB)
+FROM events WHERE images IS NOT NULL;
+
+UPDATE events SET imageHash = sha256(images) WHERE images IS NOT NULL;
+
+ALTER TABLE events DROP COLUMN images;
+
+CREATE INDEX IF NOT EXISTS idx_events_image ON events (imageHash);
+"""
+
+
+def _sha256_hex(data) -> str | None:
+    """SQL function sha256(x) used by the image store migration."""
+    if data is None:
+        return None
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return hashlib.sha256(data).hexdigest()
+
+
+def _migrate_image_store(conn: sqlite3.Connection):
+    conn.create_function("sha256", 1, _sha256_hex, deterministic=True)
+    for statement in _split_statements(IMAGE_STORE):
+        conn.execute(statement)
+
+
+# =========================================================
+# MIGRATION 5: LIKE / RSVP COUNTERS
+# numberLikes and rsvpCount are maintained by triggers on the log tables,
+# so every writer (single, bulk, cascade cleanup) updates them in the same
+# transaction as the log row. Backfilled from the logs once here.
+# =========================================================
+ENGAGEMENT_COUNTERS = """
+ALTER TABLE events ADD COLUMN rsvpCount INTEGER DEFAULT 0;
+
+CREATE TRIGGER IF NOT EXISTS likes_count_ai AFTER INSERT ON likesLog BEGIN
+    UPDATE events SET numberLikes = numberLikes + 1 WHERE eventID = new.eventID;
+END;
+
+CREATE TRIGGER IF NOT EXISTS likes_count_ad AFTER DELETE ON likesLog BEGIN
+    UPDATE events SET numberLikes = numberLikes - 1 WHERE eventID = old.eventID;
+END;
+
+CREATE TRIGGER IF NOT EXISTS rsvp_count_ai AFTER INSERT ON rsvpLog BEGIN
+    UPDATE events SET rsvpCount = rsvpCount + 1 WHERE eventID = new.eventID;
+END;
+
+CREATE TRIGGER IF NOT EXISTS rsvp_count_ad AFTER DELETE ON rsvpLog BEGIN
+    UPDATE events SET rsvpCount = rsvpCount - 1 WHERE eventID = old.eventID;
+END;
+
+UPDATE events SET
+    numberLikes = (SELECT COUNT(*) FROM likesLog l WHERE l.eventID = events.eventID),
+    rsvpCount   = (SELECT COUNT(*) FROM rsvpLog  r WHERE r.eventID = events.eventID);
+
+-- popularity listings: walk events from most liked/RSVP'd down, stop at LIMIT
+CREATE INDEX IF NOT EXISTS idx_events_likes ON events (numberLikes DESC, eventID);
+CREATE INDEX IF NOT EXISTS idx_events_rsvps ON events (rsvpCount DESC, eventID);
+"""
+
+
+# =========================================================
+# MIGRATION 6: CALENDAR INTERVAL INDEX
+# R*Tree over each event's [start, end] span in minutes since 1970, so
+# "events overlapping this day/month" is an index range query that also
+# finds multi-day events starting before the window. Kept in sync by
+# triggers; bounds are rounded outwards (start down, end up) and callers
+# re-check the exact strings.
+# =========================================================
+CALENDAR_INDEX = """
+CREATE VIRTUAL TABLE IF NOT EXISTS eventsCalendar USING rtree_i32(
+    eventID,
+    startMinute, endMinute
+);
+
+CREATE TRIGGER IF NOT EXISTS events_calendar_ai AFTER INSERT ON events BEGIN
+    INSERT INTO eventsCalendar (eventID, startMinute, endMinute)
+    VALUES (new.eventID,
+            CAST(strftime('%s', new.startDateTime) AS INTEGER) / 60,
+            (MAX(CAST(strftime('%s', new.endDateTime) AS INTEGER),
+                 CAST(strftime('%s', new.startDateTime) AS INTEGER)) + 59) / 60);
+END;
+
+CREATE TRIGGER IF NOT EXISTS events_calendar_ad AFTER DELETE ON events BEGIN
+    DELETE FROM eventsCalendar WHERE eventID = old.eventID;
+END;
+
+CREATE TRIGGER IF NOT EXISTS events_calendar_au AFTER UPDATE OF startDateTime, endDateTime ON events BEGIN
+    UPDATE eventsCalendar SET
+        startMinute = CAST(strftime('%s', new.startDateTime) AS INTEGER) / 60,
+        endMinute = (MAX(CAST(strftime('%s', new.endDateTime) AS INTEGER),
+                         CAST(strftime('%s', new.startDateTime) AS INTEGER)) + 59) / 60
+    WHERE eventID = new.eventID;
+END;
+
+INSERT OR REPLACE INTO eventsCalendar (eventID, startMinute, endMinute)
+SELECT eventID,
+       CAST(strftime('%s', startDateTime) AS INTEGER) / 60,
+       (MAX(CAST(strftime('%s', endDateTime) AS INTEGER),
+            CAST(strftime('%s', startDateTime) AS INTEGER)) + 59) / 60
+FROM events;
+"""
+
+
+# =========================================================
+# MIGRATION 7: ON DELETE CASCADE + ENFORCED FOREIGN KEYS
+# SQLite cannot ALTER a constraint, so every table holding a foreign key
+# is rebuilt (create new → copy → drop old → rename) with ON DELETE
+# CASCADE. Deleting an event then removes its categories, likes, RSVPs
+# and invites in the same statement; deleting an account removes its
+# events and log rows. The connection pool turns PRAGMA foreign_keys on.
+# Runs with foreign_keys off (see migrate()) so dropping the old tables
+# does not cascade into the rebuilt ones.
+# =========================================================
+CASCADE_TABLES = {
+    "events": """
+CREATE TABLE new_events (
+    eventID INTEGER NOT NULL PRIMARY KEY,
+    creatorID INTEGER NOT NULL,
+    eventName TEXT NOT NULL,
+    eventType TEXT CHECK(eventType IN (
+        'Art', 'Math', 'Science', 'Computer Science', 'History',
+        'Education', 'Political Science', 'Software Engineering',
+        'Business', 'Sports', 'Honors', 'Workshops',
+        'Study Session', 'Dissertation', 'Performance', 'Competition'
+    )),
+    eventDescription TEXT NOT NULL,
+    location TEXT NOT NULL,
+    eventAccess TEXT CHECK(eventAccess IN ('Public','Private','Inactive')),
+
+    startDateTime TEXT NOT NULL,  -- must use ISO format: YYYY-MM-DD HH:MM:SS
+    endDateTime TEXT NOT NULL,
+    numberLikes INTEGER DEFAULT 0,
+
+    rsvpRequired BOOLEAN DEFAULT 0,
+    isPriced BOOLEAN DEFAULT 0,
+    cost REAL,
+    imageHash TEXT REFERENCES imageStore(imageHash),  -- images are released explicitly
+    rsvpCount INTEGER DEFAULT 0,
+
+    FOREIGN KEY (creatorID) REFERENCES accounts(accountID) ON DELETE CASCADE
+)""",
+    "eventCategories": """
+CREATE TABLE new_eventCategories (
+    eventID INTEGER NOT NULL,
+    category TEXT NOT NULL,
+    PRIMARY KEY (eventID, category),
+    FOREIGN KEY (eventID) REFERENCES events(eventID) ON DELETE CASCADE
+)""",
+}
+for _log in ("rsvpLog", "likesLog", "inviteLog"):
+    CASCADE_TABLES[_log] = f"""
+CREATE TABLE new_{_log} (
+    eventID INTEGER NOT NULL,
+    accountID INTEGER NOT NULL,
+    PRIMARY KEY (eventID, accountID),
+    FOREIGN KEY (eventID) REFERENCES events(eventID) ON DELETE CASCADE,
+    FOREIGN KEY (accountID) REFERENCES accounts(accountID) ON DELETE CASCADE
+)"""
+
+
+def _migrate_cascades(conn: sqlite3.Connection):
+    tables = list(CASCADE_TABLES)
+    marks = ", ".join("?" * len(tables))
+
+    # Indexes/triggers are dropped with their table: keep their SQL to recreate them
+    dependents = conn.execute(f"""
+        SELECT type, name, sql FROM sqlite_master
+        WHERE type IN ('index', 'trigger') AND tbl_name IN ({marks}) AND sql IS NOT NULL
+    """, tables).fetchall()
+    for kind, name, _ in dependents:
+        if kind == "trigger":  # triggers on events/logs reference each other; drop them before any rename
+            conn.execute(f"DROP TRIGGER {name}")
+
+    # Rows pointing at deleted events/accounts were invisible already; they
+    # would block enforcement, so drop them
+    for log in ("rsvpLog", "likesLog", "inviteLog"):
+        conn.execute(f"""
+            DELETE FROM {log}
+            WHERE eventID NOT IN (SELECT eventID FROM events)
+               OR accountID NOT IN (SELECT accountID FROM accounts)
+        """)
+    conn.execute("DELETE FROM eventCategories WHERE eventID NOT IN (SELECT eventID FROM events)")
+
+    for table, create in CASCADE_TABLES.items():
+        columns = ", ".join(row[1] for row in conn.execute(f"PRAGMA table_info({table})"))
+        conn.execute(create)
+        conn.execute(f"INSERT INTO new_{table} ({columns}) SELECT {columns} FROM {table}")
+        conn.execute(f"DROP TABLE {table}")
+        conn.execute(f"ALTER TABLE new_{table} RENAME TO {table}")
+
+    for _, _, sql in dependents:
+        conn.execute(sql)
+
+
+
+# =========================================================
+# MIGRATION 8: LIKE / RSVP TIMESTAMPS
+# Writers fill createdAt (local 'YYYY-MM-DD HH:MM:SS', like the other
+# datetimes); rows from before this migration stay NULL (time unknown).
+# Feeds the time-decayed trending scores in events/trending.py.
+# =========================================================
+ENGAGEMENT_TIMESTAMPS = """
+ALTER TABLE likesLog ADD COLUMN createdAt TEXT;
+ALTER TABLE rsvpLog  ADD COLUMN createdAt TEXT;
+"""
+
+
+
+# =========================================================
+# MIGRATION 9: INVITE INBOX
+# inviteLog.createdAt orders a user's inbox newest first; invites from
+# before this migration get '' (time unknown, listed last). The index
+# serves "invites for account X, newest first, after this page" directly.
+# =========================================================
+INVITE_INBOX = """
+ALTER TABLE inviteLog ADD COLUMN createdAt TEXT NOT NULL DEFAULT '';
+
+CREATE INDEX IF NOT EXISTS idx_inviteLog_inbox ON inviteLog (accountID, createdAt, eventID);
+"""
+
+
+
+# =========================================================
+# MIGRATION 10: ACCOUNT EMAIL PREFIX INDEX
+# Partial expression index for invite autocomplete: only verified
+# accounts, keyed by lowercased email, so a prefix is one range read.
+# =========================================================
+ACCOUNT_SEARCH = """
+CREATE INDEX IF NOT EXISTS idx_accounts_email_lower ON accounts (lower(email)) WHERE isVerified = 1;
+"""
+
+
+# =========================================================
+# MIGRATION 11: MULTI-CATEGORY EVENTS
+# eventCategories becomes the full category set of every event: the
+# primary eventType is mirrored into it by triggers (so every writer,
+# imports included, keeps it in step) and extra categories are written by
+# create_event / update_event. Indexed by (category, eventID) so
+# "events in category X" is a range read. Backfilled from eventType.
+# =========================================================
+EVENT_CATEGORIES = """
+CREATE INDEX IF NOT EXISTS idx_eventCategories_category ON eventCategories (category, eventID);
+
+INSERT INTO eventCategories (eventID, category)
+SELECT eventID, eventType FROM events WHERE eventType IS NOT NULL
+ON CONFLICT (eventID, category) DO NOTHING;
+
+CREATE TRIGGER IF NOT EXISTS event_categories_ai AFTER INSERT ON events
+WHEN new.eventType IS NOT NULL BEGIN
+    INSERT OR IGNORE INTO eventCategories (eventID, category) VALUES (new.eventID, new.eventType);
+END;
+
+CREATE TRIGGER IF NOT EXISTS event_categories_au AFTER UPDATE OF eventType ON events BEGIN
+    DELETE FROM eventCategories WHERE eventID = old.eventID AND category IS old.eventType;
+    INSERT OR IGNORE INTO eventCategories (eventID, category)
+    SELECT new.eventID, new.eventType WHERE new.eventType IS NOT NULL;
+END;
+"""
+
+
+# =========================================================
+# MIGRATION 12: ENGAGEMENT ACTIVITY FEED
+# Append-only copy of every like/RSVP insert, keyed by an AUTOINCREMENT
+# seq. likesLog/rsvpLog rowids are reused when the newest row is deleted
+# (unlike / cancelled RSVP), so "rowid > watermark" can miss new activity;
+# seq never goes backwards. Filled by triggers, so every writer feeds it;
+# events/trending.py reads it. Backfilled from the timed log rows.
+# =========================================================
+ENGAGEMENT_ACTIVITY = """
+CREATE TABLE IF NOT EXISTS engagementLog (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    eventID INTEGER NOT NULL,
+    kind TEXT NOT NULL CHECK(kind IN ('like', 'rsvp')),
+    createdAt TEXT NOT NULL,
+    FOREIGN KEY (eventID) REFERENCES events(eventID) ON DELETE CASCADE
+);
+CREATE INDEX IF NOT EXISTS idx_engagementLog_event ON engagementLog (eventID);
+
+INSERT INTO engagementLog (eventID, kind, createdAt)
+SELECT eventID, kind, createdAt FROM (
+    SELECT eventID, 'like' AS kind, createdAt FROM likesLog WHERE createdAt IS NOT NULL
+    UNION ALL
+    SELECT eventID, 'rsvp' AS kind, createdAt FROM rsvpLog WHERE createdAt IS NOT NULL
+) ORDER BY createdAt;
+
+CREATE TRIGGER IF NOT EXISTS likes_activity_ai AFTER INSERT ON likesLog
+WHEN new.createdAt IS NOT NULL BEGIN
+    INSERT INTO engagementLog (eventID, kind, createdAt) VALUES (new.eventID, 'like', new.createdAt);
+END;
+
+CREATE TRIGGER IF NOT EXISTS rsvp_activity_ai AFTER INSERT ON rsvpLog
+WHEN new.createdAt IS NOT NULL BEGIN
+    INSERT INTO engagementLog (eventID, kind, createdAt) VALUES (new.eventID, 'rsvp', new.createdAt);
+END;
+"""
+
+
+# =========================================================
+# MIGRATION 13: EXPLICIT EVENT CATEGORIES
+# eventCategories.isExplicit = 1 marks categories the user picked
+# (create_event / update_event "categories"); the mirrored eventType row
+# is 0 unless it was picked too. Changing eventType now only removes the
+# old primary row if it was not also picked, so a chosen category is never
+# lost to an eventType edit. Existing non-primary rows were picked.
+# =========================================================
+EXPLICIT_CATEGORIES = """
+ALTER TABLE eventCategories ADD COLUMN isExplicit INTEGER NOT NULL DEFAULT 0;
+
+UPDATE eventCategories SET isExplicit = 1
+WHERE category IS NOT (SELECT eventType FROM events e WHERE e.eventID = eventCategories.eventID);
+
+DROP TRIGGER IF EXISTS event_categories_au;
+CREATE TRIGGER event_categories_au AFTER UPDATE OF eventType ON events BEGIN
+    DELETE FROM eventCategories
+    WHERE eventID = old.eventID AND category IS old.eventType AND isExplicit = 0;
+    INSERT OR IGNORE INTO eventCategories (eventID, category)
+    SELECT new.eventID, new.eventType WHERE new.eventType IS NOT NULL;
+END;
+"""
+
+
+# =========================================================
+# MIGRATION 14: ENGAGEMENT RETRACTIONS + RETENTION
+# Unlikes / cancelled RSVPs append a delta = -1 entry carrying the removed
+# row's createdAt, so readers cancel exactly the weight that row added
+# (toggling can no longer pump an event up trending). Entries older than
+# ENGAGEMENT_RETENTION_DAYS (10 week-long half-lives, i.e. < 1/1000 of
+# their weight left) are pruned on insert, so the feed stays bounded.
+# Deletes cascading from a deleted event add nothing (the event is gone).
+# =========================================================
+ENGAGEMENT_RETENTION_DAYS = 70
+
+ENGAGEMENT_RETRACTIONS = f"""
+ALTER TABLE engagementLog ADD COLUMN delta INTEGER NOT NULL DEFAULT 1;
+CREATE INDEX IF NOT EXISTS idx_engagementLog_created ON engagementLog (createdAt);
+
+DELETE FROM engagementLog WHERE createdAt < datetime('now', 'localtime', '-{ENGAGEMENT_RETENTION_DAYS} days');
+
+CREATE TRIGGER IF NOT EXISTS likes_activity_ad AFTER DELETE ON likesLog
+WHEN old.createdAt >= datetime('now', 'localtime', '-{ENGAGEMENT_RETENTION_DAYS} days')
+ AND EXISTS (SELECT 1 FROM events WHERE eventID = old.eventID) BEGIN
+    INSERT INTO engagementLog (eventID, kind, createdAt, delta) VALUES (old.eventID, 'like', old.createdAt, -1);
+END;
+
+CREATE TRIGGER IF NOT EXISTS rsvp_activity_ad AFTER DELETE ON rsvpLog
+WHEN old.createdAt >= datetime('now', 'localtime', '-{ENGAGEMENT_RETENTION_DAYS} days')
+ AND EXISTS (SELECT 1 FROM events WHERE eventID = old.eventID) BEGIN
+    INSERT INTO engagementLog (eventID, kind, createdAt, delta) VALUES (old.eventID, 'rsvp', old.createdAt, -1);
+END;
+
+CREATE TRIGGER IF NOT EXISTS engagement_retention_ai AFTER INSERT ON engagementLog BEGIN
+    DELETE FROM engagementLog
+    WHERE createdAt < datetime('now', 'localtime', '-{ENGAGEMENT_RETENTION_DAYS} days');
+END;
+"""
+
+
+# -----------------------------
+# MIGRATION REGISTRY
+# (version, name, SQL script or callable(conn))
+# -----------------------------
+MIGRATIONS = [
+    (1, "base schema", BASE_SCHEMA),
+    (2, "events full-text search", EVENTS_SEARCH),
+    (3, "lookup indexes", LOOKUP_INDEXES),
+    (4, "content-addressed image store", _migrate_image_store),
+    (5, "like/rsvp counters", ENGAGEMENT_COUNTERS),
+    (6, "calendar interval index", CALENDAR_INDEX),
+    (7, "foreign key cascades", _migrate_cascades),
+    (8, "like/rsvp timestamps", ENGAGEMENT_TIMESTAMPS),
+    (9, "invite inbox", INVITE_INBOX),
+    (10, "account email prefix index", ACCOUNT_SEARCH),
+    (11, "multi-category events", EVENT_CATEGORIES),
+    (12, "engagement activity feed", ENGAGEMENT_ACTIVITY),
+    (13, "explicit event categories", EXPLICIT_CATEGORIES),
+    (14, "engagement retractions + retention", ENGAGEMENT_RETRACTIONS),
+]
+
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+# Every table/virtual table the app owns, children first (used by reset)
+ALL_TABLES = ["eventsSearch", "eventsCalendar", "engagementLog", "likesLog", "rsvpLog", "inviteLog", "eventCategories", "events", "imageStore", "accounts"]
+
+
+def _split_statements(script: str) -> list[str]:
+    """
+    Split a SQL script into single statements.
+    Uses sqlite3.complete_statement so trigger bodies (BEGIN ... END;)
+    stay in one piece.
+    """
+    statements, current = [], ""
+    for line in script.splitlines(keepends=True):
+        current += line
+        if sqlite3.complete_statement(current):
+            if current.strip():
+                statements.append(current.strip())
+            current = ""
+    leftover = "\n".join(l for l in current.splitlines() if not l.strip().startswith("--")).strip()
+    if leftover:
+        raise ValueError(f"Incomplete SQL statement in migration: {leftover[:80]}")
+    return statements
+
+
+def schema_version(conn: sqlite3.Connection) -> int:
+    """Return the migration version this DB is at (0 = never migrated)."""
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def migrate(conn: sqlite3.Connection, target: int | None = None) -> list[int]:
+    """
+    Apply every migration newer than the DB's user_version (up to `target`).
+    - Each migration runs in its own BEGIN IMMEDIATE transaction, so a
+      failure leaves the DB at the previous version.
+    - The version is re-read after taking the write lock, so two processes
+      starting at once do not apply the same migration twice.
+    - Foreign keys are off while migrating (table rebuilds must not cascade)
+      and restored afterwards; the PRAGMA is a no-op inside a transaction.
+    Returns the list of versions applied.
+    """
+    target = LATEST_VERSION if target is None else target
+    applied = []
+    if conn.in_transaction:
+        conn.commit()
+    foreign_keys = conn.execute("PRAGMA foreign_keys").fetchone()[0]
+    conn.execute("PRAGMA foreign_keys = OFF")
+    try:
+        applied = _apply(conn, target)
+    finally:
+        if foreign_keys:
+            conn.execute("PRAGMA foreign_keys = ON")
+    return applied
+
+
+def _apply(conn: sqlite3.Connection, target: int) -> list[int]:
+    applied = []
+    for version, name, step in MIGRATIONS:
+        if version > target or version <= schema_version(conn):
+            continue
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if schema_version(conn) >= version:  # another process got here first
+                conn.rollback()
+                continue
+            if callable(step):
+                step(conn)
+            else:
+                for statement in _split_statements(step):
+                    conn.execute(statement)
+            conn.execute(f"PRAGMA user_version = {int(version)}")
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        applied.append(version)
+    return applied
+
+
+def reset(conn: sqlite3.Connection):
+    """
+    Drop every table and rebuild from migration 1.
+    DEV ONLY: this wipes all data.
+    """
+    if conn.in_transaction:
+        conn.commit()
+    foreign_keys = conn.execute("PRAGMA foreign_keys").fetchone()[0]
+    conn.execute("PRAGMA foreign_keys = OFF")  # drop parents without cascading
+    for table in ALL_TABLES:
+        conn.execute(f"DROP TABLE IF EXISTS {table}")
+    conn.execute("PRAGMA user_version = 0")
+    conn.commit()
+    if foreign_keys:
+        conn.execute("PRAGMA foreign_keys = ON")
+    return migrate(conn)
+
+
+# =========================================================
+# QUERY PLAN CHECK
+# Public hot-path queries (kept in sync with the backend modules).
+# Each must be answered through an index, never a full table scan.
+# =========================================================
+PUBLIC_QUERIES = {
+    # events/read.py
+    "read_events": "SELECT * FROM events WHERE eventAccess IN ('Public','Private') ORDER BY startDateTime ASC",
+    "read_event_by_id": "SELECT * FROM events WHERE eventID = ? AND eventAccess IN ('Public','Private')",
+    "read_event_field": "SELECT eventName FROM events WHERE eventID = ? AND eventAccess IN ('Public','Private')",
+    "read_popular_events": (
+        "SELECT * FROM events WHERE +eventAccess IN ('Public','Private') "
+        "ORDER BY numberLikes DESC, eventID ASC LIMIT ?"
+    ),
+    "read_events_by_creator": "SELECT * FROM events WHERE creatorID = ? ORDER BY startDateTime ASC",
+    # events/update.py, hard_delete.py
+    "event_creator": "SELECT creatorID, imageHash FROM events WHERE eventID = ?",
+    # UserAccounts/authorization.py
+    "account_type": "SELECT accountType FROM accounts WHERE accountID = ?",
+    "event_creators": "SELECT eventID, creatorID FROM events WHERE eventID IN (SELECT value FROM json_each(?))",
+    # UserAccounts/userAccount.py
+    "login": "SELECT accountID, password, isVerified FROM accounts WHERE email = ?",
+    "search_accounts": (
+        "SELECT accountID, accountType, email FROM accounts "
+        "WHERE lower(email) >= ? AND lower(email) < ? AND isVerified = 1 ORDER BY lower(email) LIMIT ?"
+    ),
+    # liking_log/liking_log.py
+    "has_liked": "SELECT 1 FROM likesLog WHERE accountID=? AND eventID=? LIMIT 1",
+    "get_event_likes": "SELECT accountID FROM likesLog WHERE eventID=?",
+    "get_user_likes": "SELECT eventID FROM likesLog WHERE accountID=?",
+    "like_count": "SELECT numberLikes FROM events WHERE eventID = ?",
+    # rsvp/rsvp.py
+    "has_rsvp": "SELECT 1 FROM rsvpLog WHERE accountID=? AND eventID=? LIMIT 1",
+    "get_event_rsvps": "SELECT accountID FROM rsvpLog WHERE eventID=?",
+    "get_user_rsvps": "SELECT eventID FROM rsvpLog WHERE accountID=?",
+    # images/image_store.py
+    "image_lookup": "SELECT rowid FROM imageStore WHERE imageHash = ?",
+    "image_in_use": "SELECT 1 FROM events WHERE imageHash = ?",
+    # bulk helpers (liking_log / rsvp / invites)
+    "has_liked_many": "SELECT eventID FROM likesLog WHERE accountID = ? AND eventID IN (SELECT value FROM json_each(?))",
+    "get_event_likes_many": "SELECT eventID, accountID FROM likesLog WHERE eventID IN (SELECT value FROM json_each(?))",
+    "has_rsvp_many": "SELECT eventID FROM rsvpLog WHERE accountID = ? AND eventID IN (SELECT value FROM json_each(?))",
+    "get_event_rsvps_many": "SELECT eventID, accountID FROM rsvpLog WHERE eventID IN (SELECT value FROM json_each(?))",
+    "get_user_invites": "SELECT eventID FROM inviteLog WHERE accountID=?",
+    "has_invite": "SELECT 1 FROM inviteLog WHERE accountID=? AND eventID=? LIMIT 1",
+    "invite_inbox": (
+        "SELECT i.createdAt AS invitedAt, e.eventID FROM inviteLog i JOIN events e ON e.eventID = i.eventID "
+        "WHERE i.accountID = ? AND (i.createdAt, i.eventID) < (?, ?) AND e.eventAccess IN ('Public','Private') "
+        "ORDER BY i.createdAt DESC, i.eventID DESC LIMIT ?"
+    ),
+    "has_invite_many": "SELECT eventID FROM inviteLog WHERE accountID = ? AND eventID IN (SELECT value FROM json_each(?))",
+    # searching_logic/query_builder.py (next page of the default listing)
+    "query_events_page": (
+        "SELECT * FROM events WHERE eventAccess IN ('Public','Private') "
+        "AND (startDateTime, eventID) > (?, ?) ORDER BY startDateTime ASC, eventID ASC LIMIT ?"
+    ),
+    # events/categories.py
+    "get_event_categories": "SELECT category FROM eventCategories WHERE eventID = ?",
+    "events_in_categories": (
+        "SELECT DISTINCT eventID FROM eventCategories "
+        "WHERE category IN (SELECT value FROM json_each(?)) ORDER BY eventID"
+    ),
+    # events/calendar_view.py
+    "events_between": (
+        "SELECT e.* FROM eventsCalendar c CROSS JOIN events e ON e.eventID = c.eventID "
+        "WHERE c.startMinute < ? AND c.endMinute >= ? "
+        "AND e.startDateTime < ? AND (e.endDateTime > ? OR e.startDateTime >= ?) "
+        "AND e.eventAccess IN ('Public','Private') ORDER BY e.startDateTime, e.eventID"
+    ),
+    # recommendations/recommendations.py (rowid watermarks)
+    "new_likes": "SELECT rowid, accountID, eventID FROM likesLog WHERE rowid > ? ORDER BY rowid",
+    "new_rsvps": "SELECT rowid, accountID, eventID FROM rsvpLog WHERE rowid > ? ORDER BY rowid",
+    # events/trending.py
+    "new_engagement": "SELECT seq, eventID, kind, createdAt, delta FROM engagementLog WHERE seq > ? ORDER BY seq",
+    "trending_visible": (
+        "SELECT eventID FROM events WHERE eventID IN (SELECT value FROM json_each(?)) "
+        "AND eventAccess = 'Public' AND endDateTime >= ?"
+    ),
+    # searching_logic/full_text_search.py
+    "search_events": (
+        "SELECT e.eventID FROM eventsSearch JOIN events e ON e.eventID = eventsSearch.rowid "
+        "WHERE eventsSearch MATCH ? AND e.eventAccess IN ('Public','Private') "
+        "ORDER BY bm25(eventsSearch), e.eventID LIMIT ? OFFSET ?"
+    ),
+}
+
+
+def _query_plan(conn: sqlite3.Connection, sql: str) -> list[str]:
+    """EXPLAIN QUERY PLAN detail lines for `sql` (placeholders bound to dummy values)."""
+    params = ("x",) * sql.count("?")
+    return [row[3] for row in conn.execute("EXPLAIN QUERY PLAN " + sql, params)]
+
+
+def _is_full_scan(step: str) -> bool:
+    """A plan step that walks a whole table without any index."""
+    return step.startswith("SCAN ") and "USING" not in step and "VIRTUAL TABLE" not in step
+
+
+def check_query_plans(conn: sqlite3.Connection | None = None) -> dict:
+    """
+    Run EXPLAIN QUERY PLAN on every PUBLIC_QUERIES entry.
+    - With no connection, checks a fresh in-memory DB at the latest schema
+      (so small/unanalyzed dev data does not skew the planner).
+    - Raises AssertionError listing every query that falls back to a scan.
+    Returns {query name: plan lines} on success.
+    """
+    own = conn is None
+    if own:
+        conn = sqlite3.connect(":memory:")
+        migrate(conn)
+    try:
+        failures, plans = {}, {}
+        for name, sql in PUBLIC_QUERIES.items():
+            plans[name] = _query_plan(conn, sql)
+            scans = [step for step in plans[name] if _is_full_scan(step)]
+            if scans:
+                failures[name] = scans
+        assert not failures, f"Queries not using an index: {failures}"
+        return plans
+    finally:
+        if own:
+            conn.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Create/upgrade the EventPlannerDB schema.")
+    parser.add_argument("--reset", action="store_true",
+                        help="drop all tables and rebuild (wipes data, development only)")
+    parser.add_argument("--check", action="store_true",
+                        help="assert every public query uses an index")
+    args = parser.parse_args()
 
-sqliteConnection.commit()
-sqliteConnection.close()
+    sqliteConnection = sqlite3.connect(DB_PATH)
+    if args.reset:
+        versions = reset(sqliteConnection)
+    else:
+        versions = migrate(sqliteConnection)
+    print(f"Schema at version {schema_version(sqliteConnection)} (applied: {versions or 'none'})")
+    sqliteConnection.close()
 
-print("Database and tables created successfully!") # To delete once we are in production
+    if args.check:
+        for name, plan in check_query_plans().items():
+            print(f"{name}: {' | '.join(plan)}")
+        print("All public queries use an index.")
@@ -0,0 +1,77 @@
+"""
+Tests for db/currentDB.py migrations (run: python -m pytest -q).
+"""
+
+import os
+import shutil
+import sqlite3
+
+import pytest
+
+from backend.db import connection, currentDB
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "EventPlannerDB.db")
+
+
+@pytest.fixture
+def baseline(tmp_path):
+    """A copy of the checked-in development DB (user_version 0, pre-migration schema)."""
+    path = str(tmp_path / "EventPlannerDB.db")
+    shutil.copy(BASELINE, path)
+    conn = sqlite3.connect(path)
+    yield conn
+    conn.close()
+
+
+def _rows(conn, table, columns):
+    return sorted(conn.execute(f"SELECT {columns} FROM {table}").fetchall())
+
+
+def test_baseline_migrates_to_latest_and_keeps_its_data(baseline):
+    assert baseline.execute("PRAGMA user_version").fetchone()[0] == 0
+    accounts = _rows(baseline, "accounts", "accountID, email, accountType")
+    events = _rows(baseline, "events", "eventID, creatorID, eventName, eventType, startDateTime")
+    likes = _rows(baseline, "likesLog", "eventID, accountID")
+    rsvps = _rows(baseline, "rsvpLog", "eventID, accountID")
+
+    applied = currentDB.migrate(baseline)
+
+    assert applied == list(range(1, currentDB.LATEST_VERSION + 1))
+    assert currentDB.LATEST_VERSION >= 13
+    assert baseline.execute("PRAGMA user_version").fetchone()[0] == currentDB.LATEST_VERSION
+    assert _rows(baseline, "accounts", "accountID, email, accountType") == accounts
+    assert _rows(baseline, "events", "eventID, creatorID, eventName, eventType, startDateTime") == events
+    assert _rows(baseline, "likesLog", "eventID, accountID") == likes
+    assert _rows(baseline, "rsvpLog", "eventID, accountID") == rsvps
+
+    # Derived data is backfilled from the existing rows
+    assert _rows(baseline, "events", "eventID, numberLikes, rsvpCount") == [
+        (eventID,
+         sum(1 for e, _ in likes if e == eventID),
+         sum(1 for e, _ in rsvps if e == eventID))
+        for eventID, *_ in events
+    ]
+    assert _rows(baseline, "eventCategories", "eventID, category") == [(e[0], e[3]) for e in events]
+    assert baseline.execute("PRAGMA foreign_key_check").fetchall() == []
+    assert baseline.execute("PRAGMA integrity_check").fetchone()[0] == "ok"
+    currentDB.check_query_plans(baseline)
+
+    assert currentDB.migrate(baseline) == []   # already current: nothing to do
+
+
+def test_migrations_apply_one_version_at_a_time(baseline):
+    for version in range(1, currentDB.LATEST_VERSION + 1):
+        assert currentDB.migrate(baseline, target=version) == [version]
+        assert baseline.execute("PRAGMA user_version").fetchone()[0] == version
+
+
+def test_pool_migrates_on_first_connection(baseline):
+    path = baseline.execute("PRAGMA database_list").fetchone()[2]
+    previous = connection._pool.db_path
+    connection.configure(db_path=path)
+    try:
+        with connection.get_conn() as conn:
+            assert conn.execute("PRAGMA user_version").fetchone()[0] == currentDB.LATEST_VERSION
+            assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+    finally:
+        connection.configure(db_path=previous)
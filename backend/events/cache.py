@@ -0,0 +1,273 @@
+"""
+=========================================================
+EVENT CACHE (read-through cache for event reads)
+=========================================================
+
+Purpose:
+- Keeps recently read events (and the active listing) in memory so
+  read_event_by_id() / read_events() skip SQLite on repeat reads.
+- Writers (create/update/delete, likes, RSVPs) invalidate exactly the
+  events they touched, after their transaction commits.
+
+What Changed:
+- New module. Per-event entries live for EVENT_TTL seconds, listing
+  snapshots for LISTING_TTL seconds, in an LRU capped at MAX_ENTRIES.
+- Listing snapshots are keyed by a "generation" number; any write bumps
+  the generation, so every cached listing variant is dropped at once
+  without having to know their keys.
+- Storage sits behind CacheBackend, so the in-process LocalLRUBackend can
+  later be swapped (set_backend) for a client of an external cache.
+- cache_stats() reports hits, misses, evictions and expirations.
+- Reads made inside an open transaction bypass the cache: they may see
+  (or be about to see) that transaction's uncommitted writes, which must
+  never be cached in case it rolls back.
+
+Frontend Use:
+- Not called directly. Browse/detail endpoints get faster automatically;
+  counters and edits show up as soon as the write commits.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+from backend.db.connection import after_commit, in_transaction
+
+# -----------------------------
+# CACHE SETTINGS
+# -----------------------------
+EVENT_TTL = 60.0       # seconds a cached event row stays valid
+LISTING_TTL = 10.0     # seconds a cached listing snapshot stays valid
+MAX_ENTRIES = 10_000   # LRU capacity (events + listing variants)
+GENERATION_TTL = 24 * 3600.0
+
+MISSING = object()     # sentinel: "not cached" (None is a valid cached value)
+
+
+# -----------------------------
+# BACKENDS
+# -----------------------------
+class CacheBackend:
+    """
+    Storage interface for the event cache.
+    Implement these four methods to plug in another store
+    (e.g. a local stand-in for Redis/Memcached).
+    """
+
+    def get(self, key: str):
+        """Return the stored value, or MISSING if absent/expired."""
+        raise NotImplementedError
+
+    def set(self, key: str, value, ttl: float):
+        raise NotImplementedError
+
+    def delete(self, key: str):
+        raise NotImplementedError
+
+    def clear(self):
+        raise NotImplementedError
+
+    def stats(self) -> dict:
+        """Backend-specific counters (size, evictions, ...)."""
+        return {}
+
+
+class LocalLRUBackend(CacheBackend):
+    """In-process LRU dictionary with per-entry expiry. Thread-safe."""
+
+    def __init__(self, max_entries: int = MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._data = OrderedDict()  # key → (expires_at, value)
+        self._lock = threading.Lock()
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: str):
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return MISSING
+            expires_at, value = item
+            if expires_at < time.monotonic():
+                del self._data[key]
+                self.expirations += 1
+                return MISSING
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value, ttl: float):
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: str):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "size": len(self._data),
+                "max_entries": self.max_entries,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+
+class NullBackend(CacheBackend):
+    """Caches nothing (set_backend(NullBackend()) disables caching)."""
+
+    def get(self, key: str):
+        return MISSING
+
+    def set(self, key: str, value, ttl: float):
+        pass
+
+    def delete(self, key: str):
+        pass
+
+    def clear(self):
+        pass
+
+
+_backend = LocalLRUBackend()
+_stats_lock = threading.Lock()
+_hits = 0
+_misses = 0
+_epoch = 0  # bumped by every invalidation (see get_or_load)
+_epoch_lock = threading.Lock()  # guards _epoch; check-then-store is atomic with invalidation
+
+
+def set_backend(backend: CacheBackend):
+    """Swap the storage backend (drops everything cached so far)."""
+    global _backend
+    _backend = backend
+    _backend.clear()
+
+
+def get_backend() -> CacheBackend:
+    return _backend
+
+
+def cache_stats() -> dict:
+    """Hit/miss counters plus the backend's own stats."""
+    with _stats_lock:
+        stats = {"hits": _hits, "misses": _misses}
+    stats["hit_rate"] = stats["hits"] / (stats["hits"] + stats["misses"]) if stats["hits"] + stats["misses"] else 0.0
+    stats.update(_backend.stats())
+    return stats
+
+
+def _count(hit: bool):
+    global _hits, _misses
+    with _stats_lock:
+        if hit:
+            _hits += 1
+        else:
+            _misses += 1
+
+
+# -----------------------------
+# KEYS
+# -----------------------------
+def event_key(event_id: int) -> str:
+    return f"event:{event_id}"
+
+
+def _listing_generation() -> int:
+    """
+    Current listing generation = time (ns) of the last invalidation.
+    Time-based so a lost/evicted generation key never brings back a
+    generation number (and its stale listings) that was used before.
+    """
+    gen = _backend.get("listing:generation")
+    if gen is MISSING:
+        gen = time.time_ns()
+        _backend.set("listing:generation", gen, GENERATION_TTL)
+    return gen
+
+
+def listing_key(*parts) -> str:
+    """Key for one listing variant, tied to the current listing generation."""
+    return f"listing:{_listing_generation()}:" + ":".join(str(p) for p in parts)
+
+
+# -----------------------------
+# READ-THROUGH
+# -----------------------------
+def get_or_load(key: str, loader, ttl: float):
+    """
+    Return a copy of the cached value for `key`, or call loader(),
+    cache its result for `ttl` seconds and return a copy of it.
+    Values are event dicts, lists of them, or None; rows only hold
+    scalars, so a per-dict shallow copy keeps callers from mutating
+    what other callers will see.
+    Inside an open transaction the cache is bypassed (loader() only).
+    """
+    if in_transaction():
+        return loader()
+    value = _backend.get(key)
+    if value is not MISSING:
+        _count(hit=True)
+        return _copy(value)
+    _count(hit=False)
+    with _epoch_lock:
+        epoch = _epoch
+    value = loader()
+    # Skip caching if a write was invalidated while we were loading:
+    # what we read may predate that write. Checked and stored under the
+    # lock invalidation holds, so it cannot slip in between.
+    with _epoch_lock:
+        if epoch == _epoch:
+            _backend.set(key, value, ttl)
+    return _copy(value)
+
+
+def _copy(value):
+    if isinstance(value, dict):
+        return dict(value)
+    if isinstance(value, list):
+        return [dict(r) for r in value]
+    return value
+
+
+# -----------------------------
+# INVALIDATION
+# Called by writers inside their `with get_conn()` block; the actual
+# delete runs after commit so no reader can re-cache pre-commit data.
+# -----------------------------
+def _drop_events_and_listings(event_ids):
+    global _epoch
+    with _epoch_lock:
+        _epoch += 1
+        for event_id in event_ids:
+            _backend.delete(event_key(event_id))
+        _backend.set("listing:generation", time.time_ns(), GENERATION_TTL)
+
+
+def invalidate_event(event_id: int):
+    """Forget one event and every cached listing."""
+    after_commit(lambda: _drop_events_and_listings([event_id]))
+
+
+def invalidate_events(event_ids):
+    """Forget several events (bulk writers) and every cached listing."""
+    ids = list(event_ids)
+    after_commit(lambda: _drop_events_and_listings(ids))
+
+
+def _clear_all():
+    _drop_events_and_listings([])
+    _backend.clear()
+
+
+def clear_cache():
+    """Drop everything (maintenance jobs that rewrite many rows)."""
+    after_commit(_clear_all)
@@ -0,0 +1,119 @@
+"""
+=========================================================
+CALENDAR READS (events per day / month for the calendar view)
+=========================================================
+
+Purpose:
+- Backs CalendarPage.tsx: which events happen in a month, and how many
+  events fall on each day of a visible range.
+- An event belongs to every day/month its [startDateTime, endDateTime]
+  span overlaps, so a multi-day event shows up on each of its days
+  (search_by_date only looks at the start).
+
+What Changed:
+- New module. Queries go through the eventsCalendar R*Tree (migration 6
+  in currentDB.py), an interval index on start/end time, so a month
+  view is an index range query instead of a scan over every event.
+- The R*Tree holds minute-rounded bounds; each query re-checks the exact
+  ISO strings, so results are exact.
+
+Frontend Use:
+- Month grid → events_in_month(2025, 11) (use columns="card" for tiles).
+- Day badges → event_counts_by_day("2025-11-01", "2025-11-30")
+  → {"2025-11-01": 2, "2025-11-02": 0, ...}.
+"""
+
+import calendar as _calendar
+from datetime import date, datetime, timedelta
+
+from backend.db.connection import get_conn
+from backend.events.read import ACTIVE_FILTER, projection_sql
+
+_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def _minute(moment: datetime, round_up: bool = False) -> int:
+    """Minutes since 1970 (same clock as the eventsCalendar triggers)."""
+    seconds = _calendar.timegm(moment.timetuple())
+    return -(-seconds // 60) if round_up else seconds // 60
+
+
+def _parse_day(date_str: str) -> date:
+    return datetime.strptime(date_str, "%Y-%m-%d").date()
+
+
+def events_between(start: datetime, end: datetime, include_inactive: bool = False,
+                   columns: str | list[str] | None = None) -> list[dict]:
+    """
+    Events whose span overlaps [start, end), soonest first.
+    An event ending exactly at `start` does not overlap; a zero-length
+    event at `start` does.
+    """
+    if end <= start:
+        raise ValueError("end must be after start")
+    start_str, end_str = start.strftime(_FORMAT), end.strftime(_FORMAT)
+    where = "" if include_inactive else f" AND e.{ACTIVE_FILTER}"
+    with get_conn() as conn:
+        cur = conn.cursor()
+        cur.execute(
+            f"""
+            SELECT {projection_sql(columns, alias="e")}
+            FROM eventsCalendar c
+            CROSS JOIN events e ON e.eventID = c.eventID  -- R*Tree drives the join
+            WHERE c.startMinute < ? AND c.endMinute >= ?
+              AND e.startDateTime < ? AND (e.endDateTime > ? OR e.startDateTime >= ?){where}
+            ORDER BY e.startDateTime ASC, e.eventID ASC
+            """,
+            (_minute(end, round_up=True), _minute(start), end_str, start_str, start_str),
+        )
+        return [dict(r) for r in cur.fetchall()]
+
+
+def events_in_month(year: int, month: int, include_inactive: bool = False,
+                    columns: str | list[str] | None = None) -> list[dict]:
+    """Events overlapping the given calendar month (1-12), soonest first."""
+    if not 1 <= month <= 12:
+        raise ValueError("month must be between 1 and 12")
+    start = datetime(year, month, 1)
+    end = datetime(year + 1, 1, 1) if month == 12 else datetime(year, month + 1, 1)
+    return events_between(start, end, include_inactive, columns)
+
+
+def event_counts_by_day(start_date: str, end_date: str, include_inactive: bool = False) -> dict[str, int]:
+    """
+    Number of events on each day from start_date to end_date ('YYYY-MM-DD',
+    inclusive). Every day in the range is present; multi-day events count
+    on each day they overlap.
+    """
+    first, last = _parse_day(start_date), _parse_day(end_date)
+    if last < first:
+        raise ValueError("end_date must not be before start_date")
+    window_start = datetime.combine(first, datetime.min.time())
+    window_end = datetime.combine(last + timedelta(days=1), datetime.min.time())
+
+    counts = {}
+    day = first
+    while day <= last:
+        counts[day.isoformat()] = 0
+        day += timedelta(days=1)
+
+    for event in events_between(window_start, window_end, include_inactive,
+                                columns=["startDateTime", "endDateTime"]):
+        event_start = datetime.strptime(event["startDateTime"], _FORMAT)
+        event_end = datetime.strptime(event["endDateTime"], _FORMAT)
+        day = max(event_start.date(), first)
+        # Last day touched: an end at exactly midnight does not spill into that day
+        end_day = event_end.date() if event_end.time() != datetime.min.time() else event_end.date() - timedelta(days=1)
+        end_day = min(max(end_day, event_start.date()), last)
+        while day <= end_day:
+            counts[day.isoformat()] += 1
+            day += timedelta(days=1)
+    return counts
+
+
+# -----------------------------
+# DEBUG / LOCAL TESTING
+# -----------------------------
+if __name__ == "__main__":
+    print(events_in_month(2025, 11, columns="card"))
+    print(event_counts_by_day("2025-11-01", "2025-11-07"))
@@ -0,0 +1,130 @@
+"""
+=========================================================
+EVENT CATEGORIES (eventCategories join table)
+=========================================================
+
+Purpose:
+- Lets an event belong to several categories (e.g. "Math" + "Workshops")
+  instead of only its single eventType.
+- Category lookups ("events in Sports", "events in Math AND Workshops")
+  read eventCategories through idx_eventCategories_category
+  (category, eventID) instead of filtering event rows.
+
+What Changed:
+- New module. eventCategories holds the full category set of each event:
+  the primary eventType is mirrored in by triggers (currentDB migration 11),
+  extra categories are written here by create_event / update_event.
+- set_event_categories() replaces the picked categories in three
+  statements (delete what is no longer wanted, unflag a primary that is no
+  longer picked, insert/flag the rest); the primary eventType is always
+  kept. Picked rows carry isExplicit = 1 (currentDB migration 13), so a
+  later eventType change does not remove a category the user chose.
+- attach_categories() adds a "categories" list to event dicts with one
+  query per batch, for the in-memory filters (EventIndex, searching_logic).
+- Rows go with their event through ON DELETE CASCADE.
+
+Frontend Use:
+- Create/Edit Event form → multi-select → create_event(..., categories=[...])
+  / update_event(id, user, {"categories": [...]}).
+- Event details → get_event_categories(eventID) for the category chips.
+- Category filter → events_in_categories(["Math", "Workshops"], match="all").
+"""
+
+import json
+import sqlite3
+
+from backend.db.connection import get_conn
+
+MATCH_MODES = ("any", "all")
+
+
+# -----------------------------
+# WRITES (caller's connection, inside its transaction)
+# -----------------------------
+def set_event_categories(conn: sqlite3.Connection, eventID: int, categories: list[str]):
+    """
+    Make the event's categories exactly `categories` plus its eventType,
+    flagging the given ones as explicitly picked.
+    Categories must already be validated (see create.ALLOWED_EVENT_TYPES).
+    """
+    wanted = json.dumps(list(dict.fromkeys(categories)))
+    conn.execute("""
+        DELETE FROM eventCategories
+        WHERE eventID = ?
+          AND category NOT IN (SELECT value FROM json_each(?))
+          AND category IS NOT (SELECT eventType FROM events WHERE eventID = ?)
+    """, (eventID, wanted, eventID))
+    conn.execute("""
+        UPDATE eventCategories SET isExplicit = 0
+        WHERE eventID = ? AND isExplicit = 1
+          AND category NOT IN (SELECT value FROM json_each(?))
+    """, (eventID, wanted))
+    conn.execute("""
+        INSERT INTO eventCategories (eventID, category, isExplicit)
+        SELECT ?, value, 1 FROM json_each(?) WHERE true
+        ON CONFLICT (eventID, category) DO UPDATE SET isExplicit = 1
+    """, (eventID, wanted))
+
+
+# -----------------------------
+# READS
+# -----------------------------
+def get_event_categories(eventID: int) -> list[str]:
+    """Every category of one event (its eventType included), alphabetical."""
+    with get_conn() as conn:
+        cur = conn.cursor()
+        cur.execute("SELECT category FROM eventCategories WHERE eventID = ?", (eventID,))
+        return sorted(row[0] for row in cur.fetchall())
+
+
+def get_event_categories_many(eventIDs: list[int]) -> dict[int, list[str]]:
+    """{eventID: [categories]} for every given event (empty list if none)."""
+    ids = list(eventIDs)
+    result = {eventID: [] for eventID in ids}
+    with get_conn() as conn:
+        cur = conn.cursor()
+        cur.execute("""
+            SELECT eventID, category FROM eventCategories
+            WHERE eventID IN (SELECT value FROM json_each(?))
+            ORDER BY eventID, category
+        """, (json.dumps(ids),))
+        for eventID, category in cur.fetchall():
+            result[eventID].append(category)
+    return result
+
+
+def attach_categories(events: list[dict]) -> list[dict]:
+    """Add a "categories" list to each event dict (in place, one query); returns the list."""
+    found = get_event_categories_many([e["eventID"] for e in events])
+    for event in events:
+        event["categories"] = found.get(event["eventID"], [])
+    return events
+
+
+def events_in_categories(categories: list[str], match: str = "any") -> list[int]:
+    """
+    eventIDs (ascending) in any / all of the given categories,
+    read off the (category, eventID) index. Inactive events are included;
+    combine with read/query filters for listings.
+    """
+    if match not in MATCH_MODES:
+        raise ValueError(f"match must be one of: {MATCH_MODES}")
+    wanted = list(dict.fromkeys(categories))
+    if not wanted:
+        return []
+    with get_conn() as conn:
+        cur = conn.cursor()
+        if match == "any":
+            cur.execute("""
+                SELECT DISTINCT eventID FROM eventCategories
+                WHERE category IN (SELECT value FROM json_each(?))
+                ORDER BY eventID
+            """, (json.dumps(wanted),))
+        else:
+            cur.execute("""
+                SELECT eventID FROM eventCategories
+                WHERE category IN (SELECT value FROM json_each(?))
+                GROUP BY eventID HAVING COUNT(*) = ?
+                ORDER BY eventID
+            """, (json.dumps(wanted), len(wanted)))
+        return [row[0] for row in cur.fetchall()]
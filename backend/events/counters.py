@@ -0,0 +1,58 @@
+"""
+=========================================================
+EVENT COUNTERS (numberLikes / rsvpCount maintenance)
+=========================================================
+
+Purpose:
+- Repairs the denormalized engagement counters on the events table.
+- Day-to-day the counters are updated by triggers on likesLog/rsvpLog
+  (migration 5 in currentDB.py); this job rebuilds them from the logs
+  in bulk in case anything bypassed the triggers (manual SQL, restores).
+
+What Changed:
+- New module. One UPDATE recomputes both counters for every event and
+  only rewrites rows whose stored value drifted.
+
+Frontend Use:
+- Not called by the frontend. Run from a scheduled job / admin tool:
+    python -m backend.events.counters
+"""
+
+from backend.db.connection import get_conn
+from backend.events.cache import clear_cache
+
+# -----------------------------
+# RECONCILIATION JOB
+# -----------------------------
+def reconcile_counters() -> int:
+    """
+    Rebuild numberLikes and rsvpCount from likesLog / rsvpLog.
+    Returns the number of events whose counters were corrected.
+    """
+    with get_conn() as conn:
+        cur = conn.cursor()
+        cur.execute("""
+            UPDATE events
+            SET numberLikes = actual.likeCount,
+                rsvpCount   = actual.rsvpCount
+            FROM (
+                SELECT e.eventID,
+                       COALESCE(l.n, 0) AS likeCount,
+                       COALESCE(r.n, 0) AS rsvpCount
+                FROM events e
+                LEFT JOIN (SELECT eventID, COUNT(*) AS n FROM likesLog GROUP BY eventID) l ON l.eventID = e.eventID
+                LEFT JOIN (SELECT eventID, COUNT(*) AS n FROM rsvpLog  GROUP BY eventID) r ON r.eventID = e.eventID
+            ) AS actual
+            WHERE actual.eventID = events.eventID
+              AND (events.numberLikes IS NOT actual.likeCount
+                   OR events.rsvpCount IS NOT actual.rsvpCount)
+        """)
+        if cur.rowcount > 0:
+            clear_cache()
+        return cur.rowcount
+
+# -----------------------------
+# DEBUG / LOCAL TESTING
+# -----------------------------
+if __name__ == "__main__":
+    print("Events corrected:", reconcile_counters())
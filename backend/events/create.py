@@ -1,7 +1,10 @@
-import os
-import sqlite3
 from typing import Optional
 
+from backend.db.connection import unit_of_work
+from backend.events.cache import invalidate_event
+from backend.events.categories import set_event_categories
+from backend.images.image_store import store_image
+
 """
 =========================================================
 CREATE EVENT (events table insert)
@@ -14,22 +17,24 @@ Purpose:
 
 What Changed:
 - Centralized DB path resolution so code works no matter where run.
+- Uses the shared connection pool (backend/db/connection.py).
 - Enforced validation of eventType and eventAccess.
 - Supports optional images, RSVP flag, pricing fields.
+- Image bytes are saved in the content-addressed image store; the event row
+  only stores imageHash.
 - Built to be called directly or from API endpoints.
+- Invalidates the event cache (listings) once the insert commits.
+- Runs as a unit of work; inside an outer unit_of_work() it joins that
+  transaction, so create + invites (+ categories) commit together.
+- creatorID must be an existing account (foreign keys are enforced).
+- Optional extra categories are written to eventCategories in the same
+  transaction (eventType is always one of the event's categories).
 
 Frontend Use:
 - React "Create Event" form → send event details to backend → call create_event().
 - Backend should validate user ID (creatorID) before insertion.
 """
 
-# -----------------------------
-# DATABASE PATH RESOLUTION
-# Ensures DB points to backend/db/EventPlannerDB.db
-# -----------------------------
-BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))  # go up one level (from events/ to backend/)
-DB_PATH = os.path.join(BASE_DIR, "db", "EventPlannerDB.db")
-
 # -----------------------------
 # ALLOWED FIELDS
 # Used for validation to prevent bad data
@@ -61,11 +66,14 @@ def create_event(
     rsvpRequired: int = 0,
     isPriced: int = 0,
     cost: Optional[float] = None,
+    categories: Optional[list[str]] = None,
 ) -> int:
     """
     Insert a new event record into the events table.
     - Validates eventType and eventAccess
     - Automatically sets numberLikes = 0
+    - images (raw bytes) are stored once in imageStore, keyed by hash
+    - categories: extra categories besides eventType (same allowed set)
     - Returns: the newly created eventID
     """
 
@@ -74,24 +82,30 @@ def create_event(
         raise ValueError(f"eventType must be one of: {sorted(ALLOWED_EVENT_TYPES)}")
     if eventAccess not in ALLOWED_ACCESS:
         raise ValueError(f"eventAccess must be one of: {sorted(ALLOWED_ACCESS)}")
+    if categories is not None and not set(categories) <= ALLOWED_EVENT_TYPES:
+        raise ValueError(f"categories must be from: {sorted(ALLOWED_EVENT_TYPES)}")
 
     # Insert into DB
-    with sqlite3.connect(DB_PATH) as conn:
+    with unit_of_work() as conn:
+        imageHash = store_image(conn, images) if images is not None else None
         cur = conn.cursor()
         cur.execute("""
             INSERT INTO events (
-                creatorID, eventName, eventDescription, location, images,
+                creatorID, eventName, eventDescription, location, imageHash,
                 eventType, eventAccess, startDateTime, endDateTime,
                 numberLikes, rsvpRequired, isPriced, cost
             )
             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, 0, ?, ?, ?)
         """, (
-            creatorID, eventName, eventDescription, location, images,
+            creatorID, eventName, eventDescription, location, imageHash,
             eventType, eventAccess, startDateTime, endDateTime,
             rsvpRequired, isPriced, cost
         ))
-        conn.commit()
-        return cur.lastrowid
+        eventID = cur.lastrowid
+        if categories:
+            set_event_categories(conn, eventID, categories)
+        invalidate_event(eventID)
+        return eventID
 
 
 # -----------------------------
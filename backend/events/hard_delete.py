@@ -1,5 +1,8 @@
-import os
-import sqlite3
+from backend.db.connection import unit_of_work
+from backend.events.cache import invalidate_event
+from backend.images.image_store import release_image
+from backend.recommendations.recommendations import event_removed
+from backend.UserAccounts.authorization import can_edit, invalidate_event_creator
 
 """
 =========================================================
@@ -11,9 +14,17 @@ Purpose:
 - Used for permanent removal (e.g., spam events or cleanup).
 
 What Changed:
-- Manual cascade: removes rows from rsvpLog, likesLog, inviteLog, eventCategories before deleting event.
+- RSVPs, likes, invites and categories go with the event through the
+  schema's ON DELETE CASCADE (one DELETE instead of five).
+- Releases the event's image from the image store when no other event uses it.
+- Evicts the deleted event from the read cache and the "For You" model.
 - Authorization check: must be creator or Faculty (admin).
+- requesterID may be a session token (authorized without an accounts query).
+- Authorization lives in UserAccounts/authorization.py (shared, cached);
+  the deleted event's cached creatorID is dropped on commit.
 - Returns True/False for whether deletion succeeded.
+- Runs as one unit of work (BEGIN IMMEDIATE): the write lock is taken before
+  the authorization read, and the cascade commits as one transaction.
 
 Frontend Use:
 - Rarely exposed directly to users (destructive).
@@ -21,63 +32,39 @@ Frontend Use:
 - Frontend should confirm user intent before calling.
 """
 
-# -----------------------------
-# DATABASE PATH
-# -----------------------------
-BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-DB_PATH = os.path.join(BASE_DIR, "db", "EventPlannerDB.db")
-
-def _get_conn():
-    return sqlite3.connect(DB_PATH)
-
-# -----------------------------
-# AUTHORIZATION HELPER
-# -----------------------------
-def _is_authorized(updater_id: int, event_creator_id: int) -> bool:
-    """
-    Checks if user is allowed to delete event:
-    - Must be event creator OR Faculty accountType.
-    """
-    with _get_conn() as conn:
-        cur = conn.cursor()
-        cur.execute("SELECT accountType FROM accounts WHERE accountID = ?", (updater_id,))
-        row = cur.fetchone()
-        if not row:
-            return False
-        return updater_id == event_creator_id or row[0] == "Faculty"
-
 # -----------------------------
 # HARD DELETE FUNCTION
 # -----------------------------
-def hard_delete_event(eventID: int, requesterID: int) -> bool:
+def hard_delete_event(eventID: int, requesterID: int | str) -> bool:
     """
     Permanently delete an event and related rows.
+    requesterID: accountID or session token (session.py).
     Returns True if deletion succeeded, False otherwise.
     """
-    with _get_conn() as conn:
+    with unit_of_work() as conn:
         cur = conn.cursor()
 
         # Get creatorID for authorization
-        cur.execute("SELECT creatorID FROM events WHERE eventID = ?", (eventID,))
+        cur.execute("SELECT creatorID, imageHash FROM events WHERE eventID = ?", (eventID,))
         row = cur.fetchone()
         if not row:
             return False
-        creator_id = row[0]
+        creator_id, image = row[0], row[1]
 
-        if not _is_authorized(requesterID, creator_id):
+        if not can_edit(requesterID, creator_id, conn):
             return False
 
-        # Delete related logs before event
-        cur.execute("DELETE FROM rsvpLog         WHERE eventID = ?", (eventID,))
-        cur.execute("DELETE FROM likesLog        WHERE eventID = ?", (eventID,))
-        cur.execute("DELETE FROM inviteLog       WHERE eventID = ?", (eventID,))
-        cur.execute("DELETE FROM eventCategories WHERE eventID = ?", (eventID,))
-
-        # Delete event last
+        # Child rows (RSVPs, likes, invites, categories) cascade
         cur.execute("DELETE FROM events WHERE eventID = ?", (eventID,))
-        conn.commit()
+        deleted = cur.rowcount > 0
 
-        return cur.rowcount > 0
+        # Drop the event's image if no other event shares it
+        if deleted:
+            release_image(conn, image)
+            invalidate_event(eventID)
+            invalidate_event_creator(eventID)
+            event_removed(eventID)
+        return deleted
 
 # -----------------------------
 # DEBUG / LOCAL TESTING
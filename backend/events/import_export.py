@@ -0,0 +1,451 @@
+"""
+=========================================================
+EVENT IMPORT / EXPORT (bulk feeds, backups, analytics)
+=========================================================
+
+Purpose:
+- Loads whole event feeds (a semester's schedule, thousands of rows) from
+  CSV, JSON Lines or iCalendar without one transaction per event.
+- Streams every event back out in the same formats for backups and
+  analytics.
+
+What Changed:
+- New module. import_events() validates rows the same way create_event()
+  does (ALLOWED_EVENT_TYPES / ALLOWED_ACCESS, plus datetime format and
+  known creatorID) and inserts valid rows with executemany(), one
+  transaction per chunk of IMPORT_CHUNK_SIZE rows.
+- Bad rows are reported as (row number, reason) and skipped; they never
+  abort the import. If a chunk still fails in SQLite, that chunk is
+  retried row by row inside savepoints.
+- Input is consumed as a stream (readers are generators), so memory stays
+  flat regardless of file size.
+- export_events() yields text lines from read.iter_events() (fetchmany
+  batches on its own connection) instead of loading the table.
+- Dates are normalized with normalize_datetime() on import and iCalendar
+  export, so non-canonical ISO values create_event() accepted (e.g.
+  '2025-11-01T09:00') import as 'YYYY-MM-DD HH:MM:SS' and export cleanly;
+  an event whose stored date cannot be read is left out of an .ics export
+  instead of ending the stream.
+- iCalendar export marks Inactive (soft-deleted) events STATUS:CANCELLED
+  and import maps that back to Inactive, so a round trip never revives them.
+- iCalendar export folds content lines at 75 octets (RFC 5545); the
+  importer unfolds them.
+- Imports always insert new events: UIDs (e.g. the exporter's
+  UID:event-N@eventplanner) are not stored or matched, so importing the
+  same feed twice creates duplicates. Restore a backup into an empty DB.
+
+Frontend Use:
+- Admin "Import feed" upload → import_file(path, creatorID=admin_id)
+  → show report["errors"] next to the rows that were skipped.
+- "Download events" → stream export_events("csv") as the response body.
+"""
+
+import csv
+import io
+import json
+import os
+import re
+import sqlite3
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+from typing import TextIO
+
+from backend.db.connection import get_conn
+from backend.events.cache import invalidate_events
+from backend.events.create import ALLOWED_ACCESS, ALLOWED_EVENT_TYPES
+from backend.events.read import iter_events, resolve_columns
+
+IMPORT_CHUNK_SIZE = 500   # rows per executemany() / transaction
+
+_FORMAT = "%Y-%m-%d %H:%M:%S"
+ICAL_LINE_OCTETS = 75     # RFC 5545 content line limit (longer lines are folded)
+
+
+def normalize_datetime(value: str) -> str:
+    """
+    Any ISO 8601 date/datetime create_event() may have stored
+    ('2025-11-01T09:00', '2025-11-01 09:00:00', '2025-11-01') →
+    'YYYY-MM-DD HH:MM:SS'. Raises ValueError if it is not one.
+    """
+    try:
+        return datetime.fromisoformat(value).strftime(_FORMAT)
+    except (TypeError, ValueError):
+        raise ValueError(f"not an ISO datetime: {value!r}")
+
+# Columns an import row may set (everything else, e.g. eventID or counters, is ignored)
+IMPORT_FIELDS = (
+    "creatorID", "eventName", "eventDescription", "location", "eventType",
+    "eventAccess", "startDateTime", "endDateTime", "rsvpRequired", "isPriced", "cost",
+)
+
+_INSERT_SQL = f"""
+    INSERT INTO events ({", ".join(IMPORT_FIELDS)}, numberLikes)
+    VALUES ({", ".join("?" * len(IMPORT_FIELDS))}, 0)
+"""
+
+
+# -----------------------------
+# READERS
+# Each yields one dict per event, keyed like the events table
+# (or a ValueError for an input row that could not be parsed, so the
+# import reports it instead of stopping)
+# -----------------------------
+def read_csv(stream: TextIO) -> Iterator[dict]:
+    """CSV with a header row naming event columns."""
+    yield from csv.DictReader(stream)
+
+
+def read_jsonl(stream: TextIO) -> Iterator[dict | ValueError]:
+    """One JSON object per line; blank lines are skipped, unparsable lines yield a ValueError."""
+    for line in stream:
+        if line.strip():
+            try:
+                yield json.loads(line)
+            except ValueError as e:
+                yield ValueError(f"invalid JSON: {e}")
+
+
+def _ical_lines(stream: TextIO) -> Iterator[str]:
+    """Unfold iCalendar content lines (continuations start with a space/tab)."""
+    current = None
+    for raw in stream:
+        line = raw.rstrip("\r\n")
+        if line[:1] in (" ", "\t") and current is not None:
+            current += line[1:]
+            continue
+        if current is not None:
+            yield current
+        current = line
+    if current is not None:
+        yield current
+
+
+_ICAL_ESCAPE = re.compile(r"\\(.)")
+_ICAL_UNESCAPED = {"n": "\n", "N": "\n"}   # \, \; \\ and anything else → the character itself
+
+
+def _ical_text(value: str) -> str:
+    """Undo TEXT escaping in one left-to-right pass (so '\\\\n' stays backslash + 'n')."""
+    return _ICAL_ESCAPE.sub(lambda m: _ICAL_UNESCAPED.get(m.group(1), m.group(1)), value)
+
+
+def _ical_datetime(value: str) -> str:
+    """20251101T090000[Z] / 20251101 → 'YYYY-MM-DD HH:MM:SS' (UTC 'Z' is kept as-is)."""
+    value = value.rstrip("Z")
+    parsed = datetime.strptime(value, "%Y%m%dT%H%M%S" if "T" in value else "%Y%m%d")
+    return parsed.strftime(_FORMAT)
+
+
+_ICAL_ACCESS = {"PUBLIC": "Public", "PRIVATE": "Private", "CONFIDENTIAL": "Private"}
+
+
+def read_ical(stream: TextIO) -> Iterator[dict]:
+    """
+    VEVENT components of an .ics feed:
+    SUMMARY → eventName, DESCRIPTION, LOCATION, DTSTART/DTEND,
+    CATEGORIES → eventType (first allowed one), CLASS → eventAccess,
+    STATUS:CANCELLED → eventAccess "Inactive" (whatever CLASS says).
+    UID is ignored: re-importing a feed duplicates its events.
+    """
+    event = None
+    for line in _ical_lines(stream):
+        name, _, value = line.partition(":")
+        name = name.split(";", 1)[0].upper()
+        if name == "BEGIN" and value.upper() == "VEVENT":
+            event = {}
+        elif name == "END" and value.upper() == "VEVENT" and event is not None:
+            yield event
+            event = None
+        elif event is None:
+            continue
+        elif name == "SUMMARY":
+            event["eventName"] = _ical_text(value)
+        elif name == "DESCRIPTION":
+            event["eventDescription"] = _ical_text(value)
+        elif name == "LOCATION":
+            event["location"] = _ical_text(value)
+        elif name in ("DTSTART", "DTEND"):
+            key = "startDateTime" if name == "DTSTART" else "endDateTime"
+            try:
+                event[key] = _ical_datetime(value)
+            except ValueError:
+                event[key] = value  # reported by validation
+        elif name == "CATEGORIES":
+            categories = [_ical_text(c).strip() for c in value.split(",")]
+            event["eventType"] = next((c for c in categories if c in ALLOWED_EVENT_TYPES), categories[0])
+        elif name == "CLASS":
+            if event.get("eventAccess") != "Inactive":
+                event["eventAccess"] = _ICAL_ACCESS.get(value.upper(), value)
+        elif name == "STATUS" and value.upper() == "CANCELLED":
+            event["eventAccess"] = "Inactive"
+
+
+READERS = {"csv": read_csv, "jsonl": read_jsonl, "ics": read_ical}
+
+
+def _format_of(path: str, fmt: str | None) -> str:
+    fmt = (fmt or os.path.splitext(path)[1].lstrip(".")).lower()
+    fmt = {"json": "jsonl", "ical": "ics"}.get(fmt, fmt)
+    if fmt not in READERS:
+        raise ValueError(f"Unsupported format '{fmt}'; use one of: {sorted(READERS)}")
+    return fmt
+
+
+# -----------------------------
+# VALIDATION
+# -----------------------------
+def _flag(value) -> int:
+    if value in (None, ""):
+        return 0
+    if isinstance(value, str):
+        lowered = value.strip().lower()
+        if lowered in ("1", "true", "yes"):
+            return 1
+        if lowered in ("0", "false", "no"):
+            return 0
+        raise ValueError(f"not a boolean: {value!r}")
+    return 1 if value else 0
+
+
+def validate_row(row: dict, creatorID: int | None = None) -> tuple:
+    """
+    Check one input row and return its values in IMPORT_FIELDS order.
+    Raises ValueError with the reason if the row cannot be imported
+    (including wrongly typed values, e.g. a list where text belongs).
+    creatorID fills rows that do not name one (e.g. iCalendar feeds).
+    """
+    try:
+        return _check_row(row, creatorID)
+    except (TypeError, AttributeError) as e:
+        raise ValueError(f"invalid value: {e}") from e
+
+
+def _check_row(row: dict, creatorID: int | None) -> tuple:
+    if isinstance(row, ValueError):  # reader could not parse this row
+        raise row
+    if not isinstance(row, dict):
+        raise ValueError(f"row must be an object, not {type(row).__name__}")
+    for field in ("eventName", "eventDescription", "location", "startDateTime", "endDateTime"):
+        if not row.get(field):
+            raise ValueError(f"missing {field}")
+    if row.get("eventType") not in ALLOWED_EVENT_TYPES:
+        raise ValueError(f"eventType must be one of: {sorted(ALLOWED_EVENT_TYPES)}")
+    access = row.get("eventAccess") or "Public"
+    if access not in ALLOWED_ACCESS:
+        raise ValueError(f"eventAccess must be one of: {sorted(ALLOWED_ACCESS)}")
+    try:
+        start = normalize_datetime(row["startDateTime"])
+        end = normalize_datetime(row["endDateTime"])
+    except ValueError:
+        raise ValueError("startDateTime/endDateTime must be ISO datetimes, e.g. 'YYYY-MM-DD HH:MM:SS'")
+    if end < start:
+        raise ValueError("endDateTime is before startDateTime")
+
+    creator = row.get("creatorID") or creatorID
+    try:
+        creator = int(creator)
+    except (TypeError, ValueError):
+        raise ValueError("missing or invalid creatorID")
+    cost = row.get("cost")
+    try:
+        cost = float(cost) if cost not in (None, "") else None
+    except (TypeError, ValueError):
+        raise ValueError(f"invalid cost: {cost!r}")
+
+    return (
+        creator, row["eventName"], row["eventDescription"], row["location"], row["eventType"],
+        access, start, end,
+        _flag(row.get("rsvpRequired")), _flag(row.get("isPriced")), cost,
+    )
+
+
+# -----------------------------
+# IMPORT
+# -----------------------------
+def _insert_chunk(conn: sqlite3.Connection, chunk: list[tuple[int, tuple]], errors: list) -> int:
+    """
+    Insert one validated chunk on the caller's transaction.
+    Returns the number of rows inserted; failures are appended to `errors`.
+    """
+    # Creators checked in one query per chunk
+    creators = {values[0] for _, values in chunk}
+    known = {r[0] for r in conn.execute(
+        "SELECT accountID FROM accounts WHERE accountID IN (SELECT value FROM json_each(?))",
+        (json.dumps(sorted(creators)),),
+    )}
+    rows = []
+    for row_number, values in chunk:
+        if values[0] in known:
+            rows.append((row_number, values))
+        else:
+            errors.append((row_number, f"unknown creatorID {values[0]}"))
+
+    conn.execute("SAVEPOINT import_chunk")
+    try:
+        conn.executemany(_INSERT_SQL, [values for _, values in rows])
+        conn.execute("RELEASE import_chunk")
+        return len(rows)
+    except sqlite3.DatabaseError:
+        conn.execute("ROLLBACK TO import_chunk")
+        conn.execute("RELEASE import_chunk")
+
+    # Slow path: isolate the row(s) SQLite rejected
+    inserted = 0
+    for row_number, values in rows:
+        conn.execute("SAVEPOINT import_row")
+        try:
+            conn.execute(_INSERT_SQL, values)
+            conn.execute("RELEASE import_row")
+            inserted += 1
+        except sqlite3.DatabaseError as e:
+            conn.execute("ROLLBACK TO import_row")
+            conn.execute("RELEASE import_row")
+            errors.append((row_number, str(e)))
+    return inserted
+
+
+def _flush(chunk: list[tuple[int, tuple]], errors: list) -> int:
+    """One transaction per chunk; invalidates the new eventIDs once it commits."""
+    with get_conn() as conn:
+        if not conn.in_transaction:
+            conn.execute("BEGIN IMMEDIATE")  # take the write lock now: eventID range below is exact
+        before = conn.execute("SELECT COALESCE(MAX(eventID), 0) FROM events").fetchone()[0]
+        inserted = _insert_chunk(conn, chunk, errors)
+        after = conn.execute("SELECT COALESCE(MAX(eventID), 0) FROM events").fetchone()[0]
+        if inserted:
+            invalidate_events(range(before + 1, after + 1))
+        return inserted
+
+
+def import_events(rows: Iterable[dict], creatorID: int | None = None,
+                  chunk_size: int = IMPORT_CHUNK_SIZE) -> dict:
+    """
+    Bulk-insert event dicts (e.g. from read_csv / read_jsonl / read_ical).
+    - Invalid rows are skipped and reported; valid rows are inserted in
+      chunks of `chunk_size`, one transaction each.
+    - creatorID is used for rows without their own creatorID.
+    Returns {"inserted": int, "errors": [(row_number, reason), ...]}
+    (row numbers start at 1 in input order).
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be >= 1")
+    inserted, errors, chunk = 0, [], []
+    for row_number, row in enumerate(rows, 1):
+        try:
+            chunk.append((row_number, validate_row(row, creatorID)))
+        except ValueError as e:
+            errors.append((row_number, str(e)))
+        if len(chunk) >= chunk_size:
+            inserted += _flush(chunk, errors)
+            chunk = []
+    if chunk:
+        inserted += _flush(chunk, errors)
+    errors.sort()
+    return {"inserted": inserted, "errors": errors}
+
+
+def import_file(path: str, fmt: str | None = None, creatorID: int | None = None,
+                chunk_size: int = IMPORT_CHUNK_SIZE) -> dict:
+    """import_events() over a .csv / .jsonl / .ics file (format from the extension unless given)."""
+    reader = READERS[_format_of(path, fmt)]
+    with open(path, newline="", encoding="utf-8") as stream:
+        return import_events(reader(stream), creatorID, chunk_size)
+
+
+# -----------------------------
+# EXPORT
+# -----------------------------
+def _ical_escape(value) -> str:
+    text = "" if value is None else str(value)
+    return (text.replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,")
+            .replace("\r\n", "\\n").replace("\n", "\\n"))
+
+
+def _ical_fold(line: str, limit: int = ICAL_LINE_OCTETS) -> str:
+    """
+    Fold one content line so no physical line exceeds `limit` octets
+    (RFC 5545 3.1); continuations start with a space. Never splits a
+    UTF-8 character. _ical_lines() undoes this on import.
+    """
+    if len(line.encode("utf-8")) <= limit:
+        return line
+    parts, current, size = [], [], 0
+    for char in line:
+        width = len(char.encode("utf-8"))
+        if size + width > limit:
+            parts.append("".join(current))
+            current, size, limit = [], 0, limit - 1  # room for the leading space
+        current.append(char)
+        size += width
+    parts.append("".join(current))
+    return "\r\n ".join(parts)
+
+
+def _ical_stamp(value: str) -> str:
+    return normalize_datetime(value).replace("-", "").replace(":", "").replace(" ", "T")
+
+
+def _export_ical(events: Iterable[dict]) -> Iterator[str]:
+    yield "BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//EventPlanner//Export//EN\r\n"
+    for event in events:
+        lines = ["BEGIN:VEVENT", f"UID:event-{event['eventID']}@eventplanner"]
+        try:
+            for prop, field in (("DTSTART", "startDateTime"), ("DTEND", "endDateTime")):
+                if field in event:
+                    lines.append(f"{prop}:{_ical_stamp(event[field])}")
+        except ValueError:
+            continue  # unreadable stored date: leave the event out rather than end the stream
+        for prop, field in (("SUMMARY", "eventName"), ("DESCRIPTION", "eventDescription"),
+                            ("LOCATION", "location"), ("CATEGORIES", "eventType")):
+            if field in event:
+                lines.append(f"{prop}:{_ical_escape(event[field])}")
+        if "eventAccess" in event:
+            lines.append(f"CLASS:{'PRIVATE' if event['eventAccess'] == 'Private' else 'PUBLIC'}")
+            if event["eventAccess"] == "Inactive":  # soft-deleted: must not come back as live
+                lines.append("STATUS:CANCELLED")
+        lines.append("END:VEVENT")
+        yield "\r\n".join(_ical_fold(line) for line in lines) + "\r\n"
+    yield "END:VCALENDAR\r\n"
+
+
+def export_events(fmt: str = "jsonl", include_inactive: bool = True,
+                  columns: str | list[str] | None = None) -> Iterator[str]:
+    """
+    Stream every event as text chunks in `fmt` ("csv", "jsonl" or "ics"),
+    chronologically. Rows come from iter_events(), so the table is never
+    held in memory; write the chunks straight to a file or response.
+    """
+    fmt = _format_of("", fmt)
+    events = iter_events(include_inactive=include_inactive, columns=columns)
+    if fmt == "jsonl":
+        for event in events:
+            yield json.dumps(event) + "\n"
+    elif fmt == "csv":
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=resolve_columns(columns))
+        writer.writeheader()
+        for event in events:
+            writer.writerow(event)
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+        if buffer.getvalue():  # header only (no events)
+            yield buffer.getvalue()
+    else:
+        yield from _export_ical(events)
+
+
+def export_file(path: str, fmt: str | None = None, include_inactive: bool = True) -> None:
+    """Write export_events() to `path` (format from the extension unless given)."""
+    fmt = _format_of(path, fmt)
+    with open(path, "w", newline="", encoding="utf-8") as out:
+        out.writelines(export_events(fmt, include_inactive))
+
+
+# -----------------------------
+# DEBUG / LOCAL TESTING
+# -----------------------------
+if __name__ == "__main__":
+    import sys
+    for chunk in export_events(sys.argv[1] if len(sys.argv) > 1 else "jsonl"):
+        sys.stdout.write(chunk)
@@ -1,5 +1,10 @@
-import os
-import sqlite3
+import base64
+import json
+
+from backend.db.connection import get_conn
+from backend.events import cache
+from backend.images.image_store import CHUNK_SIZE, iter_image
+from backend.UserAccounts.authorization import can_view_event
 
 """
 =========================================================
@@ -12,66 +17,281 @@ Purpose:
 
 What Changed:
 - Uses row_factory so results return as dicts, not tuples.
+- Connections come from the shared pool in backend/db/connection.py.
 - Excludes 'Inactive' events by default (soft-deleted).
 - Added chronological ordering option for better UI display.
+- Active-event filter is written as eventAccess IN ('Public','Private') so it
+  can use idx_events_access_start (see currentDB.PUBLIC_QUERIES).
+- Added read_events_by_creator() for "My Events" (uses idx_events_creator).
+- Rows carry `imageHash` instead of image bytes; read_event_image() streams
+  the bytes from the image store in chunks.
+- Reads take a column projection (checked against EVENT_COLUMNS); the "card"
+  projection leaves out the description for list views.
+- read_event_field() selects just the one column instead of the whole row.
+- iter_events() streams rows in fetchmany() batches; read_events_page()
+  pages with an opaque continuation token (keyset on startDateTime, eventID).
+- read_popular_events() sorts by the numberLikes / rsvpCount counters.
+- read_events() and read_event_by_id() are read-through cached
+  (backend/events/cache.py); writers invalidate after commit.
+- read_event_by_id(viewer_id=...) and read_event_image(viewer_id=...) hide
+  Private events (and their images) from accounts that are not the
+  creator, Faculty or invited (UserAccounts/authorization.py).
 
 Frontend Use:
-- "Browse Events" page → call read_events() to populate event list.
-- "Event Details" page → call read_event_by_id() with the eventID.
+- "Browse Events" page → call read_events(columns="card") to populate event list.
+- "Event Details" page → call read_event_by_id(eventID, viewer_id=token).
+- "My Events" page → call read_events_by_creator() with the signed-in accountID.
+- "Popular" list → read_popular_events(limit, by="likes" | "rsvps").
+- Infinite scroll → read_events_page(limit, page_token) → send back next_page_token.
+- <img> tags → GET /events/<id>/image → stream read_event_image(eventID, viewer_id=token).
 - Useful for both list views and detail views in frontend.
 """
 
 # -----------------------------
-# DATABASE PATH
+# COLUMN PROJECTIONS
+# Only whitelisted columns can be selected (they are formatted into SQL)
+# -----------------------------
+EVENT_COLUMNS = (
+    "eventID", "creatorID", "eventName", "eventType", "eventDescription",
+    "location", "eventAccess", "startDateTime", "endDateTime",
+    "numberLikes", "rsvpCount", "rsvpRequired", "isPriced", "cost", "imageHash",
+)
+
+PROJECTIONS = {
+    "full": EVENT_COLUMNS,
+    # List/browse cards: no description, image by reference only
+    "card": (
+        "eventID", "creatorID", "eventName", "eventType", "location",
+        "eventAccess", "startDateTime", "endDateTime", "numberLikes",
+        "rsvpCount", "rsvpRequired", "isPriced", "cost", "imageHash",
+    ),
+}
+
+ACTIVE_FILTER = "eventAccess IN ('Public','Private')"
+
+def resolve_columns(columns: str | list[str] | tuple | None = None) -> tuple:
+    """
+    Turn a projection into a validated tuple of column names.
+    - None → every column ("full")
+    - "card" / "full" → named projection from PROJECTIONS
+    - list of column names → checked against EVENT_COLUMNS
+    """
+    if columns is None:
+        columns = PROJECTIONS["full"]
+    elif isinstance(columns, str):
+        if columns not in PROJECTIONS:
+            raise ValueError(f"projection must be one of: {sorted(PROJECTIONS)}")
+        columns = PROJECTIONS[columns]
+    bad_cols = [c for c in columns if c not in EVENT_COLUMNS]
+    if bad_cols or not columns:
+        raise ValueError(f"Illegal event columns: {bad_cols or 'none given'}")
+    return tuple(columns)
+
+def projection_sql(columns: str | list[str] | tuple | None = None, alias: str = "") -> str:
+    """
+    SELECT column list for a projection (see resolve_columns).
+    alias: table alias to prefix each column with (for joins).
+    """
+    prefix = f"{alias}." if alias else ""
+    return ", ".join(prefix + c for c in resolve_columns(columns))
+
+# -----------------------------
+# PAGE TOKENS
+# Opaque continuation token = urlsafe base64 of [startDateTime, eventID]
 # -----------------------------
-BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-DB_PATH = os.path.join(BASE_DIR, "db", "EventPlannerDB.db")
+KEYSET_COLUMNS = ("startDateTime", "eventID")
+
+def encode_page_token(event: dict) -> str:
+    """Continuation token pointing just after `event` in (startDateTime, eventID) order."""
+    raw = json.dumps([event["startDateTime"], event["eventID"]], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+def decode_page_token(token: str) -> tuple:
+    """Token → (startDateTime, eventID). Raises ValueError if it was tampered with."""
+    try:
+        start, event_id = json.loads(base64.urlsafe_b64decode(token.encode("ascii")))
+    except (ValueError, TypeError) as e:
+        raise ValueError("Invalid page token") from e
+    if not isinstance(start, str) or not isinstance(event_id, int):
+        raise ValueError("Invalid page token")
+    return (start, event_id)
 
-def _get_conn():
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row  # return dict-like rows
-    return conn
+def with_keyset_columns(columns: str | list[str] | tuple | None = None) -> tuple:
+    """Projection plus whatever keyset columns it is missing (needed to build the next token)."""
+    cols = resolve_columns(columns)
+    return cols + tuple(c for c in KEYSET_COLUMNS if c not in cols)
 
 # -----------------------------
 # READ FUNCTIONS
 # -----------------------------
-def read_events(include_inactive: bool = False, chronological: bool = True) -> list[dict]:
+def read_events(include_inactive: bool = False, chronological: bool = True,
+                columns: str | list[str] | None = None) -> list[dict]:
     """
     Return events as list of dicts.
     Excludes 'Inactive' events by default.
     Optionally sorts by startDateTime.
+    columns: projection ("card", "full" or a list of column names); default all.
+    """
+    cols = resolve_columns(columns)
+
+    def load():
+        with get_conn() as conn:
+            cur = conn.cursor()
+            base = f"SELECT {', '.join(cols)} FROM events"
+            where = "" if include_inactive else f" WHERE {ACTIVE_FILTER}"
+            order = " ORDER BY startDateTime ASC" if chronological else ""
+            cur.execute(base + where + order)
+            return [dict(r) for r in cur.fetchall()]
+
+    key = cache.listing_key(include_inactive, chronological, ",".join(cols))
+    return cache.get_or_load(key, load, cache.LISTING_TTL)
+
+def read_event_by_id(eventID: int, include_inactive: bool = False,
+                     columns: str | list[str] | None = None,
+                     viewer_id: int | str | None = None) -> dict | None:
+    """
+    Fetch single event by ID.
+    Excludes 'Inactive' events unless include_inactive=True.
+    columns: projection, same as read_events().
+    viewer_id: accountID or session token of the reader; when given, a
+    Private event is only returned to its creator, Faculty or invitees.
+    """
+    cols = resolve_columns(columns)
+
+    def load():
+        # Cache the full row (inactive too); filter + project per caller below
+        with get_conn() as conn:
+            cur = conn.cursor()
+            cur.execute(f"SELECT {projection_sql()} FROM events WHERE eventID = ?", (eventID,))
+            row = cur.fetchone()
+            return dict(row) if row else None
+
+    row = cache.get_or_load(cache.event_key(eventID), load, cache.EVENT_TTL)
+    if not row:
+        return None
+    if not include_inactive and row["eventAccess"] not in ("Public", "Private"):
+        return None
+    if viewer_id is not None and row["eventAccess"] == "Private" and not can_view_event(
+            viewer_id, eventID, row["creatorID"], row["eventAccess"]):
+        return None
+    return {c: row[c] for c in cols}
+
+def read_events_by_creator(creatorID: int, include_inactive: bool = False,
+                           columns: str | list[str] | None = None) -> list[dict]:
+    """
+    Return events created by one account (My Events page), soonest first.
+    Excludes 'Inactive' events by default.
     """
-    with _get_conn() as conn:
+    with get_conn() as conn:
         cur = conn.cursor()
-        base = "SELECT * FROM events"
-        where = "" if include_inactive else " WHERE eventAccess != 'Inactive'"
-        order = " ORDER BY startDateTime ASC" if chronological else ""
-        cur.execute(base + where + order)
+        where = "" if include_inactive else f" AND {ACTIVE_FILTER}"
+        cur.execute(
+            f"SELECT {projection_sql(columns)} FROM events WHERE creatorID = ?{where} ORDER BY startDateTime ASC",
+            (creatorID,),
+        )
         return [dict(r) for r in cur.fetchall()]
 
-def read_event_by_id(eventID: int, include_inactive: bool = False) -> dict | None:
+# Counter column per popularity ranking
+POPULARITY_COLUMNS = {"likes": "numberLikes", "rsvps": "rsvpCount"}
+
+def read_popular_events(limit: int = 20, by: str = "likes", include_inactive: bool = False,
+                        columns: str | list[str] | None = None) -> list[dict]:
     """
-    Fetch single event by ID.
-    Excludes 'Inactive' events unless override=True.
+    Most liked (by="likes") or most RSVP'd (by="rsvps") events first.
+    Reads the maintained counters, never aggregates the logs.
     """
-    with _get_conn() as conn:
+    if by not in POPULARITY_COLUMNS:
+        raise ValueError(f"by must be one of: {sorted(POPULARITY_COLUMNS)}")
+    counter = POPULARITY_COLUMNS[by]
+    # unary + keeps SQLite on the counter index (walk top-down, stop at LIMIT)
+    where = "" if include_inactive else " WHERE +eventAccess IN ('Public','Private')"
+    with get_conn() as conn:
         cur = conn.cursor()
-        cur.execute("SELECT * FROM events WHERE eventID = ?", (eventID,))
-        row = cur.fetchone()
-        if not row:
-            return None
-        row = dict(row)
-        if not include_inactive and row.get("eventAccess") == "Inactive":
-            return None
-        return row
+        cur.execute(
+            f"SELECT {projection_sql(columns)} FROM events{where} ORDER BY {counter} DESC, eventID ASC LIMIT ?",
+            (limit,),
+        )
+        return [dict(r) for r in cur.fetchall()]
+
+def iter_events(include_inactive: bool = False, columns: str | list[str] | None = None,
+                batch_size: int = 500):
+    """
+    Generator version of read_events(): yields one dict at a time, pulling
+    `batch_size` rows per fetchmany() so memory stays flat as the catalog grows.
+    - Always chronological (startDateTime, then eventID).
+    - Uses its own pooled connection (a consistent WAL snapshot) that is
+      returned when the generator is exhausted or closed.
+    """
+    where = "" if include_inactive else f" WHERE {ACTIVE_FILTER}"
+    sql = f"SELECT {projection_sql(columns)} FROM events{where} ORDER BY startDateTime ASC, eventID ASC"
+    with get_conn(shared=False) as conn:
+        cur = conn.execute(sql)
+        while True:
+            rows = cur.fetchmany(batch_size)
+            if not rows:
+                break
+            for r in rows:
+                yield dict(r)
+
+def read_events_page(limit: int = 50, page_token: str | None = None, include_inactive: bool = False,
+                     columns: str | list[str] | None = None) -> tuple[list[dict], str | None]:
+    """
+    One page of events in chronological order (keyset pagination).
+    Returns (events, next_page_token); next_page_token is None on the last page.
+    Pass the token back unchanged to get the following page.
+    """
+    clauses = [] if include_inactive else [ACTIVE_FILTER]
+    params = []
+    if page_token:
+        clauses.append("(startDateTime, eventID) > (?, ?)")
+        params.extend(decode_page_token(page_token))
+    where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+    cols = with_keyset_columns(columns)
+    with get_conn() as conn:
+        cur = conn.cursor()
+        cur.execute(
+            f"SELECT {', '.join(cols)} FROM events{where} ORDER BY startDateTime ASC, eventID ASC LIMIT ?",
+            params + [limit + 1],  # one extra row tells us whether another page exists
+        )
+        rows = [dict(r) for r in cur.fetchall()]
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    next_token = encode_page_token(rows[-1]) if has_more and rows else None
+    return rows, next_token
 
 def read_event_field(eventID: int, field: str) -> object | None:
     """
-    Convenience: return one field value for event.
-    Returns None if event not found.
+    Convenience: return one field value for event (single-column query).
+    Returns None if event not found or inactive.
+    Raises ValueError for a field that is not an event column.
     """
-    evt = read_event_by_id(eventID)
-    return None if not evt else evt.get(field)
+    projection_sql([field])  # whitelist check
+    with get_conn() as conn:
+        cur = conn.cursor()
+        cur.execute(f"SELECT {field} FROM events WHERE eventID = ? AND {ACTIVE_FILTER}", (eventID,))
+        row = cur.fetchone()
+        return None if not row else row[0]
+
+def read_event_image(eventID: int, include_inactive: bool = False, chunk_size: int = CHUNK_SIZE,
+                     viewer_id: int | str | None = None):
+    """
+    Stream an event's image bytes in chunks (generator).
+    Yields nothing if the event has no image or is not visible.
+    viewer_id: as in read_event_by_id(); a Private event's image is only
+    streamed to its creator, Faculty or invitees.
+    """
+    with get_conn() as conn:
+        cur = conn.cursor()
+        cur.execute("SELECT imageHash, eventAccess, creatorID FROM events WHERE eventID = ?", (eventID,))
+        row = cur.fetchone()
+        if not row or row["imageHash"] is None:
+            return
+        if not include_inactive and row["eventAccess"] == "Inactive":
+            return
+        if viewer_id is not None and row["eventAccess"] == "Private" and not can_view_event(
+                viewer_id, eventID, row["creatorID"], row["eventAccess"], conn):
+            return
+    yield from iter_image(row["imageHash"], chunk_size)
 
 # -----------------------------
 # DEBUG / LOCAL TESTING
@@ -1,5 +1,7 @@
-import os
-import sqlite3
+from backend.db.connection import unit_of_work
+from backend.events.cache import invalidate_event
+from backend.recommendations.recommendations import event_changed
+from backend.UserAccounts.authorization import can_edit, event_creators
 
 """
 =========================================================
@@ -15,6 +17,13 @@ What Changed:
 - Authorization check: only creator or Faculty can delete.
 - Instead of physical delete, updates eventAccess to 'Inactive'.
 - Keeps schema cleaner than hard delete for audit/logging.
+- Log cleanup + flag update run as one unit of work (BEGIN IMMEDIATE), so
+  the write lock is taken once, before the authorization read. (The row
+  stays, so ON DELETE CASCADE does not apply here.)
+- Cached copies of the event/listings are invalidated on commit, and the
+  "For You" model stops recommending it.
+- requesterID may be a session token (authorized without an accounts query).
+- Authorization lives in UserAccounts/authorization.py (shared, cached).
 
 Frontend Use:
 - "Cancel Event" button → call soft_delete_event().
@@ -22,52 +31,21 @@ Frontend Use:
 - Admin panel can still query inactive events with include_inactive=True.
 """
 
-# -----------------------------
-# DATABASE PATH
-# -----------------------------
-BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-DB_PATH = os.path.join(BASE_DIR, "db", "EventPlannerDB.db")
-
-def _get_conn():
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    return conn
-
-# -----------------------------
-# AUTHORIZATION HELPER
-# -----------------------------
-def _is_authorized(updater_id: int, event_creator_id: int) -> bool:
-    """
-    Authorized if requester is event creator OR Faculty account.
-    """
-    with _get_conn() as conn:
-        cur = conn.cursor()
-        cur.execute("SELECT accountType FROM accounts WHERE accountID = ?", (updater_id,))
-        row = cur.fetchone()
-        if not row:
-            return False
-        return updater_id == event_creator_id or row[0] == "Faculty"
-
 # -----------------------------
 # SOFT DELETE FUNCTION
 # -----------------------------
-def soft_delete_event(eventID: int, requesterID: int) -> bool:
+def soft_delete_event(eventID: int, requesterID: int | str) -> bool:
     """
     Marks event as Inactive and removes related RSVPs/Likes.
+    requesterID: accountID or session token (session.py).
     Returns True if updated, False otherwise.
     """
-    with _get_conn() as conn:
+    with unit_of_work() as conn:
         cur = conn.cursor()
 
-        # Get creatorID
-        cur.execute("SELECT creatorID FROM events WHERE eventID = ?", (eventID,))
-        row = cur.fetchone()
-        if not row:
-            return False
-        creator_id = row[0]
-
-        # Check authorization
-        if not _is_authorized(requesterID, creator_id):
+        # Get creatorID (cached) and check authorization
+        creator_id = event_creators([eventID], conn).get(eventID)
+        if creator_id is None or not can_edit(requesterID, creator_id, conn):
             return False
 
         # Clean related logs
@@ -80,5 +58,6 @@ def soft_delete_event(eventID: int, requesterID: int) -> bool:
             SET eventAccess = 'Inactive'
             WHERE eventID = ?
         """, (eventID,))
-        conn.commit()
+        invalidate_event(eventID)
+        event_changed(eventID, access="Inactive")
         return cur.rowcount > 0
@@ -0,0 +1,68 @@
+"""
+Tests for events/cache.py (run: python -m pytest -q).
+"""
+
+import threading
+
+from backend.db.connection import unit_of_work
+from backend.events import cache
+from backend.events.create import create_event
+from backend.events.read import read_event_by_id
+from backend.events.update import update_event
+
+
+class RacingBackend(cache.LocalLRUBackend):
+    """Runs `on_store` from another thread just before an event row is stored."""
+
+    on_store = None
+
+    def set(self, key, value, ttl):
+        if key.startswith("event:") and self.on_store is not None:
+            racer = threading.Thread(target=self.on_store)
+            racer.start()
+            racer.join(timeout=0.2)   # blocked on the cache lock once the fix is in
+            self.racer = racer
+        super().set(key, value, ttl)
+
+
+def test_invalidation_racing_a_load_never_leaves_stale_rows():
+    backend = RacingBackend()
+    cache.set_backend(backend)
+    try:
+        backend.on_store = lambda: cache._drop_events_and_listings([7])
+        value = cache.get_or_load(cache.event_key(7), lambda: {"eventID": 7, "eventName": "stale"}, 60)
+        backend.racer.join()
+        assert value["eventName"] == "stale"
+        assert backend.get(cache.event_key(7)) is cache.MISSING
+    finally:
+        cache.set_backend(cache.LocalLRUBackend())
+
+
+def test_invalidation_during_load_skips_the_store():
+    def loader():
+        cache._drop_events_and_listings([8])   # a write commits while we read
+        return {"eventID": 8}
+
+    cache.get_or_load(cache.event_key(8), loader, 60)
+    assert cache.get_backend().get(cache.event_key(8)) is cache.MISSING
+
+
+def test_update_invalidates_cached_event(db):
+    event = create_event(1, "Hackathon", "d", "Library Lab", "Computer Science",
+                         "2099-11-01 09:00:00", "2099-11-02 09:00:00")
+    assert read_event_by_id(event)["eventName"] == "Hackathon"
+    assert update_event(event, 1, {"eventName": "Hackathon 2"})
+    assert read_event_by_id(event)["eventName"] == "Hackathon 2"
+
+
+def test_rolled_back_read_is_not_cached(db):
+    event = create_event(1, "Hackathon", "d", "Library Lab", "Computer Science",
+                         "2099-11-01 09:00:00", "2099-11-02 09:00:00")
+    try:
+        with unit_of_work():
+            update_event(event, 1, {"eventName": "uncommitted"})
+            assert read_event_by_id(event)["eventName"] == "uncommitted"
+            raise RuntimeError("roll back")
+    except RuntimeError:
+        pass
+    assert read_event_by_id(event)["eventName"] == "Hackathon"
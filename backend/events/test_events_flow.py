@@ -6,7 +6,7 @@ TO RUN IN VSCODE OR LOCALLY:
 -------------------------------------------------------------------
 1. Open a terminal in the project root (event-browsing-app/).
 2. Reset the database (drops & recreates all tables):
-       python backend/db/currentDB.py
+       python backend/db/currentDB.py --reset
         *** THIS STEP (step 2) WILL WIPE ALL EXISTING DATA IN THE DB FOR DEVELOPMENT PURPOSES ***
 3. Run the script with module syntax:
        python -m backend.events.test_events_flow
@@ -43,6 +43,7 @@ This script demonstrates the full end-to-end flow of the backend:
        • Description keyword
        • Category
        • Date range
+       • Full-text (FTS5, ranked prefix match)
    - Confirms filtering and retrieval logic
 
 6. Update Tests
@@ -62,6 +63,7 @@ This script demonstrates the full end-to-end flow of the backend:
 """
 
 import os, sqlite3
+from backend.events.categories import attach_categories
 from backend.events.create import create_event
 from backend.events.read import read_events, read_event_by_id
 from backend.events.update import update_event
@@ -70,6 +72,7 @@ from backend.events.hard_delete import hard_delete_event
 from backend.rsvp.rsvp import add_rsvp, cancel_rsvp, get_event_rsvps, get_user_rsvps
 from backend.liking_log.liking_log import add_like, remove_like, get_event_likes, get_user_likes
 from backend.searching_logic.searching_logic import search_by_title, search_by_date, search_by_category, search_by_description
+from backend.searching_logic.full_text_search import search_events
 
 # -----------------------------
 # DATABASE PATH
@@ -149,9 +152,10 @@ if __name__ == "__main__":
     print("\n=== Search Tests ===")
     print("Title 'Hackathon':", search_by_title(read_events(), "Hackathon"))
     print("Description 'statistics':", search_by_description(read_events(), "statistics"))
-    print("Category 'Sports':", search_by_category(read_events(), ["Sports"]))
+    print("Category 'Sports':", search_by_category(attach_categories(read_events()), ["Sports"]))
     print("Date 2025-11-01 to 2025-11-07:",
           search_by_date(read_events(), "2025-11-01", "2025-11-07"))
+    print("Full-text 'hack lib':", search_events("hack lib"))
 
     # -----------------------------
     # 6. Update Tests
@@ -0,0 +1,85 @@
+"""
+Tests for events/import_export.py (run: python -m pytest -q).
+"""
+
+import pytest
+
+from backend.db.connection import get_conn
+from backend.events import import_export
+from backend.events.create import create_event
+from backend.events.import_export import export_events, export_file, import_events, import_file, read_ical
+from backend.events.soft_delete import soft_delete_event
+
+FIELDS = ("eventName", "eventDescription", "location", "eventType", "eventAccess",
+          "startDateTime", "endDateTime")
+
+
+@pytest.fixture
+def events(db):
+    create_event(1, "Hack; Night, v2", "line one\nline two with a literal \\n and \\, here",
+                 "Library Lab", "Computer Science", "2099-11-01T09:00", "2099-11-01T21:00")
+    create_event(2, "Café Émile", "Längere Beschreibung " * 8, "Ross Hall", "Math",
+                 "2099-11-02 09:00:00", "2099-11-02 10:00:00", eventAccess="Private")
+    cancelled = create_event(1, "Rained out", "d", "Field", "Sports",
+                             "2099-11-03", "2099-11-03 12:00:00")
+    assert soft_delete_event(cancelled, 1)
+    return _snapshot()
+
+
+def _snapshot():
+    with get_conn() as conn:
+        rows = conn.execute(f"SELECT {', '.join(FIELDS)} FROM events ORDER BY startDateTime").fetchall()
+    return [tuple(row) for row in rows]
+
+
+def _canonical(rows):
+    return [tuple(import_export.normalize_datetime(v) if f.endswith("DateTime") else v
+                  for f, v in zip(FIELDS, row)) for row in rows]
+
+
+@pytest.mark.parametrize("fmt", ["csv", "jsonl", "ics"])
+def test_round_trip(events, tmp_path, fmt):
+    path = str(tmp_path / f"backup.{fmt}")
+    export_file(path, fmt)
+    with get_conn() as conn:
+        conn.execute("DELETE FROM events")
+
+    report = import_file(path, creatorID=99)
+    assert report == {"inserted": 3, "errors": []}
+    assert _snapshot() == _canonical(events)
+
+
+def test_ical_lines_are_folded_and_escaped(events):
+    feed = "".join(export_events("ics"))
+    assert all(len(line.encode("utf-8")) <= import_export.ICAL_LINE_OCTETS for line in feed.split("\r\n"))
+    assert "SUMMARY:Hack\\; Night\\, v2" in feed
+    assert "DTSTART:20991101T090000" in feed
+    assert "STATUS:CANCELLED" in feed
+
+
+def test_ical_text_unescapes_in_one_pass():
+    assert import_export._ical_text("a\\\\nb") == "a\\nb"
+    assert import_export._ical_text("a\\nb\\;c\\,d") == "a\nb;c,d"
+
+
+def test_unreadable_stored_date_is_skipped_not_fatal(events):
+    with get_conn() as conn:
+        conn.execute("UPDATE events SET startDateTime = 'soon' WHERE eventName = 'Rained out'")
+    feed = list(read_ical(iter("".join(export_events("ics")).splitlines(keepends=True))))
+    assert [e["eventName"] for e in feed] == ["Hack; Night, v2", "Café Émile"]
+
+
+def test_bad_rows_are_reported_and_skipped(db):
+    rows = [
+        {"eventName": "ok", "eventDescription": "d", "location": "L", "eventType": "Sports",
+         "startDateTime": "2099-01-01T10:00", "endDateTime": "2099-01-01 11:00:00"},
+        {"eventName": "bad date", "eventDescription": "d", "location": "L", "eventType": "Sports",
+         "startDateTime": "next week", "endDateTime": "2099-01-01 11:00:00"},
+        {"eventName": "unknown creator", "eventDescription": "d", "location": "L", "eventType": "Sports",
+         "startDateTime": "2099-01-01", "endDateTime": "2099-01-02", "creatorID": 404},
+        ValueError("invalid JSON"),
+    ]
+    report = import_events(rows, creatorID=1)
+    assert report["inserted"] == 1
+    assert [number for number, _ in report["errors"]] == [2, 3, 4]
+    assert _snapshot()[0][5] == "2099-01-01 10:00:00"
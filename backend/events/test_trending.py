@@ -0,0 +1,76 @@
+"""
+Tests for events/trending.py (run: python -m pytest -q).
+"""
+
+import pytest
+
+from backend.db import connection
+from backend.events import trending
+from backend.events.create import create_event
+from backend.liking_log.liking_log import add_like, remove_like, toggle_like
+from backend.rsvp.rsvp import add_rsvp, cancel_rsvp
+
+
+@pytest.fixture
+def event(db):
+    with trending._lock:
+        trending._reset()
+    return create_event(1, "Hackathon", "24hr coding event", "Library Lab", "Computer Science",
+                        "2099-11-01 09:00:00", "2099-11-02 09:00:00")
+
+
+def _score(eventID, window="day"):
+    return dict(trending.trending_events(50, window)).get(eventID, 0.0)
+
+
+def test_like_unlike_like_leaves_one_like(event):
+    add_like(2, event)
+    once = _score(event)
+    assert once == pytest.approx(1.0, rel=1e-3)
+
+    remove_like(2, event)
+    assert _score(event) == 0.0
+
+    add_like(2, event)
+    assert _score(event) == pytest.approx(once, rel=1e-3)
+
+
+def test_toggling_cannot_pump_an_event(event):
+    for _ in range(21):       # like, unlike, ... ends liked
+        toggle_like(2, event)
+    assert _score(event) == pytest.approx(1.0, rel=1e-3)
+    assert _score(event, "hour") == pytest.approx(1.0, rel=1e-3)
+
+
+def test_cancelled_rsvp_is_subtracted(event):
+    add_rsvp(2, event)
+    add_like(3, event)
+    assert _score(event) == pytest.approx(trending.RSVP_WEIGHT + trending.LIKE_WEIGHT, rel=1e-3)
+    cancel_rsvp(2, event)
+    assert _score(event) == pytest.approx(trending.LIKE_WEIGHT, rel=1e-3)
+
+
+def test_retraction_seen_by_a_fresh_process(event):
+    add_like(2, event)
+    remove_like(2, event)
+    add_like(3, event)
+    with trending._lock:
+        trending._reset()   # as a new process would start
+    assert _score(event) == pytest.approx(1.0, rel=1e-3)
+
+
+def test_old_feed_entries_are_pruned(event):
+    with connection.get_conn() as conn:
+        conn.execute(
+            "INSERT INTO engagementLog (eventID, kind, createdAt) VALUES (?, 'like', '2000-01-01 00:00:00')",
+            (event,),
+        )
+    add_like(2, event)  # any insert prunes entries past the retention horizon
+    with connection.get_conn() as conn:
+        oldest = conn.execute("SELECT MIN(createdAt) FROM engagementLog").fetchone()[0]
+    assert oldest > "2000-01-01 00:00:00"
+
+
+def test_invalid_window(event):
+    with pytest.raises(ValueError):
+        trending.trending_events(5, window="month")
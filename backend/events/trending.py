@@ -0,0 +1,254 @@
+"""
+=========================================================
+TRENDING EVENTS ("popular now", time-decayed engagement)
+=========================================================
+
+Purpose:
+- Feeds the HomePage "popular now" strip: events ranked by recent likes
+  and RSVPs, where each one counts less the older it gets (exponential
+  decay with a half-life per window: hour / day / week).
+- Answers trending_events(k, window) from memory instead of a GROUP BY
+  over the whole likesLog on every request.
+
+What Changed:
+- New module. Uses the createdAt timestamps on likesLog/rsvpLog
+  (currentDB migration 8); rows from before that migration have no time
+  and are ignored.
+- Scores use forward decay: each like/RSVP adds weight · 2^((t - T0) / half_life)
+  for a fixed landmark T0, kept in log space. Adding activity is one
+  update to one event and never rescales the others; relative order never
+  changes with time, so the ranking stays valid between updates.
+- Each window keeps a max-heap of (score, eventID) entries. Updates push a
+  new entry and leave the old one behind; queries walk the heap best-first
+  and skip outdated entries, so top-k costs O(k log k), not O(events).
+  The heap is compacted (and long-cold events dropped) once stale
+  entries pile up.
+- New likes/RSVPs are pulled before each answer from engagementLog
+  (currentDB migration 12) with a seq watermark (seq > last seen, a
+  primary-key range read), so every process sees every writer's activity
+  without hooks in the write path. seq is AUTOINCREMENT and never reused,
+  unlike likesLog/rsvpLog rowids.
+- Unlikes/cancelled RSVPs arrive as retractions (delta = -1, migration 14)
+  carrying the removed row's createdAt, and subtract exactly what that row
+  added: like → unlike → like leaves one like's worth of score, so
+  toggling cannot push an event up. The feed only keeps
+  ENGAGEMENT_RETENTION_DAYS of history, so a fresh process reads a bounded
+  amount on its first call.
+- If the feed was recreated under a running process (currentDB --reset),
+  the scores are dropped and rebuilt from the new feed.
+- Only upcoming Public events are returned (checked in one query per page
+  of candidates, so soft-deleted events drop out at once).
+
+Frontend Use:
+- HomePage "popular now" → trending_events(k=10, window="day")
+  → [(eventID, score)], best first; score is the decayed like/RSVP count.
+"""
+
+import heapq
+import json
+import math
+import threading
+import time
+from datetime import datetime
+
+from backend.db.connection import get_conn
+
+# -----------------------------
+# SETTINGS
+# -----------------------------
+WINDOWS = {                 # window name → half-life in seconds
+    "hour": 3600.0,
+    "day": 86400.0,
+    "week": 7 * 86400.0,
+}
+LIKE_WEIGHT = 1.0
+RSVP_WEIGHT = 2.0
+KIND_WEIGHTS = {"like": LIKE_WEIGHT, "rsvp": RSVP_WEIGHT}   # engagementLog.kind → weight
+MIN_SCORE = 1e-3            # events decayed below this are dropped at compaction
+
+_LN2 = math.log(2.0)
+_CANCELLED = 1e-9           # log-score gap below which a retraction cancels everything left
+
+
+def _seconds(timestamp: str) -> float:
+    """'YYYY-MM-DD HH:MM:SS' (local time) → POSIX seconds."""
+    return datetime.fromisoformat(timestamp).timestamp()
+
+
+def _log_add(a: float, b: float) -> float:
+    """log(e^a + e^b) without overflow."""
+    if a < b:
+        a, b = b, a
+    return a + math.log1p(math.exp(b - a))
+
+
+def _log_sub(a: float, b: float) -> float | None:
+    """log(e^a - e^b), or None if that is (up to rounding) zero or less."""
+    if b >= a - _CANCELLED:
+        return None
+    return a + math.log1p(-math.exp(b - a))
+
+
+# -----------------------------
+# DECAYED SCORES + HEAP
+# -----------------------------
+class DecayedTopK:
+    """Forward-decayed scores for one half-life plus a lazily cleaned max-heap."""
+
+    def __init__(self, half_life: float, landmark: float):
+        self.rate = _LN2 / half_life    # log-score gained per second after the landmark
+        self.landmark = landmark
+        self._keys = {}                 # eventID → log(Σ weight · e^(rate · (t - landmark)))
+        self._heap = []                 # (-key, eventID); outdated entries stay until compaction
+
+    def add(self, eventID: int, weight: float, when: float):
+        """Record `weight` worth of activity on an event at time `when` (POSIX seconds)."""
+        term = math.log(weight) + self.rate * (when - self.landmark)
+        key = self._keys.get(eventID)
+        key = term if key is None else _log_add(key, term)
+        self._keys[eventID] = key
+        heapq.heappush(self._heap, (-key, eventID))
+
+    def remove(self, eventID: int, weight: float, when: float):
+        """Retract `weight` recorded at `when` (an unlike / cancelled RSVP)."""
+        key = self._keys.get(eventID)
+        if key is None:  # its activity was never seen (or already decayed away)
+            return
+        key = _log_sub(key, math.log(weight) + self.rate * (when - self.landmark))
+        if key is None:
+            del self._keys[eventID]
+        else:
+            self._keys[eventID] = key
+            heapq.heappush(self._heap, (-key, eventID))
+
+    def score(self, eventID: int, now: float) -> float:
+        """Decayed score at `now` (0.0 for events without activity)."""
+        key = self._keys.get(eventID)
+        return 0.0 if key is None else math.exp(key - self.rate * (now - self.landmark))
+
+    def ranked(self):
+        """
+        Yield eventIDs best first. Walks the heap as a tree (children are never
+        better than their parent), expanding only the branches it needs.
+        """
+        heap, keys = self._heap, self._keys
+        if not heap:
+            return
+        frontier = [(heap[0], 0)]
+        seen = set()
+        while frontier:
+            (neg_key, eventID), i = heapq.heappop(frontier)
+            if eventID not in seen and keys.get(eventID) == -neg_key:
+                seen.add(eventID)
+                yield eventID
+            for child in (2 * i + 1, 2 * i + 2):
+                if child < len(heap):
+                    heapq.heappush(frontier, (heap[child], child))
+
+    def compact(self, now: float):
+        """Drop outdated heap entries and events whose score decayed below MIN_SCORE."""
+        if len(self._heap) <= 2 * len(self._keys) + 64:
+            return
+        floor = math.log(MIN_SCORE) + self.rate * (now - self.landmark)
+        self._keys = {e: key for e, key in self._keys.items() if key >= floor}
+        self._heap = [(-key, e) for e, key in self._keys.items()]
+        heapq.heapify(self._heap)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+# -----------------------------
+# SHARED STATE
+# -----------------------------
+_lock = threading.Lock()
+_landmark = time.time()
+_trackers = {}
+_seq = 0            # watermark: last engagementLog seq folded in
+_seq_event = None   # eventID of that row (to notice a recreated feed)
+
+
+def _reset():
+    """Forget every score and start reading the feed from the beginning (caller holds _lock)."""
+    global _trackers, _seq, _seq_event
+    _trackers = {name: DecayedTopK(half_life, _landmark) for name, half_life in WINDOWS.items()}
+    _seq, _seq_event = 0, None
+
+
+_reset()
+
+
+def _feed_recreated(conn) -> bool:
+    """True if engagementLog restarted below the watermark (table dropped and rebuilt)."""
+    if not _seq:
+        return False
+    top = conn.execute("SELECT seq FROM sqlite_sequence WHERE name = 'engagementLog'").fetchone()
+    if top is None or top[0] < _seq:
+        return True
+    row = conn.execute("SELECT eventID FROM engagementLog WHERE seq = ?", (_seq,)).fetchone()
+    return row is not None and row[0] != _seq_event
+
+
+def _pull(conn):
+    """Fold likes/RSVPs newer than the watermark into every window (caller holds _lock)."""
+    global _seq, _seq_event
+    if _feed_recreated(conn):
+        _reset()
+    rows = conn.execute(
+        "SELECT seq, eventID, kind, createdAt, delta FROM engagementLog WHERE seq > ? ORDER BY seq", (_seq,)
+    ).fetchall()
+    for _, eventID, kind, createdAt, delta in rows:
+        weight, when = KIND_WEIGHTS[kind], _seconds(createdAt)
+        for tracker in _trackers.values():
+            if delta > 0:
+                tracker.add(eventID, weight, when)
+            else:
+                tracker.remove(eventID, weight, when)
+    if rows:
+        _seq, _seq_event = rows[-1][0], rows[-1][1]
+
+
+def _visible(conn, eventIDs: list[int]) -> set[int]:
+    """The upcoming Public events among eventIDs."""
+    rows = conn.execute("""
+        SELECT eventID FROM events
+        WHERE eventID IN (SELECT value FROM json_each(?))
+          AND eventAccess = 'Public' AND endDateTime >= ?
+    """, (json.dumps(eventIDs), datetime.now().strftime("%Y-%m-%d %H:%M:%S"))).fetchall()
+    return {row[0] for row in rows}
+
+
+# -----------------------------
+# PUBLIC API
+# -----------------------------
+def trending_events(k: int = 10, window: str = "day") -> list[tuple[int, float]]:
+    """
+    Top-k upcoming Public events by decayed like/RSVP activity.
+    window: "hour", "day" or "week" (the half-life of a like's weight).
+    Returns [(eventID, score)], best first; events without timed activity
+    are not included.
+    """
+    if window not in WINDOWS:
+        raise ValueError(f"window must be one of: {sorted(WINDOWS)}")
+    with get_conn() as conn, _lock:
+        _pull(conn)
+        tracker = _trackers[window]
+        now = time.time()
+        tracker.compact(now)
+        ranked = tracker.ranked()
+        picked = []
+        while len(picked) < k:
+            batch = [eventID for _, eventID in zip(range(2 * k), ranked)]
+            if not batch:
+                break
+            visible = _visible(conn, batch)
+            picked += [eventID for eventID in batch if eventID in visible][:k - len(picked)]
+        return [(eventID, tracker.score(eventID, now)) for eventID in picked]
+
+
+def trending_stats() -> dict:
+    with _lock:
+        return {
+            "seq": _seq,
+            **{f"{name}_events": len(tracker) for name, tracker in _trackers.items()},
+        }
@@ -1,5 +1,10 @@
-import os
-import sqlite3
+from backend.db.connection import unit_of_work
+from backend.events.cache import invalidate_event
+from backend.events.categories import set_event_categories
+from backend.events.create import ALLOWED_EVENT_TYPES
+from backend.images.image_store import release_image, store_image
+from backend.recommendations.recommendations import event_changed
+from backend.UserAccounts.authorization import can_edit
 
 """
 =========================================================
@@ -14,6 +19,19 @@ What Changed:
 - Authorization check against accounts table (Faculty override allowed).
 - Dynamic query building supports partial updates (any subset of fields).
 - Validation against ALLOWED_UPDATE_FIELDS ensures schema consistency.
+- "images" updates are written to the image store; the event keeps imageHash
+  and the previous image is released if nothing else uses it.
+- Successful updates drop the event from the read cache after commit; an
+  eventAccess / endDateTime change is passed on to the "For You" model.
+- Authorization check reuses the update's pooled connection (no second connect).
+- updater_id may be a session token: its signed accountID/accountType are
+  used instead of reading the accounts table.
+- Authorization lives in UserAccounts/authorization.py (shared with the
+  delete paths, role lookups cached).
+- Runs as a unit of work (BEGIN IMMEDIATE): the read-then-write takes the
+  write lock once, up front, instead of upgrading mid-transaction.
+- "categories" replaces the event's extra categories in eventCategories
+  (eventType always stays one of them).
 
 Frontend Use:
 - "Edit Event" page → submit only the changed fields → call update_event().
@@ -22,45 +40,20 @@ Frontend Use:
 """
 
 
-# -----------------------------
-# DATABASE PATH
-# -----------------------------
-BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-DB_PATH = os.path.join(BASE_DIR, "db", "EventPlannerDB.db")
-
 # Allowed fields for update
 ALLOWED_UPDATE_FIELDS = {
     "eventName", "eventDescription", "location", "images",
     "eventType", "eventAccess", "startDateTime", "endDateTime",
-    "rsvpRequired", "isPriced", "cost"
+    "rsvpRequired", "isPriced", "cost", "categories"
 }
 
-def _get_conn():
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    return conn
-
-# -----------------------------
-# AUTHORIZATION HELPER
-# -----------------------------
-def _is_authorized(updater_id: int, event_creator_id: int) -> bool:
-    """
-    Authorized if updater is event creator OR Faculty account.
-    """
-    with _get_conn() as conn:
-        cur = conn.cursor()
-        cur.execute("SELECT accountType FROM accounts WHERE accountID = ?", (updater_id,))
-        row = cur.fetchone()
-        if not row:
-            return False
-        return updater_id == event_creator_id or row[0] == "Faculty"
-
 # -----------------------------
 # UPDATE FUNCTION
 # -----------------------------
-def update_event(event_id: int, updater_id: int, updates: dict) -> bool:
+def update_event(event_id: int, updater_id: int | str, updates: dict) -> bool:
     """
     Update selected fields of an event.
+    updater_id: accountID or session token (session.py).
     Returns True if successful, False if not authorized or not found.
     """
     if not updates:
@@ -70,24 +63,43 @@ def update_event(event_id: int, updater_id: int, updates: dict) -> bool:
     bad_keys = [k for k in updates.keys() if k not in ALLOWED_UPDATE_FIELDS]
     if bad_keys:
         raise ValueError(f"Illegal update fields: {bad_keys}")
+    categories = updates.get("categories")
+    if categories is not None and not set(categories) <= ALLOWED_EVENT_TYPES:
+        raise ValueError(f"categories must be from: {sorted(ALLOWED_EVENT_TYPES)}")
 
-    with _get_conn() as conn:
+    with unit_of_work() as conn:
         cur = conn.cursor()
 
-        # Fetch creatorID
-        cur.execute("SELECT creatorID FROM events WHERE eventID = ?", (event_id,))
+        # Fetch creatorID (+ current image so a replaced one can be released)
+        cur.execute("SELECT creatorID, imageHash FROM events WHERE eventID = ?", (event_id,))
         row = cur.fetchone()
         if not row:
             return False
-        creator_id = row[0]
+        creator_id, old_image = row[0], row[1]
 
-        if not _is_authorized(updater_id, creator_id):
+        if not can_edit(updater_id, creator_id, conn):
             return False
 
-        # Build dynamic query
-        set_clause = ", ".join([f"{k} = ?" for k in updates.keys()])
-        params = list(updates.values()) + [event_id]
-
-        cur.execute(f"UPDATE events SET {set_clause} WHERE eventID = ?", params)
-        conn.commit()
-        return cur.rowcount > 0
+        # Image bytes go to the image store; the row only keeps the hash
+        updates = dict(updates)
+        categories = updates.pop("categories", None)
+        if "images" in updates:
+            images = updates.pop("images")
+            updates["imageHash"] = store_image(conn, images) if images is not None else None
+
+        # Build dynamic query (a categories-only update has no column to set)
+        updated = True
+        if updates:
+            set_clause = ", ".join([f"{k} = ?" for k in updates.keys()])
+            params = list(updates.values()) + [event_id]
+
+            cur.execute(f"UPDATE events SET {set_clause} WHERE eventID = ?", params)
+            updated = cur.rowcount > 0
+        if updated and "imageHash" in updates and updates["imageHash"] != old_image:
+            release_image(conn, old_image)
+        if updated and categories is not None:
+            set_event_categories(conn, event_id, categories)
+        if updated:
+            invalidate_event(event_id)
+            event_changed(event_id, updates.get("eventAccess"), updates.get("endDateTime"))
+        return updated
@@ -0,0 +1,96 @@
+"""
+=========================================================
+IMAGE STORE (content-addressed event images)
+=========================================================
+
+Purpose:
+- Stores event image bytes once, keyed by their SHA-256 hash, in the
+  imageStore table (see migration 4 in currentDB.py).
+- Events only carry `imageHash`, so listing/search queries never load
+  image bytes.
+- Streams image bytes in chunks for the image endpoint.
+
+What Changed:
+- Replaces the `events.images` BLOB column.
+- Identical uploads share one imageStore row (deduplicated by hash).
+- Reads use SQLite incremental BLOB I/O (Connection.blobopen), so an
+  image is never copied into one big bytes object; connections enable
+  PRAGMA mmap_size, so those page reads are memory-mapped where the OS
+  allows it.
+- Images no longer referenced by any event are removed by
+  release_image() / prune_images().
+
+Frontend Use:
+- Event cards/details get `imageHash` → build an image URL such as
+  GET /events/<eventID>/image, served by read.read_event_image().
+- Create/Edit Event forms still upload raw bytes; create_event() and
+  update_event() call store_image() for you.
+"""
+
+import hashlib
+import sqlite3
+
+from backend.db.connection import get_conn
+
+CHUNK_SIZE = 64 * 1024  # bytes per streamed chunk
+
+
+def image_hash(data: bytes) -> str:
+    """SHA-256 hex digest used as the image's key."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def store_image(conn: sqlite3.Connection, data: bytes) -> str:
+    """
+    Save image bytes (if not already stored) on the caller's connection.
+    Returns the imageHash to put on the event row.
+    """
+    digest = image_hash(data)
+    conn.execute(
+        "INSERT OR IGNORE INTO imageStore (imageHash, byteSize, data) VALUES (?, ?, ?)",
+        (digest, len(data), data),
+    )
+    return digest
+
+
+def release_image(conn: sqlite3.Connection, imageHash: str | None) -> bool:
+    """
+    Delete an image if no event references it any more.
+    Call after an event's imageHash was changed or the event was deleted.
+    """
+    if imageHash is None:
+        return False
+    cur = conn.execute("""
+        DELETE FROM imageStore
+        WHERE imageHash = ?
+          AND NOT EXISTS (SELECT 1 FROM events WHERE imageHash = ?)
+    """, (imageHash, imageHash))
+    return cur.rowcount > 0
+
+
+def iter_image(imageHash: str, chunk_size: int = CHUNK_SIZE):
+    """
+    Yield the stored bytes for `imageHash` in chunks of `chunk_size`.
+    Yields nothing if the image does not exist.
+    Holds its own pooled connection until the generator is finished/closed.
+    """
+    with get_conn(shared=False) as conn:
+        row = conn.execute("SELECT rowid FROM imageStore WHERE imageHash = ?", (imageHash,)).fetchone()
+        if not row:
+            return
+        with conn.blobopen("imageStore", "data", row[0], readonly=True) as blob:
+            while True:
+                chunk = blob.read(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+
+
+def prune_images() -> int:
+    """Maintenance: delete every image no event points at. Returns rows removed."""
+    with get_conn() as conn:
+        cur = conn.execute("""
+            DELETE FROM imageStore
+            WHERE imageHash NOT IN (SELECT imageHash FROM events WHERE imageHash IS NOT NULL)
+        """)
+        return cur.rowcount
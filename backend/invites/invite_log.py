@@ -0,0 +1,201 @@
+"""
+=========================================================
+INVITE LOG (inviteLog table integration)
+=========================================================
+
+Purpose:
+- Manage invitations to (usually Private) events: invite, uninvite,
+  check, and list invites per event or per user.
+- Each invite = user (accountID) ↔ event (eventID).
+
+What Changed:
+- First Python module for the inviteLog table defined in currentDB.py.
+- Same API shape as rsvp.py / liking_log.py, including bulk variants so
+  inviting a whole list of users is one call.
+- invite_users() fans one event out to thousands of accounts: authorized
+  (creator or Faculty), one BEGIN IMMEDIATE transaction, INVITE_CHUNK
+  accountIDs per INSERT ... SELECT; unknown accounts are skipped.
+- Invites record when they were sent (createdAt); get_inbox() pages a
+  user's invites newest first off idx_inviteLog_inbox (keyset token, no
+  OFFSET).
+- The access rule for Private events (creator, Faculty or invited) is
+  authorization.can_view_event(); read_event_by_id(viewer_id=...) applies
+  it on the pooled connection it already uses.
+
+Frontend Use:
+- InviteUserSearch → selected users → invite_users(eventID, [userIDs], token).
+- Invites inbox → get_inbox(user, limit, page_token) → send back next_page_token.
+- Event page → has_invite_many(user, [ids]) to show "You're invited" badges.
+"""
+
+import base64
+import json
+
+from backend.db.connection import get_conn, unit_of_work
+from backend.events.read import projection_sql
+from backend.UserAccounts.authorization import can_edit, event_creators
+
+INVITE_CHUNK = 1000     # accountIDs per INSERT in invite_users()
+
+def has_invite(user_id: int, event_id: int) -> bool:
+    """Check if this user has been invited to this event."""
+    with get_conn() as conn:
+        cur = conn.cursor()
+        cur.execute("SELECT 1 FROM inviteLog WHERE accountID=? AND eventID=? LIMIT 1", (user_id, event_id))
+        return cur.fetchone() is not None
+
+def add_invite(user_id: int, event_id: int) -> bool:
+    """Invite a user to an event. Returns True only if the invite is new."""
+    with get_conn() as conn:
+        cur = conn.cursor()
+        cur.execute("""
+            INSERT INTO inviteLog (eventID, accountID, createdAt) VALUES (?, ?, datetime('now', 'localtime'))
+            ON CONFLICT (eventID, accountID) DO NOTHING
+        """, (event_id, user_id))
+        return cur.rowcount > 0
+
+def remove_invite(user_id: int, event_id: int) -> bool:
+    """Withdraw a user's invitation. Returns True only if one was removed."""
+    with get_conn() as conn:
+        cur = conn.cursor()
+        cur.execute("DELETE FROM inviteLog WHERE accountID=? AND eventID=?", (user_id, event_id))
+        return cur.rowcount > 0
+
+def get_event_invites(event_id: int) -> list[int]:
+    """Return list of accountIDs invited to this event."""
+    with get_conn() as conn:
+        cur = conn.cursor()
+        cur.execute("SELECT accountID FROM inviteLog WHERE eventID=?", (event_id,))
+        return [row[0] for row in cur.fetchall()]
+
+def get_user_invites(user_id: int) -> list[int]:
+    """Return list of eventIDs this user has been invited to."""
+    with get_conn() as conn:
+        cur = conn.cursor()
+        cur.execute("SELECT eventID FROM inviteLog WHERE accountID=?", (user_id,))
+        return [row[0] for row in cur.fetchall()]
+
+# -----------------------------
+# BULK HELPERS
+# Same shape as the likes/RSVP bulk helpers (json_each ID lists, executemany).
+# -----------------------------
+def has_invite_many(user_id: int, event_ids: list[int]) -> dict[int, bool]:
+    """Return {eventID: True/False} for whether this user has been invited to each event."""
+    ids = list(event_ids)
+    with get_conn() as conn:
+        cur = conn.cursor()
+        cur.execute("""
+            SELECT eventID FROM inviteLog
+            WHERE accountID = ? AND eventID IN (SELECT value FROM json_each(?))
+        """, (user_id, json.dumps(ids)))
+        found = {row[0] for row in cur.fetchall()}
+    return {event_id: event_id in found for event_id in ids}
+
+def get_event_invites_many(event_ids: list[int]) -> dict[int, list[int]]:
+    """Return {eventID: [accountIDs]} of invites for every given event (empty list if none)."""
+    ids = list(event_ids)
+    result = {event_id: [] for event_id in ids}
+    with get_conn() as conn:
+        cur = conn.cursor()
+        cur.execute("""
+            SELECT eventID, accountID FROM inviteLog
+            WHERE eventID IN (SELECT value FROM json_each(?))
+        """, (json.dumps(ids),))
+        for event_id, account_id in cur.fetchall():
+            result[event_id].append(account_id)
+    return result
+
+def add_invites_bulk(pairs: list[tuple[int, int]]) -> int:
+    """
+    Add many invites at once; pairs are (user_id, event_id) like the single version.
+    Already-existing pairs are skipped. Returns how many new invites were stored.
+    """
+    with get_conn() as conn:
+        cur = conn.cursor()
+        cur.executemany("""
+            INSERT INTO inviteLog (eventID, accountID, createdAt) VALUES (?, ?, datetime('now', 'localtime'))
+            ON CONFLICT (eventID, accountID) DO NOTHING
+        """, [(event_id, user_id) for user_id, event_id in pairs])
+        return max(cur.rowcount, 0)
+
+def remove_invites_bulk(pairs: list[tuple[int, int]]) -> int:
+    """Remove many invites at once; pairs are (user_id, event_id). Returns how many were removed."""
+    with get_conn() as conn:
+        cur = conn.cursor()
+        cur.executemany(
+            "DELETE FROM inviteLog WHERE accountID=? AND eventID=?",
+            [(user_id, event_id) for user_id, event_id in pairs],
+        )
+        return max(cur.rowcount, 0)
+
+# -----------------------------
+# FAN-OUT
+# -----------------------------
+def invite_users(event_id: int, user_ids: list[int], requester: int | str) -> int | None:
+    """
+    Invite many accounts to one event in a single transaction.
+    requester: accountID or session token; must be the creator or Faculty.
+    Unknown accountIDs and existing invites are skipped.
+    Returns the number of new invites, or None if the event does not exist
+    or the requester may not invite to it.
+    """
+    ids = list(dict.fromkeys(user_ids))
+    with unit_of_work() as conn:  # write lock taken once for every chunk
+        creator = event_creators([event_id], conn).get(event_id)
+        if creator is None or not can_edit(requester, creator, conn):
+            return None
+        invited = 0
+        for start in range(0, len(ids), INVITE_CHUNK):
+            cur = conn.execute("""
+                INSERT INTO inviteLog (eventID, accountID, createdAt)
+                SELECT ?, accountID, datetime('now', 'localtime') FROM accounts
+                WHERE accountID IN (SELECT value FROM json_each(?))
+                ON CONFLICT (eventID, accountID) DO NOTHING
+            """, (event_id, json.dumps(ids[start:start + INVITE_CHUNK])))
+            invited += cur.rowcount
+        return invited
+
+# -----------------------------
+# INBOX
+# Keyset pagination on (createdAt, eventID), newest first.
+# Token = urlsafe base64 of [createdAt, eventID] (same format as read.py's).
+# -----------------------------
+def _encode_inbox_token(row: dict) -> str:
+    raw = json.dumps([row["invitedAt"], row["eventID"]], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+def _decode_inbox_token(token: str) -> tuple:
+    try:
+        invited_at, event_id = json.loads(base64.urlsafe_b64decode(token.encode("ascii")))
+    except (ValueError, TypeError) as e:
+        raise ValueError("Invalid page token") from e
+    if not isinstance(invited_at, str) or not isinstance(event_id, int):
+        raise ValueError("Invalid page token")
+    return (invited_at, event_id)
+
+def get_inbox(user_id: int, limit: int = 20, page_token: str | None = None) -> tuple[list[dict], str | None]:
+    """
+    One page of the user's invites, newest first, with the event card and
+    invitedAt. Cancelled (Inactive) events are left out.
+    Returns (rows, next_page_token); next_page_token is None on the last page.
+    """
+    params = [user_id]
+    after = ""
+    if page_token:
+        after = " AND (i.createdAt, i.eventID) < (?, ?)"
+        params.extend(_decode_inbox_token(page_token))
+    cols = projection_sql("card", alias="e")  # same card columns as the event listings
+    with get_conn() as conn:
+        cur = conn.cursor()
+        cur.execute(f"""
+            SELECT i.createdAt AS invitedAt, {cols}
+            FROM inviteLog i JOIN events e ON e.eventID = i.eventID
+            WHERE i.accountID = ?{after} AND e.eventAccess IN ('Public','Private')
+            ORDER BY i.createdAt DESC, i.eventID DESC
+            LIMIT ?
+        """, params + [limit + 1])  # one extra row tells us whether another page exists
+        rows = [dict(r) for r in cur.fetchall()]
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    next_token = _encode_inbox_token(rows[-1]) if has_more and rows else None
+    return rows, next_token
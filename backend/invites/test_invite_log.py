@@ -0,0 +1,46 @@
+"""
+Tests for invites/invite_log.py (run: python -m pytest -q).
+"""
+
+from backend.events.create import create_event
+from backend.events.read import PROJECTIONS, read_event_by_id
+from backend.events.soft_delete import soft_delete_event
+from backend.invites.invite_log import get_inbox, invite_users
+
+
+def _event(name, access="Private"):
+    return create_event(1, name, "d", "Library Lab", "Computer Science",
+                        "2099-11-01 09:00:00", "2099-11-02 09:00:00", eventAccess=access)
+
+
+def test_inbox_rows_are_event_cards_plus_invited_at(db):
+    event = _event("Study group")
+    assert invite_users(event, [2, 3, 404], 1) == 2   # unknown account skipped
+    rows, token = get_inbox(2)
+    assert token is None
+    assert list(rows[0]) == ["invitedAt", *PROJECTIONS["card"]]
+    assert rows[0]["eventID"] == event
+
+
+def test_inbox_pages_newest_first_and_skips_cancelled(db):
+    events = [_event(f"Meetup {i}") for i in range(5)]
+    for event in events:
+        invite_users(event, [2], 1)
+    assert soft_delete_event(events[0], 1)
+
+    seen, token = [], None
+    while True:
+        rows, token = get_inbox(2, limit=2, page_token=token)
+        seen += [row["eventID"] for row in rows]
+        if token is None:
+            break
+    assert seen == events[:0:-1]
+
+
+def test_private_event_visible_to_invitees_only(db):
+    event = _event("Board meeting")
+    invite_users(event, [2], 1)
+    assert read_event_by_id(event, viewer_id=2) is not None
+    assert read_event_by_id(event, viewer_id=3) is None
+    assert read_event_by_id(event, viewer_id=99) is not None   # Faculty
+    assert invite_users(event, [3], 2) is None                 # only the creator/Faculty may invite
@@ -9,62 +9,161 @@ Purpose:
   linking a user (accountID) and an event (eventID).
 
 What Changed:
-- Uses a shared DB path resolver so it always points to backend/db/EventPlannerDB.db.
+- Uses the shared pooled connection (backend/db/connection.py) so it always points to backend/db/EventPlannerDB.db.
 - Adds functions to check, insert, remove, and query likes.
 - Returns lists of user IDs or event IDs for flexibility.
-- Prevents duplicate likes with a `has_liked` check.
+- Duplicate likes are absorbed by INSERT ... ON CONFLICT DO NOTHING (one
+  statement, no check-then-insert race); add/remove report whether
+  anything changed.
+- toggle_like() flips a like and returns the new state + count in one call.
+- Every write that changes a like invalidates that event in the event cache.
+- Bulk variants (has_liked_many, get_event_likes_many, add_likes_bulk,
+  remove_likes_bulk) answer a whole feed page in one query instead of N.
+- events.numberLikes is kept in step by triggers on likesLog (same
+  transaction as the like/unlike); read it with get_event_like_count().
+- Every like row records when it was made (createdAt, local time), which
+  events/trending.py uses for its time-decayed "popular now" scores.
 
 Frontend Use:
 - React frontend can call API endpoints that wrap these functions
   (e.g., POST /like, DELETE /like, GET /likes).
+- Heart button → POST /like/toggle → toggle_like() → (userLiked, likes).
+- Feed page → has_liked_many(user, [ids on page]) for the "liked by me" hearts.
 """
 
-import os, sqlite3
+import json
 
-BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-DB_PATH = os.path.join(BASE_DIR, "db", "EventPlannerDB.db")
-
-def _get_conn():
-    """Helper: open a SQLite connection with row_factory enabled."""
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    return conn
+from backend.db.connection import get_conn
+from backend.events.cache import invalidate_event, invalidate_events
 
 def has_liked(user_id: int, event_id: int) -> bool:
     """Check if the user already liked this event."""
-    with _get_conn() as conn:
+    with get_conn() as conn:
         cur = conn.cursor()
         cur.execute("SELECT 1 FROM likesLog WHERE accountID=? AND eventID=? LIMIT 1", (user_id, event_id))
         return cur.fetchone() is not None
 
-def add_like(user_id: int, event_id: int):
-    """Add a like to the event (only if not already liked)."""
-    if has_liked(user_id, event_id):
-        return False
-    with _get_conn() as conn:
+def add_like(user_id: int, event_id: int) -> bool:
+    """
+    Add a like to the event (only if not already liked).
+    Single idempotent INSERT; returns True only if a new like was stored.
+    """
+    with get_conn() as conn:
+        cur = conn.cursor()
+        cur.execute("""
+            INSERT INTO likesLog (eventID, accountID, createdAt) VALUES (?, ?, datetime('now', 'localtime'))
+            ON CONFLICT (eventID, accountID) DO NOTHING
+        """, (event_id, user_id))
+        changed = cur.rowcount > 0
+        if changed:
+            invalidate_event(event_id)
+        return changed
+
+def remove_like(user_id: int, event_id: int) -> bool:
+    """Remove a like from the event. Returns True only if a like was removed."""
+    with get_conn() as conn:
         cur = conn.cursor()
-        cur.execute("INSERT INTO likesLog (eventID, accountID) VALUES (?, ?)", (event_id, user_id))
-        conn.commit()
-        return True
+        cur.execute("DELETE FROM likesLog WHERE accountID=? AND eventID=?", (user_id, event_id))
+        changed = cur.rowcount > 0
+        if changed:
+            invalidate_event(event_id)
+        return changed
 
-def remove_like(user_id: int, event_id: int):
-    """Remove a like from the event."""
-    with _get_conn() as conn:
+def toggle_like(user_id: int, event_id: int) -> tuple[bool, int]:
+    """
+    Flip the user's like on this event in one transaction
+    (mirrors toggleLike in src/context/EventsContext.tsx).
+    Returns (userLiked, numberLikes) after the toggle.
+    """
+    with get_conn() as conn:
         cur = conn.cursor()
         cur.execute("DELETE FROM likesLog WHERE accountID=? AND eventID=?", (user_id, event_id))
-        conn.commit()
-        return cur.rowcount > 0
+        liked = cur.rowcount == 0
+        if liked:
+            cur.execute("""
+                INSERT INTO likesLog (eventID, accountID, createdAt) VALUES (?, ?, datetime('now', 'localtime'))
+                ON CONFLICT (eventID, accountID) DO NOTHING
+            """, (event_id, user_id))
+        invalidate_event(event_id)
+        cur.execute("SELECT numberLikes FROM events WHERE eventID = ?", (event_id,))
+        row = cur.fetchone()
+        return liked, row[0] if row else 0
 
 def get_event_likes(event_id: int) -> list[int]:
     """Return list of all accountIDs that liked this event."""
-    with _get_conn() as conn:
+    with get_conn() as conn:
         cur = conn.cursor()
         cur.execute("SELECT accountID FROM likesLog WHERE eventID=?", (event_id,))
         return [row[0] for row in cur.fetchall()]
 
+def get_event_like_count(event_id: int) -> int:
+    """Return the number of likes on this event (maintained counter, no log scan)."""
+    with get_conn() as conn:
+        cur = conn.cursor()
+        cur.execute("SELECT numberLikes FROM events WHERE eventID = ?", (event_id,))
+        row = cur.fetchone()
+        return row[0] if row else 0
+
 def get_user_likes(user_id: int) -> list[int]:
     """Return list of all eventIDs this user has liked."""
-    with _get_conn() as conn:
+    with get_conn() as conn:
         cur = conn.cursor()
         cur.execute("SELECT eventID FROM likesLog WHERE accountID=?", (user_id,))
         return [row[0] for row in cur.fetchall()]
+
+# -----------------------------
+# BULK HELPERS
+# Constant number of statements no matter how many events/pairs.
+# ID lists are passed as one JSON parameter (json_each), so there is no
+# SQLite variable limit and the statement text never changes.
+# -----------------------------
+def has_liked_many(user_id: int, event_ids: list[int]) -> dict[int, bool]:
+    """Return {eventID: True/False} for whether this user has liked each event."""
+    ids = list(event_ids)
+    with get_conn() as conn:
+        cur = conn.cursor()
+        cur.execute("""
+            SELECT eventID FROM likesLog
+            WHERE accountID = ? AND eventID IN (SELECT value FROM json_each(?))
+        """, (user_id, json.dumps(ids)))
+        found = {row[0] for row in cur.fetchall()}
+    return {event_id: event_id in found for event_id in ids}
+
+def get_event_likes_many(event_ids: list[int]) -> dict[int, list[int]]:
+    """Return {eventID: [accountIDs]} of likes for every given event (empty list if none)."""
+    ids = list(event_ids)
+    result = {event_id: [] for event_id in ids}
+    with get_conn() as conn:
+        cur = conn.cursor()
+        cur.execute("""
+            SELECT eventID, accountID FROM likesLog
+            WHERE eventID IN (SELECT value FROM json_each(?))
+        """, (json.dumps(ids),))
+        for event_id, account_id in cur.fetchall():
+            result[event_id].append(account_id)
+    return result
+
+def add_likes_bulk(pairs: list[tuple[int, int]]) -> int:
+    """
+    Add many likes at once; pairs are (user_id, event_id) like the single version.
+    Already-existing pairs are skipped. Returns how many new likes were stored.
+    """
+    with get_conn() as conn:
+        cur = conn.cursor()
+        cur.executemany("""
+            INSERT INTO likesLog (eventID, accountID, createdAt) VALUES (?, ?, datetime('now', 'localtime'))
+            ON CONFLICT (eventID, accountID) DO NOTHING
+        """, [(event_id, user_id) for user_id, event_id in pairs])
+        invalidate_events({event_id for _, event_id in pairs})
+        return max(cur.rowcount, 0)
+
+def remove_likes_bulk(pairs: list[tuple[int, int]]) -> int:
+    """Remove many likes at once; pairs are (user_id, event_id). Returns how many were removed."""
+    with get_conn() as conn:
+        cur = conn.cursor()
+        cur.executemany(
+            "DELETE FROM likesLog WHERE accountID=? AND eventID=?",
+            [(user_id, event_id) for user_id, event_id in pairs],
+        )
+        invalidate_events({event_id for _, event_id in pairs})
+        return max(cur.rowcount, 0)
@@ -0,0 +1,525 @@
+"""
+=========================================================
+"FOR YOU" RECOMMENDATIONS (item-item collaborative filtering)
+=========================================================
+
+Purpose:
+- Personalized discovery beyond the chronological listing and search:
+  recommend(user_id, k) returns the k upcoming Public events most similar
+  to what the user already liked / RSVP'd to.
+- Answered from memory (precomputed neighbor lists), so a request costs
+  a few dict lookups per item the user interacted with, no SQL.
+
+What Changed:
+- New module. A batch build reads likesLog, rsvpLog, events.eventType and
+  eventCategories once and stores them as sparse matrices in CSR form
+  (CSRMatrix, stdlib arrays in place of SciPy):
+    - user × event  (weight: LIKE_WEIGHT per like + RSVP_WEIGHT per RSVP)
+    - event × category
+- Item-item similarity = cosine over the user × event columns (co-occurring
+  users), plus CATEGORY_WEIGHT × category overlap. Each event keeps its top
+  NEIGHBORS similar events; the most-engaged events of its categories are
+  offered as candidates too, so events without likes still get neighbors.
+- Incremental refresh: new likes/RSVPs are pulled with a rowid watermark
+  (rowid > last seen) and folded into the co-occurrence sums; only the
+  affected events' neighbor lists are recomputed.
+- Event writers report visibility changes on commit: update_event
+  (eventAccess / endDateTime) → event_changed(), soft_delete_event →
+  event_changed(access="Inactive"), hard_delete_event → event_removed().
+  Hidden/deleted events stop being recommended at once; changes committed
+  while a refresh/rebuild is reading are replayed onto its result.
+- A full rebuild every REBUILD_INTERVAL seconds picks up what a watermark
+  cannot see (unlikes, cancelled RSVPs, category edits). Both run on a
+  background thread started by recommend(); requests keep using the current
+  model meanwhile. Schedulers/tests can call refresh() / rebuild() directly.
+- Heavy users only contribute their first MAX_USER_ITEMS events to
+  co-occurrence (their pairs would otherwise dominate build time).
+
+Frontend Use:
+- "For You" tab → recommend(accountID, k=20) → list of eventIDs, then load
+  the cards with read_event_by_id / the event cache.
+- New users (no likes/RSVPs yet) get the most-engaged upcoming events.
+"""
+
+import heapq
+import json
+import math
+import threading
+import time
+from array import array
+from datetime import datetime
+
+from backend.db.connection import after_commit, get_conn
+
+# -----------------------------
+# SETTINGS
+# -----------------------------
+LIKE_WEIGHT = 1.0
+RSVP_WEIGHT = 2.0           # an RSVP says more than a like
+CATEGORY_WEIGHT = 0.15      # share of category overlap in item similarity
+NEIGHBORS = 50              # similar events kept per event
+CATEGORY_CANDIDATES = 20    # most-engaged events per category offered as neighbors
+POPULAR_SIZE = 200          # fallback list for users without history
+MAX_USER_ITEMS = 300        # events per user used for co-occurrence
+REFRESH_INTERVAL = 5.0      # seconds between incremental refreshes
+REBUILD_INTERVAL = 600.0    # seconds between full rebuilds
+
+
+def _now() -> str:
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+
+# -----------------------------
+# SPARSE MATRIX
+# -----------------------------
+class CSRMatrix:
+    """
+    Compressed sparse rows: the columns of row r are
+    indices[indptr[r]:indptr[r + 1]] (ascending), their values are in data.
+    """
+
+    def __init__(self, rows: list[dict[int, float]]):
+        self.indptr = array("q", [0])
+        self.indices = array("q")
+        self.data = array("d")
+        for row in rows:
+            for col in sorted(row):
+                self.indices.append(col)
+                self.data.append(row[col])
+            self.indptr.append(len(self.indices))
+
+    @property
+    def nrows(self) -> int:
+        return len(self.indptr) - 1
+
+    @property
+    def nnz(self) -> int:
+        return len(self.indices)
+
+    def row(self, r: int) -> dict[int, float]:
+        """Row r as {column: value} (empty for rows past the end)."""
+        if r >= self.nrows:
+            return {}
+        lo, hi = self.indptr[r], self.indptr[r + 1]
+        return dict(zip(self.indices[lo:hi], self.data[lo:hi]))
+
+
+# -----------------------------
+# MODEL
+# -----------------------------
+class Recommender:
+    """
+    One snapshot of the interaction data plus precomputed neighbors.
+    Events and users are addressed by dense slots; eventIDs/accountIDs are
+    mapped at the edges.
+    """
+
+    def __init__(self):
+        self.event_ids = []                # slot → eventID
+        self.event_slot = {}               # eventID → slot
+        self.visible = bytearray()         # slot → 1 if Public
+        self.ends = []                     # slot → endDateTime
+        self.categories = CSRMatrix([])    # event slot × category code
+        self.category_sets = []            # slot → frozenset of category codes (rows of self.categories)
+        self.category_codes = {}           # category name → code
+        self.users = CSRMatrix([])         # user row × event slot
+        self.user_row = {}                 # accountID → row in self.users
+        self.changed_users = {}            # accountID → full {slot: weight} row since the build
+        self.norm2 = array("d")            # slot → sum of squared weights
+        self.dots = []                     # slot → {slot: co-occurrence dot product}
+        self.neighbors = []                # slot → [(score, slot)], best first
+        self.by_category = {}              # code → most-engaged slots
+        self.popular = []                  # most-engaged slots overall
+        self.likes_rowid = 0               # watermarks: last log rowid folded in
+        self.rsvp_rowid = 0
+
+    # ---------- building ----------
+    @classmethod
+    def build(cls, conn) -> "Recommender":
+        """Read every event, category and like/RSVP (one snapshot) and precompute neighbors."""
+        model = cls()
+        conn.execute("BEGIN")  # one read snapshot for all four queries
+        try:
+            events = conn.execute("SELECT eventID, eventType, eventAccess, endDateTime FROM events").fetchall()
+            extra = conn.execute("SELECT eventID, category FROM eventCategories").fetchall()
+            likes = conn.execute("SELECT rowid, accountID, eventID FROM likesLog").fetchall()
+            rsvps = conn.execute("SELECT rowid, accountID, eventID FROM rsvpLog").fetchall()
+        finally:
+            conn.commit()
+
+        category_rows = []
+        for eventID, eventType, access, end in events:
+            model._add_event(eventID, access, end)
+            category_rows.append({model._code(eventType): 1.0} if eventType else {})
+        for eventID, category in extra:
+            if eventID in model.event_slot:
+                category_rows[model.event_slot[eventID]][model._code(category)] = 1.0
+        model.categories = CSRMatrix(category_rows)
+        model.category_sets = [frozenset(model.categories.row(slot)) for slot in range(len(events))]
+
+        rows = {}
+        for weight, log in ((LIKE_WEIGHT, likes), (RSVP_WEIGHT, rsvps)):
+            for _, accountID, eventID in log:
+                slot = model.event_slot.get(eventID)
+                if slot is not None:
+                    row = rows.setdefault(accountID, {})
+                    row[slot] = row.get(slot, 0.0) + weight
+        model.user_row = {accountID: r for r, accountID in enumerate(rows)}
+        model.users = CSRMatrix(list(rows.values()))
+        model.likes_rowid = max((r[0] for r in likes), default=0)
+        model.rsvp_rowid = max((r[0] for r in rsvps), default=0)
+
+        # Item-item co-occurrence = usersᵀ · users, accumulated one user row at a time
+        norm2, dots = model.norm2, model.dots
+        for row in rows.values():
+            items = sorted(row.items())
+            for slot, weight in items:
+                norm2[slot] += weight * weight
+            items = items[:MAX_USER_ITEMS]
+            for a, (i, wi) in enumerate(items):
+                di = dots[i]
+                for j, wj in items[a + 1:]:
+                    di[j] = di.get(j, 0.0) + wi * wj
+                    dots[j][i] = dots[j].get(i, 0.0) + wi * wj
+
+        model._rank_popular()
+        for slot in range(len(model.event_ids)):
+            model._compute_neighbors(slot)
+        return model
+
+    def _code(self, category: str) -> int:
+        return self.category_codes.setdefault(category, len(self.category_codes))
+
+    def _add_event(self, eventID: int, access: str, end: str) -> int:
+        slot = len(self.event_ids)
+        self.event_ids.append(eventID)
+        self.event_slot[eventID] = slot
+        self.visible.append(access == "Public")
+        self.ends.append(end)
+        self.norm2.append(0.0)
+        self.dots.append({})
+        self.neighbors.append([])
+        return slot
+
+    def _rank_popular(self):
+        """Most-engaged events overall and per category (neighbor candidates + cold start)."""
+        ranked = sorted(range(len(self.event_ids)), key=lambda s: -self.norm2[s])
+        ranked = [s for s in ranked if self.norm2[s] > 0]
+        self.popular = ranked[:POPULAR_SIZE]
+        self.by_category = {}
+        for slot in ranked:
+            for code in self.category_sets[slot]:
+                top = self.by_category.setdefault(code, [])
+                if len(top) < CATEGORY_CANDIDATES:
+                    top.append(slot)
+
+    # ---------- similarity ----------
+    def _category_similarity(self, cats_i: frozenset, slot: int) -> float:
+        cats_j = self.category_sets[slot]
+        if not cats_i or not cats_j:
+            return 0.0
+        return len(cats_i & cats_j) / math.sqrt(len(cats_i) * len(cats_j))
+
+    def _compute_neighbors(self, i: int):
+        """
+        Top NEIGHBORS events by cosine(co-occurrence) + CATEGORY_WEIGHT × category
+        overlap. Only Public events are kept (nothing else is ever recommended).
+        """
+        cats_i = self.category_sets[i]
+        norm_i = self.norm2[i]
+        candidates = {j: dot / math.sqrt(norm_i * self.norm2[j]) for j, dot in self.dots[i].items()}
+        for code in cats_i:
+            for j in self.by_category.get(code, ()):
+                candidates.setdefault(j, 0.0)
+        candidates.pop(i, None)
+        visible = self.visible
+        scored = ((cosine + CATEGORY_WEIGHT * self._category_similarity(cats_i, j), j)
+                  for j, cosine in candidates.items() if visible[j])
+        self.neighbors[i] = heapq.nlargest(NEIGHBORS, (pair for pair in scored if pair[0] > 0))
+
+    # ---------- incremental updates ----------
+    def user_items(self, accountID: int) -> dict[int, float]:
+        """{event slot: weight} for one user."""
+        row = self.changed_users.get(accountID)
+        if row is not None:
+            return row
+        r = self.user_row.get(accountID)
+        return {} if r is None else self.users.row(r)
+
+    def add_event(self, eventID: int, eventType: str | None, access: str, end: str, categories=()) -> int:
+        """Register an event created after the build (it gets neighbors once it has interactions)."""
+        slot = self._add_event(eventID, access, end)
+        self.category_sets.append(frozenset(self._code(c) for c in (eventType, *categories) if c))
+        return slot
+
+    def set_event(self, eventID: int, visible: bool | None = None, end: str | None = None):
+        """Apply a committed edit of one event (Public or not, new end date)."""
+        slot = self.event_slot.get(eventID)
+        if slot is None:
+            return
+        if end is not None:
+            self.ends[slot] = end
+        if visible is None or bool(self.visible[slot]) == visible:
+            return
+        self.visible[slot] = visible
+        if visible:
+            # Co-occurring events may list it again (category-only candidates wait for the rebuild)
+            for j in self.dots[slot]:
+                self._compute_neighbors(j)
+
+    def remove_event(self, eventID: int):
+        """Forget a deleted event: never recommended again, and a reused eventID gets a new slot."""
+        slot = self.event_slot.pop(eventID, None)
+        if slot is not None:
+            self.visible[slot] = False
+
+    def add_interaction(self, accountID: int, eventID: int, weight: float) -> set[int]:
+        """
+        Fold one new like/RSVP into the co-occurrence sums.
+        Returns the slots whose neighbor lists must be recomputed.
+        """
+        slot = self.event_slot.get(eventID)
+        if slot is None:
+            return set()
+        row = dict(self.user_items(accountID))
+        old = row.get(slot, 0.0)
+        new = old + weight
+        self.norm2[slot] += new * new - old * old
+        affected = {slot}
+        others = [(s, w) for s, w in row.items() if s != slot]
+        if len(others) < MAX_USER_ITEMS:  # heavy users stop adding pairs, as in build()
+            for j, wj in others:
+                delta = (new - old) * wj
+                self.dots[slot][j] = self.dots[slot].get(j, 0.0) + delta
+                self.dots[j][slot] = self.dots[j].get(slot, 0.0) + delta
+                affected.add(j)
+        row[slot] = new
+        self.changed_users[accountID] = row
+        return affected
+
+    # ---------- serving ----------
+    def recommend(self, accountID: int, k: int = 10) -> list[int]:
+        """Top-k unseen upcoming Public eventIDs for one user (popular events fill any gap)."""
+        items = self.user_items(accountID)
+        now, ends = _now(), self.ends
+
+        scores = {}
+        get = scores.get
+        for i, weight in items.items():
+            for similarity, j in self.neighbors[i]:
+                scores[j] = get(j, 0.0) + weight * similarity
+        for i in items:
+            scores.pop(i, None)
+
+        # Neighbors were Public when computed; recheck (hidden/deleted since) and the end date, best first
+        picked = []
+        visible = self.visible
+        for j in sorted(scores, key=scores.__getitem__, reverse=True):
+            if len(picked) == k:
+                break
+            if visible[j] and ends[j] >= now:
+                picked.append(j)
+        if len(picked) < k:
+            chosen = set(picked)
+            for j in self.popular:
+                if len(picked) == k:
+                    break
+                if j not in chosen and j not in items and self.visible[j] and ends[j] >= now:
+                    picked.append(j)
+        return [self.event_ids[j] for j in picked]
+
+    def stats(self) -> dict:
+        return {
+            "events": len(self.event_ids),
+            "users": len(self.user_row) + sum(1 for a in self.changed_users if a not in self.user_row),
+            "interactions": self.users.nnz,
+            "changed_users": len(self.changed_users),
+            "neighbor_links": sum(len(n) for n in self.neighbors),
+            "likes_rowid": self.likes_rowid,
+            "rsvp_rowid": self.rsvp_rowid,
+        }
+
+
+# -----------------------------
+# SHARED MODEL + REFRESH
+# -----------------------------
+_model = None
+_lock = threading.Lock()           # guards _model and its in-place updates
+_refresh_lock = threading.Lock()   # one refresh/rebuild at a time
+_refreshing = False
+_last_refresh = 0.0
+_last_rebuild = 0.0
+_replay = None                     # event changes committed while a refresh/rebuild reads
+
+
+def _start_reading():
+    global _replay
+    with _lock:
+        _replay = []
+
+
+def _stop_reading():
+    global _replay
+    with _lock:
+        _replay = None
+
+
+def _replay_onto(model: Recommender):
+    """Re-apply changes committed since _start_reading() (the read may predate them). Caller holds _lock."""
+    global _replay
+    for change in _replay or ():
+        change(model)
+    _replay = None
+
+
+def rebuild() -> Recommender:
+    """Build a fresh model from the DB and swap it in."""
+    global _model, _last_rebuild, _last_refresh
+    with _refresh_lock:
+        _start_reading()
+        try:
+            with get_conn(shared=False) as conn:  # long read: keep off the caller's connection
+                model = Recommender.build(conn)
+        except BaseException:
+            _stop_reading()
+            raise
+        with _lock:
+            _replay_onto(model)
+            _model = model
+        _last_rebuild = _last_refresh = time.monotonic()
+        return model
+
+
+def refresh() -> int:
+    """
+    Fold likes/RSVPs added since the last build/refresh into the current model
+    (rowid watermark). Returns the number of new interactions applied.
+    """
+    global _last_refresh
+    if _model is None:
+        rebuild()
+        return 0
+    with _refresh_lock:
+        model = _model
+        _start_reading()
+        try:
+            likes, rsvps, events, extra = _read_new(model)
+        except BaseException:
+            _stop_reading()
+            raise
+
+        with _lock:
+            for eventID, eventType, access, end in events:
+                model.add_event(eventID, eventType, access, end,
+                                [c for e, c in extra if e == eventID])
+            affected = set()
+            for weight, log in ((LIKE_WEIGHT, likes), (RSVP_WEIGHT, rsvps)):
+                for _, accountID, eventID in log:
+                    affected |= model.add_interaction(accountID, eventID, weight)
+            for slot in affected:
+                model._compute_neighbors(slot)
+            if likes:
+                model.likes_rowid = likes[-1][0]
+            if rsvps:
+                model.rsvp_rowid = rsvps[-1][0]
+            _replay_onto(model)
+        _last_refresh = time.monotonic()
+        return len(likes) + len(rsvps)
+
+
+def _read_new(model: Recommender):
+    """Likes/RSVPs past the model's watermarks, plus the events it has not seen yet."""
+    with get_conn(shared=False) as conn:
+        likes = conn.execute(
+            "SELECT rowid, accountID, eventID FROM likesLog WHERE rowid > ? ORDER BY rowid",
+            (model.likes_rowid,),
+        ).fetchall()
+        rsvps = conn.execute(
+            "SELECT rowid, accountID, eventID FROM rsvpLog WHERE rowid > ? ORDER BY rowid",
+            (model.rsvp_rowid,),
+        ).fetchall()
+        unknown = sorted({r[2] for r in likes + rsvps if r[2] not in model.event_slot})
+        events, extra = [], []
+        if unknown:  # events created since the build
+            ids = json.dumps(unknown)
+            events = conn.execute("""
+                SELECT eventID, eventType, eventAccess, endDateTime FROM events
+                WHERE eventID IN (SELECT value FROM json_each(?))
+            """, (ids,)).fetchall()
+            extra = conn.execute(
+                "SELECT eventID, category FROM eventCategories WHERE eventID IN (SELECT value FROM json_each(?))",
+                (ids,),
+            ).fetchall()
+    return likes, rsvps, events, extra
+
+
+def _background(job):
+    global _refreshing
+    try:
+        job()
+    finally:
+        _refreshing = False
+
+
+def _maybe_refresh():
+    """Build on first use; afterwards refresh/rebuild on a background thread when due."""
+    global _refreshing
+    if _model is None:
+        rebuild()
+        return
+    now = time.monotonic()
+    if _refreshing:
+        return
+    if now - _last_rebuild >= REBUILD_INTERVAL:
+        job = rebuild
+    elif now - _last_refresh >= REFRESH_INTERVAL:
+        job = refresh
+    else:
+        return
+    _refreshing = True
+    threading.Thread(target=_background, args=(job,), daemon=True, name="recommendations-refresh").start()
+
+
+# -----------------------------
+# WRITE HOOKS
+# Called by event writers inside their transaction; the model changes on
+# commit (same pattern as events/cache.py invalidation).
+# -----------------------------
+def _apply(change):
+    with _lock:
+        if _replay is not None:
+            _replay.append(change)
+        if _model is not None:
+            change(_model)
+
+
+def event_changed(eventID: int, access: str | None = None, end: str | None = None):
+    """New eventAccess and/or endDateTime of one event (None = unchanged)."""
+    if access is None and end is None:
+        return
+    visible = None if access is None else access == "Public"
+    after_commit(lambda: _apply(lambda model: model.set_event(eventID, visible, end)))
+
+
+def event_removed(eventID: int):
+    """A hard-deleted event."""
+    after_commit(lambda: _apply(lambda model: model.remove_event(eventID)))
+
+
+# -----------------------------
+# PUBLIC API
+# -----------------------------
+def recommend(user_id: int, k: int = 10) -> list[int]:
+    """
+    Up to k eventIDs for the user's "For You" feed, best first:
+    unseen, upcoming, Public events similar to the ones they liked/RSVP'd.
+    """
+    _maybe_refresh()
+    with _lock:
+        return _model.recommend(user_id, k)
+
+
+def recommendation_stats() -> dict:
+    with _lock:
+        stats = _model.stats() if _model is not None else {}
+    return dict(stats, refreshing=_refreshing)
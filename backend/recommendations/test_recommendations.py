@@ -0,0 +1,68 @@
+"""
+Tests for recommendations/recommendations.py (run: python -m pytest -q).
+"""
+
+import pytest
+
+from backend.events.create import create_event
+from backend.events.hard_delete import hard_delete_event
+from backend.events.soft_delete import soft_delete_event
+from backend.events.update import update_event
+from backend.liking_log.liking_log import add_like
+from backend.recommendations import recommendations
+
+
+def _event(name):
+    return create_event(1, name, "d", "Library Lab", "Computer Science",
+                        "2099-11-01 09:00:00", "2099-11-02 09:00:00")
+
+
+@pytest.fixture
+def events(db):
+    """alice likes A, B and C; bob likes A, so B and C are recommended to bob."""
+    a, b, c = _event("A"), _event("B"), _event("C")
+    for event in (a, b, c):
+        add_like(1, event)
+    add_like(2, a)
+    recommendations.rebuild()
+    yield a, b, c
+    recommendations._model = None
+
+
+def test_similar_events_are_recommended(events):
+    a, b, c = events
+    assert set(recommendations.recommend(2, k=5)) == {b, c}
+
+
+def test_soft_deleted_event_is_not_recommended(events):
+    a, b, c = events
+    assert soft_delete_event(b, 1)
+    assert recommendations.recommend(2, k=5) == [c]
+
+
+def test_hard_deleted_event_is_not_recommended(events):
+    a, b, c = events
+    assert hard_delete_event(b, 1)
+    assert recommendations.recommend(2, k=5) == [c]
+
+
+def test_private_event_is_hidden_until_public_again(events):
+    a, b, c = events
+    assert update_event(b, 1, {"eventAccess": "Private"})
+    assert recommendations.recommend(2, k=5) == [c]
+    assert update_event(b, 1, {"eventAccess": "Public"})
+    assert set(recommendations.recommend(2, k=5)) == {b, c}
+
+
+def test_changes_committed_during_a_rebuild_are_replayed(events, monkeypatch):
+    a, b, c = events
+    build = recommendations.Recommender.build.__func__
+
+    def build_then_delete(cls, conn):
+        model = build(cls, conn)        # snapshot still has b as Public
+        assert soft_delete_event(b, 1)  # committed while the rebuild is in flight
+        return model
+
+    monkeypatch.setattr(recommendations.Recommender, "build", classmethod(build_then_delete))
+    recommendations.rebuild()
+    assert recommendations.recommend(2, k=5) == [c]
@@ -8,61 +8,157 @@ Purpose:
 - Each RSVP = user (accountID) ↔ event (eventID).
 
 What Changed:
-- Uses shared DB resolver like CRUD files.
-- Ensures one RSVP per user/event (via `has_rsvp`).
+- Uses the shared pooled connection (backend/db/connection.py) like CRUD files.
+- Ensures one RSVP per user/event with INSERT ... ON CONFLICT DO NOTHING
+  (one statement, no check-then-insert race).
+- toggle_rsvp() flips an RSVP and returns the new state + count in one call.
+- Changed RSVPs invalidate the event's cached row (rsvpCount) after commit.
+- Bulk variants (has_rsvp_many, get_event_rsvps_many, add_rsvps_bulk,
+  cancel_rsvps_bulk) replace per-card has_rsvp() calls with one query.
 - Returns lists of eventIDs or accountIDs for querying.
+- events.rsvpCount is kept in step by triggers on rsvpLog (same transaction
+  as the RSVP/cancel); read it with get_event_rsvp_count().
+- Every RSVP row records when it was made (createdAt, local time), which
+  events/trending.py uses for its time-decayed "popular now" scores.
 
 Frontend Use:
 - Maps cleanly to endpoints (POST /rsvp, DELETE /rsvp, GET /rsvp).
+- RSVP button → POST /rsvp/toggle → toggle_rsvp() → (userRsvped, rsvps).
+- Feed page → has_rsvp_many(user, [ids on page]) for the "RSVP’d" badges.
 - Helps display attendees for events or show a user’s RSVPs.
 """
 
-import os, sqlite3
+import json
 
-BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-DB_PATH = os.path.join(BASE_DIR, "db", "EventPlannerDB.db")
-
-def _get_conn():
-    """Helper: open SQLite connection with row_factory enabled."""
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    return conn
+from backend.db.connection import get_conn
+from backend.events.cache import invalidate_event, invalidate_events
 
 def has_rsvp(user_id: int, event_id: int) -> bool:
     """Check if this user has RSVP’d to this event already."""
-    with _get_conn() as conn:
+    with get_conn() as conn:
         cur = conn.cursor()
         cur.execute("SELECT 1 FROM rsvpLog WHERE accountID=? AND eventID=? LIMIT 1", (user_id, event_id))
         return cur.fetchone() is not None
 
-def add_rsvp(user_id: int, event_id: int):
-    """Add RSVP (if not already exists)."""
-    if has_rsvp(user_id, event_id):
-        return False
-    with _get_conn() as conn:
+def add_rsvp(user_id: int, event_id: int) -> bool:
+    """
+    Add RSVP (if not already exists).
+    Single idempotent INSERT; returns True only if a new RSVP was stored.
+    """
+    with get_conn() as conn:
         cur = conn.cursor()
-        cur.execute("INSERT INTO rsvpLog (eventID, accountID) VALUES (?, ?)", (event_id, user_id))
-        conn.commit()
-        return True
+        cur.execute("""
+            INSERT INTO rsvpLog (eventID, accountID, createdAt) VALUES (?, ?, datetime('now', 'localtime'))
+            ON CONFLICT (eventID, accountID) DO NOTHING
+        """, (event_id, user_id))
+        changed = cur.rowcount > 0
+        if changed:
+            invalidate_event(event_id)
+        return changed
 
-def cancel_rsvp(user_id: int, event_id: int):
+def cancel_rsvp(user_id: int, event_id: int) -> bool:
     """Cancel RSVP (remove this user’s RSVP for the event)."""
-    with _get_conn() as conn:
+    with get_conn() as conn:
+        cur = conn.cursor()
+        cur.execute("DELETE FROM rsvpLog WHERE accountID=? AND eventID=?", (user_id, event_id))
+        changed = cur.rowcount > 0
+        if changed:
+            invalidate_event(event_id)
+        return changed
+
+def toggle_rsvp(user_id: int, event_id: int) -> tuple[bool, int]:
+    """
+    Flip the user’s RSVP for this event in one transaction
+    (mirrors toggleRsvp in src/context/EventsContext.tsx).
+    Returns (userRsvped, rsvpCount) after the toggle.
+    """
+    with get_conn() as conn:
         cur = conn.cursor()
         cur.execute("DELETE FROM rsvpLog WHERE accountID=? AND eventID=?", (user_id, event_id))
-        conn.commit()
-        return cur.rowcount > 0
+        rsvped = cur.rowcount == 0
+        if rsvped:
+            cur.execute("""
+                INSERT INTO rsvpLog (eventID, accountID, createdAt) VALUES (?, ?, datetime('now', 'localtime'))
+                ON CONFLICT (eventID, accountID) DO NOTHING
+            """, (event_id, user_id))
+        invalidate_event(event_id)
+        cur.execute("SELECT rsvpCount FROM events WHERE eventID = ?", (event_id,))
+        row = cur.fetchone()
+        return rsvped, row[0] if row else 0
 
 def get_event_rsvps(event_id: int):
     """Return list of accountIDs who RSVP’d to this event."""
-    with _get_conn() as conn:
+    with get_conn() as conn:
         cur = conn.cursor()
         cur.execute("SELECT accountID FROM rsvpLog WHERE eventID=?", (event_id,))
         return [row[0] for row in cur.fetchall()]
 
+def get_event_rsvp_count(event_id: int) -> int:
+    """Return the number of RSVPs for this event (maintained counter, no log scan)."""
+    with get_conn() as conn:
+        cur = conn.cursor()
+        cur.execute("SELECT rsvpCount FROM events WHERE eventID = ?", (event_id,))
+        row = cur.fetchone()
+        return row[0] if row else 0
+
 def get_user_rsvps(user_id: int):
     """Return list of eventIDs this user has RSVP’d to."""
-    with _get_conn() as conn:
+    with get_conn() as conn:
         cur = conn.cursor()
         cur.execute("SELECT eventID FROM rsvpLog WHERE accountID=?", (user_id,))
         return [row[0] for row in cur.fetchall()]
+
+# -----------------------------
+# BULK HELPERS
+# One query per call; ID lists go in as a single JSON parameter (json_each).
+# -----------------------------
+def has_rsvp_many(user_id: int, event_ids: list[int]) -> dict[int, bool]:
+    """Return {eventID: True/False} for whether this user has RSVP’d to each event."""
+    ids = list(event_ids)
+    with get_conn() as conn:
+        cur = conn.cursor()
+        cur.execute("""
+            SELECT eventID FROM rsvpLog
+            WHERE accountID = ? AND eventID IN (SELECT value FROM json_each(?))
+        """, (user_id, json.dumps(ids)))
+        found = {row[0] for row in cur.fetchall()}
+    return {event_id: event_id in found for event_id in ids}
+
+def get_event_rsvps_many(event_ids: list[int]) -> dict[int, list[int]]:
+    """Return {eventID: [accountIDs]} of RSVPs for every given event (empty list if none)."""
+    ids = list(event_ids)
+    result = {event_id: [] for event_id in ids}
+    with get_conn() as conn:
+        cur = conn.cursor()
+        cur.execute("""
+            SELECT eventID, accountID FROM rsvpLog
+            WHERE eventID IN (SELECT value FROM json_each(?))
+        """, (json.dumps(ids),))
+        for event_id, account_id in cur.fetchall():
+            result[event_id].append(account_id)
+    return result
+
+def add_rsvps_bulk(pairs: list[tuple[int, int]]) -> int:
+    """
+    Add many RSVPs at once; pairs are (user_id, event_id) like the single version.
+    Already-existing pairs are skipped. Returns how many new RSVPs were stored.
+    """
+    with get_conn() as conn:
+        cur = conn.cursor()
+        cur.executemany("""
+            INSERT INTO rsvpLog (eventID, accountID, createdAt) VALUES (?, ?, datetime('now', 'localtime'))
+            ON CONFLICT (eventID, accountID) DO NOTHING
+        """, [(event_id, user_id) for user_id, event_id in pairs])
+        invalidate_events({event_id for _, event_id in pairs})
+        return max(cur.rowcount, 0)
+
+def cancel_rsvps_bulk(pairs: list[tuple[int, int]]) -> int:
+    """Remove many RSVPs at once; pairs are (user_id, event_id). Returns how many were removed."""
+    with get_conn() as conn:
+        cur = conn.cursor()
+        cur.executemany(
+            "DELETE FROM rsvpLog WHERE accountID=? AND eventID=?",
+            [(user_id, event_id) for user_id, event_id in pairs],
+        )
+        invalidate_events({event_id for _, event_id in pairs})
+        return max(cur.rowcount, 0)
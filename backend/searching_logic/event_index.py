@@ -0,0 +1,251 @@
+"""
+=========================================================
+EVENT INDEX (precomputed in-memory search index)
+=========================================================
+
+Purpose:
+- Build once from read_events() output, then answer combined
+  title / category / date-range queries without touching the DB and
+  without re-lowercasing titles or re-parsing dates per query.
+- Supports incremental upsert/delete so it can follow writes instead of
+  being rebuilt.
+
+What Changed:
+- New module for the no-database search path (searching_logic.py still
+  works on plain lists).
+- Columnar storage per "slot": pre-casefolded titles (str.casefold, as
+  in searching_logic / query_builder), start times as
+  integer seconds (array('q')), categories as tuples of small int codes.
+- Filters are combined as bitmasks (Python ints, one bit per slot):
+  each category keeps its own mask, date ranges come from the slot order
+  (below), and masks are ANDed in C before titles are checked on the few
+  remaining slots.
+- The bulk load assigns slots in (start, eventID) order, so a date range
+  over them is one contiguous run of bits (two bisects on the start
+  column + one big-int mask, no per-event loop), and the set bits of a
+  result are already chronological (no sort; `limit` stops early).
+  Slots added later by upsert() form a short sorted tail that is merged
+  in; it is folded back in by compaction once it grows past TAIL_LIMIT.
+- Uses only the standard library (array/bisect/int bit operations), so
+  the backend keeps its current dependency set.
+- Events can have several categories: a slot's bit is set in the mask of
+  each one (its "categories" list from categories.attach_categories, or
+  just eventType). query(match="all") ANDs the category masks instead of
+  ORing them, so multi-category filters are pure bitset operations.
+
+Frontend Use:
+- A search endpoint keeps one EventIndex in memory:
+    index = EventIndex(attach_categories(read_events()))
+    index.query(title="hack", categories=["Sports"], start_date="2025-11-01")
+    index.query(categories=["Math", "Workshops"], match="all")
+- After create/update call index.upsert(event); after delete, index.delete(id).
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Iterable
+from datetime import datetime
+from heapq import merge
+from itertools import islice
+
+from backend.events.create import ALLOWED_EVENT_TYPES
+
+# Category → small int code (stable: alphabetical)
+CATEGORY_CODES = {name: code for code, name in enumerate(sorted(ALLOWED_EVENT_TYPES))}
+MATCH_MODES = ("any", "all")
+TAIL_LIMIT = 1024   # upserted slots kept outside the chronological order before compaction
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _to_seconds(value: str) -> int:
+    """'YYYY-MM-DD[ HH:MM:SS]' → integer seconds since 1970 (naive, no timezone shift)."""
+    return int((datetime.fromisoformat(value) - _EPOCH).total_seconds())
+
+
+def _day_seconds(date_str: str) -> int:
+    """'YYYY-MM-DD' bound → seconds at 00:00:00 (same bound as search_by_date)."""
+    return int((datetime.strptime(date_str, "%Y-%m-%d") - _EPOCH).total_seconds())
+
+
+def _category_codes(event: dict) -> tuple[int, ...]:
+    """Codes of the event's categories (its "categories" list, else eventType); unknown names skipped."""
+    names = event.get("categories") or (event.get("eventType"),)
+    return tuple(sorted({CATEGORY_CODES[n] for n in names if n in CATEGORY_CODES}))
+
+
+def _iter_bits(mask: int):
+    """Yield the positions of set bits in `mask`, lowest first."""
+    data = mask.to_bytes((mask.bit_length() + 7) // 8, "little")
+    for byte_index, byte in enumerate(data):
+        while byte:
+            low = byte & -byte
+            yield (byte_index << 3) + low.bit_length() - 1
+            byte ^= low
+
+
+class EventIndex:
+    """
+    Columnar, bitmask-filtered index over event dicts.
+    Each event occupies one slot; deleted slots are recycled by compaction.
+    Slots below self._ordered are in (start, eventID) order; later slots
+    are listed, in that order, in self._tail.
+    """
+
+    def __init__(self, events: Iterable[dict] = ()):
+        self._rows = []                  # slot → event dict (None if deleted)
+        self._titles = []                # slot → casefolded eventName
+        self._starts = array("q")        # slot → start time (seconds)
+        self._categories = []            # slot → tuple of category codes
+        self._slot_of = {}               # eventID → slot
+        self._ordered = 0                # slots [0, _ordered) are chronological
+        self._tail = []                  # sorted (start, eventID, slot) of slots >= _ordered
+        self._category_masks = [0] * len(CATEGORY_CODES)
+        self._alive = 0                  # bit per live slot
+        self._free = 0                   # number of deleted slots
+        self._bulk_load(events)
+
+    def _bulk_load(self, events: Iterable[dict]):
+        """Initial build: one sort, slots in (start, eventID) order, one pass per mask."""
+        rows = {event["eventID"]: dict(event) for event in events}
+        if not rows:
+            return
+        order = sorted((_to_seconds(row["startDateTime"]), eventID) for eventID, row in rows.items())
+        self._rows = [rows[eventID] for _, eventID in order]
+        self._titles = [row["eventName"].casefold() for row in self._rows]
+        self._starts = array("q", (start for start, _ in order))
+        self._categories = [_category_codes(row) for row in self._rows]
+        self._slot_of = {eventID: slot for slot, (_, eventID) in enumerate(order)}
+        self._ordered = len(order)
+
+        size = (len(self._rows) + 7) // 8
+        bits = [bytearray(size) for _ in CATEGORY_CODES]
+        for slot, codes in enumerate(self._categories):
+            for code in codes:
+                bits[code][slot >> 3] |= 1 << (slot & 7)
+        self._category_masks = [int.from_bytes(b, "little") for b in bits]
+        self._alive = (1 << len(self._rows)) - 1
+
+    def __len__(self) -> int:
+        return len(self._slot_of)
+
+    def __contains__(self, event_id: int) -> bool:
+        return event_id in self._slot_of
+
+    # -----------------------------
+    # WRITES
+    # -----------------------------
+    def upsert(self, event: dict):
+        """Add an event, or replace the indexed copy of an existing one."""
+        if event["eventID"] in self._slot_of:
+            self.delete(event["eventID"])
+
+        slot = len(self._rows)
+        start = _to_seconds(event["startDateTime"])
+        codes = _category_codes(event)
+        bit = 1 << slot
+
+        self._rows.append(dict(event))
+        self._titles.append(event["eventName"].casefold())
+        self._starts.append(start)
+        self._categories.append(codes)
+        self._slot_of[event["eventID"]] = slot
+        insort(self._tail, (start, event["eventID"], slot))
+        for code in codes:
+            self._category_masks[code] |= bit
+        self._alive |= bit
+        if len(self._tail) > TAIL_LIMIT:
+            self._compact()
+
+    def delete(self, event_id: int) -> bool:
+        """Remove an event from the index. Returns False if it was not indexed."""
+        slot = self._slot_of.pop(event_id, None)
+        if slot is None:
+            return False
+        bit = 1 << slot
+        for code in self._categories[slot]:
+            self._category_masks[code] &= ~bit
+        self._alive &= ~bit
+        if slot >= self._ordered:
+            del self._tail[bisect_left(self._tail, (self._starts[slot], event_id, slot))]
+        self._rows[slot] = None
+        self._titles[slot] = ""
+        self._categories[slot] = ()
+        self._free += 1
+        if self._free > 1024 and self._free * 2 > len(self._rows):
+            self._compact()
+        return True
+
+    def _compact(self):
+        """Rebuild without deleted slots, tail back in order (keeps masks short)."""
+        live = [row for row in self._rows if row is not None]
+        self.__init__(live)
+
+    # -----------------------------
+    # QUERIES
+    # -----------------------------
+    def _date_mask(self, start_date: str | None, end_date: str | None) -> int:
+        """Bitmask of slots whose start falls in [start_date, end_date] (00:00 bounds)."""
+        start = None if start_date is None else _day_seconds(start_date)
+        end = None if end_date is None else _day_seconds(end_date)
+        # Ordered slots: one run of bits. Deleted slots keep their start, so the column stays sorted.
+        lo = 0 if start is None else bisect_left(self._starts, start, 0, self._ordered)
+        hi = self._ordered if end is None else bisect_right(self._starts, end, 0, self._ordered)
+        mask = (1 << hi) - (1 << lo)
+        if self._tail:
+            tail_lo = 0 if start is None else bisect_left(self._tail, (start,))
+            tail_hi = len(self._tail) if end is None else bisect_right(self._tail, (end, float("inf")))
+            bits = bytearray((len(self._rows) + 7) // 8)
+            for _, _, slot in self._tail[tail_lo:tail_hi]:
+                bits[slot >> 3] |= 1 << (slot & 7)
+            mask |= int.from_bytes(bits, "little")
+        return mask
+
+    def _chronological(self, mask: int):
+        """Set slots of `mask` in (start, eventID) order: ordered slots merged with the tail."""
+        slots = _iter_bits(mask & ((1 << self._ordered) - 1))
+        if not mask >> self._ordered:
+            return slots
+        bits = mask.to_bytes((len(self._rows) + 7) // 8, "little")
+        tail = [slot for _, _, slot in self._tail if bits[slot >> 3] >> (slot & 7) & 1]
+        return merge(slots, tail, key=lambda s: (self._starts[s], self._rows[s]["eventID"]))
+
+    def query(self, title: str | None = None, categories: list[str] | None = None,
+              start_date: str | None = None, end_date: str | None = None,
+              limit: int | None = None, match: str = "any") -> list[dict]:
+        """
+        Events matching every given filter, chronological (startDateTime, eventID).
+        Same semantics as the searching_logic helpers:
+        - title: case-insensitive substring of eventName
+        - categories: the event is in any (match="any") or all (match="all") of these
+        - start_date / end_date: 'YYYY-MM-DD', compared with startDateTime
+        """
+        if match not in MATCH_MODES:
+            raise ValueError(f"match must be one of: {MATCH_MODES}")
+        mask = self._alive
+        if categories is not None:
+            masks = [self._category_masks[CATEGORY_CODES[name]] if name in CATEGORY_CODES else 0
+                     for name in set(categories)]
+            if match == "any":
+                category_mask = 0
+                for name_mask in masks:
+                    category_mask |= name_mask
+                mask &= category_mask
+            else:
+                for name_mask in masks:
+                    mask &= name_mask
+                if not masks:
+                    mask = 0  # empty category list matches nothing (as in searching_logic)
+        if start_date is not None or end_date is not None:
+            mask &= self._date_mask(start_date, end_date)
+
+        slots = self._chronological(mask)
+        if title:
+            needle = title.casefold()
+            titles = self._titles
+            slots = (s for s in slots if needle in titles[s])
+        return [dict(self._rows[s]) for s in islice(slots, limit)]
+
+    def count(self, **filters) -> int:
+        """Number of events matching `filters` (see query())."""
+        return len(self.query(**filters))
@@ -0,0 +1,89 @@
+"""
+=========================================================
+FULL-TEXT SEARCH (FTS5 index over events)
+=========================================================
+
+Purpose:
+- Ranked keyword search over event name, description and location.
+- Backed by the `eventsSearch` FTS5 table created in currentDB.py,
+  which triggers keep in sync with the `events` table.
+
+What Changed:
+- Replaces the "load every row then substring-scan" approach of
+  search_by_title / search_by_description for the search box.
+- Each word in the query is prefix-matched ("hack" finds "Hackathon").
+- Results are ordered by BM25 relevance (name matches weigh most,
+  then location, then description).
+- Never reads image bytes (only imageHash), so result size depends only
+  on the number of hits, not on table size.
+
+Frontend Use:
+- Search bar → GET /search?q=...&limit=...&offset=... → search_events().
+- Use offset for "load more" pages.
+"""
+
+import re
+
+from backend.db.connection import get_conn
+from backend.events.read import projection_sql
+
+# BM25 column weights, in FTS column order: eventName, eventDescription, location
+BM25_WEIGHTS = (10.0, 1.0, 3.0)
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def _to_match_expression(query: str) -> str:
+    """
+    Turn free text into a safe FTS5 MATCH expression.
+    - Splits on non-word characters (drops FTS operators/quotes).
+    - Every term becomes a quoted prefix query: "term"*
+    - Terms are ANDed together (FTS5 default).
+    """
+    terms = _TOKEN_RE.findall(query.lower())
+    return " ".join(f'"{t}"*' for t in terms)
+
+
+def search_events(query: str, limit: int = 20, offset: int = 0, include_inactive: bool = False,
+                  columns: str | list[str] | None = None) -> list[dict]:
+    """
+    Ranked full-text search.
+    - Prefix matches every word in `query` against name/description/location.
+    - Excludes 'Inactive' events by default.
+    - Returns at most `limit` dicts, best match first, skipping `offset` hits.
+    - columns: projection as in read_events() (default every column).
+    """
+    expression = _to_match_expression(query)
+    if not expression:
+        return []
+
+    cols = projection_sql(columns, alias="e")
+    where = "" if include_inactive else " AND e.eventAccess IN ('Public','Private')"
+    sql = f"""
+        SELECT {cols}
+        FROM eventsSearch
+        JOIN events e ON e.eventID = eventsSearch.rowid
+        WHERE eventsSearch MATCH ?{where}
+        ORDER BY bm25(eventsSearch, ?, ?, ?), e.eventID
+        LIMIT ? OFFSET ?
+    """
+    with get_conn() as conn:
+        cur = conn.cursor()
+        cur.execute(sql, (expression, *BM25_WEIGHTS, limit, offset))
+        return [dict(r) for r in cur.fetchall()]
+
+
+def rebuild_search_index():
+    """
+    Rebuild eventsSearch from the events table.
+    Only needed for a DB created before the FTS table/triggers existed.
+    """
+    with get_conn() as conn:
+        conn.execute("INSERT INTO eventsSearch(eventsSearch) VALUES ('rebuild')")
+
+
+# -----------------------------
+# DEBUG / LOCAL TESTING
+# -----------------------------
+if __name__ == "__main__":
+    print(search_events("hack"))
@@ -0,0 +1,179 @@
+"""
+=========================================================
+QUERY BUILDER (combined event filters pushed into SQL)
+=========================================================
+
+Purpose:
+- One entry point, query_events(filters), that turns every search
+  filter the frontend offers into a single parameterized SELECT.
+- Replaces chaining search_by_category → search_by_date → search_by_title
+  over Python lists (each step copying the list and re-parsing dates).
+
+What Changed:
+- Filters are validated against ALLOWED_FILTERS (same idea as
+  ALLOWED_UPDATE_FIELDS in update.py) and only ever bound as parameters.
+- Dates are compared as ISO strings ("YYYY-MM-DD HH:MM:SS" sorts
+  chronologically), so no per-row datetime parsing.
+- Keyset pagination on (startDateTime, eventID): pass the `after` key of
+  the last row you got instead of an OFFSET, so deep pages stay cheap.
+- Semantics match the in-memory helpers in searching_logic.py, which now
+  delegate here when called without a pre-fetched list. Title/description
+  filters compare casefold() on both sides (SQL function registered by
+  db/connection.py), not LIKE, whose case folding is ASCII-only: "émile"
+  finds "Émile" on both paths.
+- "categories" matches an event's full category set (eventCategories, read
+  through its (category, eventID) index); "category_match": "all" requires
+  every listed category instead of any of them.
+
+Frontend Use:
+- Browse/filter page → send the selected filters →
+  query_events({"title": "hack", "categories": ["Sports"], ...}).
+- "Load more" → call again with after=page_key(last_row), or use
+  query_events_page() and pass back its opaque next_page_token.
+- Result cards → pass columns="card" to skip descriptions.
+"""
+
+import json
+from datetime import datetime
+
+from backend.db.connection import get_conn
+from backend.events.read import decode_page_token, encode_page_token, projection_sql, with_keyset_columns
+
+# -----------------------------
+# ALLOWED FILTERS
+# key → meaning
+# -----------------------------
+ALLOWED_FILTERS = {
+    "title",             # substring of eventName (case-insensitive, str.casefold)
+    "description",       # substring of eventDescription (case-insensitive, str.casefold)
+    "categories",        # list of categories (eventCategories; see category_match)
+    "category_match",    # "any" (default) or "all" of the listed categories
+    "start_date",        # "YYYY-MM-DD", startDateTime >= this date 00:00:00
+    "end_date",          # "YYYY-MM-DD", startDateTime <= this date 00:00:00
+    "access",            # eventAccess value or list of values
+    "include_inactive",  # bool, default False
+    "priced",            # bool → isPriced = 1 / 0
+    "rsvp_required",     # bool → rsvpRequired = 1 / 0
+}
+CATEGORY_MATCH = ("any", "all")
+
+
+def _day_start(date_str: str) -> str:
+    """'YYYY-MM-DD' → 'YYYY-MM-DD 00:00:00' (validates the date once)."""
+    return datetime.strptime(date_str, "%Y-%m-%d").strftime("%Y-%m-%d %H:%M:%S")
+
+
+def build_event_query(filters: dict | None = None, limit: int | None = 50,
+                      after: tuple | None = None, columns: str | list[str] | None = None) -> tuple[str, list]:
+    """
+    Compile filters into (sql, params).
+    Exposed separately so callers/tests can inspect the generated SQL.
+    """
+    filters = filters or {}
+    bad_keys = [k for k in filters.keys() if k not in ALLOWED_FILTERS]
+    if bad_keys:
+        raise ValueError(f"Illegal filter fields: {bad_keys}")
+
+    clauses, params = [], []
+
+    if not filters.get("include_inactive", False):
+        clauses.append("eventAccess IN ('Public','Private')")
+
+    if filters.get("title"):
+        clauses.append("instr(casefold(eventName), ?) > 0")  # literal substring, no wildcards
+        params.append(filters["title"].casefold())
+
+    if filters.get("description"):
+        clauses.append("instr(casefold(eventDescription), ?) > 0")
+        params.append(filters["description"].casefold())
+
+    if "categories" in filters:
+        categories = list(dict.fromkeys(filters["categories"]))
+        if not categories:
+            clauses.append("0")  # empty category set matches nothing (same as list `in` check)
+        else:
+            match = filters.get("category_match") or "any"
+            if match not in CATEGORY_MATCH:
+                raise ValueError(f"category_match must be one of: {CATEGORY_MATCH}")
+            subquery = "SELECT eventID FROM eventCategories WHERE category IN (SELECT value FROM json_each(?))"
+            params.append(json.dumps(categories))
+            if match == "all":
+                subquery += " GROUP BY eventID HAVING COUNT(*) = ?"
+                params.append(len(categories))
+            clauses.append(f"eventID IN ({subquery})")
+
+    if filters.get("start_date"):
+        clauses.append("startDateTime >= ?")
+        params.append(_day_start(filters["start_date"]))
+
+    if filters.get("end_date"):
+        clauses.append("startDateTime <= ?")
+        params.append(_day_start(filters["end_date"]))
+
+    if filters.get("access"):
+        access = filters["access"]
+        access = [access] if isinstance(access, str) else list(access)
+        clauses.append(f"eventAccess IN ({', '.join('?' * len(access))})")
+        params.extend(access)
+
+    if filters.get("priced") is not None:
+        clauses.append("isPriced = ?")
+        params.append(1 if filters["priced"] else 0)
+
+    if filters.get("rsvp_required") is not None:
+        clauses.append("rsvpRequired = ?")
+        params.append(1 if filters["rsvp_required"] else 0)
+
+    if after is not None:
+        clauses.append("(startDateTime, eventID) > (?, ?)")
+        params.extend(after)
+
+    sql = f"SELECT {projection_sql(columns)} FROM events"
+    if clauses:
+        sql += " WHERE " + " AND ".join(clauses)
+    sql += " ORDER BY startDateTime ASC, eventID ASC"
+    if limit is not None:
+        sql += " LIMIT ?"
+        params.append(limit)
+    return sql, params
+
+
+def query_events(filters: dict | None = None, limit: int | None = 50,
+                 after: tuple | None = None, columns: str | list[str] | None = None) -> list[dict]:
+    """
+    Return events matching every given filter, in chronological order.
+    - limit=None returns all matches.
+    - after=(startDateTime, eventID) of the previous page's last row
+      (the projection must then include startDateTime and eventID).
+    - columns: projection as in read_events() ("card" for list views).
+    """
+    sql, params = build_event_query(filters, limit, after, columns)
+    with get_conn() as conn:
+        cur = conn.cursor()
+        cur.execute(sql, params)
+        return [dict(r) for r in cur.fetchall()]
+
+
+def query_events_page(filters: dict | None = None, limit: int = 50, page_token: str | None = None,
+                      columns: str | list[str] | None = None) -> tuple[list[dict], str | None]:
+    """
+    Token-based variant of query_events() for APIs.
+    Returns (events, next_page_token); next_page_token is None on the last page.
+    """
+    after = decode_page_token(page_token) if page_token else None
+    rows = query_events(filters, limit + 1, after, with_keyset_columns(columns))
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    return rows, encode_page_token(rows[-1]) if has_more and rows else None
+
+
+def page_key(event: dict) -> tuple:
+    """Keyset for the next page: pass as `after=` to query_events()."""
+    return (event["startDateTime"], event["eventID"])
+
+
+# -----------------------------
+# DEBUG / LOCAL TESTING
+# -----------------------------
+if __name__ == "__main__":
+    print(query_events({"categories": ["Sports", "Math"], "start_date": "2025-11-01"}))
@@ -8,9 +8,20 @@ Purpose:
   events by title, description, category, or date range.
 
 What Changed:
-- Takes a list of event dicts (as returned by read_events).
-- Uses datetime parsing for date comparisons.
-- Does not query DB directly; runs on already-fetched data.
+- Takes a list of event dicts (as returned by read_events) or any
+  iterable of them, e.g. read.iter_events(), which streams rows so the
+  whole table is never held in memory.
+- Date bounds are parsed once; rows are compared as ISO strings.
+- Pass events=None to skip fetching: the filter then runs in SQL via
+  query_builder.query_events() with the same semantics.
+- To combine several filters, call query_events() directly instead of
+  chaining these helpers over lists.
+- search_by_category() checks an event's full category set and can
+  require any or all of the given categories. It stays a pure filter:
+  pass rows from categories.attach_categories() (rows without a
+  "categories" list only match on their eventType). load_categories=True
+  instead looks the missing sets up in eventCategories, one query per
+  CATEGORY_BATCH rows, so results match categories.events_in_categories().
 
 Frontend Use:
 - Can be wired to search endpoints where frontend sends 
@@ -19,24 +30,64 @@ Frontend Use:
 Note:
 - This avoids SQL string concatenation and keeps the search 
   logic simple/testable in Python.
+- For the search box, prefer full_text_search.search_events(): it is
+  ranked, prefix-matching, and only reads matching rows from the DB.
+- For search-as-you-type without the DB, trigram_index.TrigramIndex
+  gives suggest() and typo-tolerant search_by_title(..., max_edits=1).
 """
 
+from collections.abc import Iterable
 from datetime import datetime
+from itertools import islice
 
-def search_by_title(events: list[dict], title_query: str) -> list[dict]:
+from backend.events.categories import MATCH_MODES, get_event_categories_many
+from backend.searching_logic.query_builder import query_events
+
+CATEGORY_BATCH = 500   # rows per eventCategories lookup in search_by_category
+
+def search_by_title(events: Iterable[dict] | None, title_query: str) -> list[dict]:
     """Return events whose eventName contains the query (case-insensitive)."""
-    return [e for e in events if title_query.lower() in e["eventName"].lower()]
+    if events is None:
+        return query_events({"title": title_query}, limit=None)
+    q = title_query.casefold()
+    return [e for e in events if q in e["eventName"].casefold()]
 
-def search_by_date(events: list[dict], start_date: str, end_date: str) -> list[dict]:
+def search_by_date(events: Iterable[dict] | None, start_date: str, end_date: str) -> list[dict]:
     """Return events within the start/end date range (inclusive)."""
-    start = datetime.strptime(start_date, "%Y-%m-%d")
-    end = datetime.strptime(end_date, "%Y-%m-%d")
-    return [e for e in events if start <= datetime.strptime(e["startDateTime"], "%Y-%m-%d %H:%M:%S") <= end]
+    if events is None:
+        return query_events({"start_date": start_date, "end_date": end_date}, limit=None)
+    # Parse the bounds once; ISO "YYYY-MM-DD HH:MM:SS" strings sort chronologically
+    start = datetime.strptime(start_date, "%Y-%m-%d").strftime("%Y-%m-%d %H:%M:%S")
+    end = datetime.strptime(end_date, "%Y-%m-%d").strftime("%Y-%m-%d %H:%M:%S")
+    return [e for e in events if start <= e["startDateTime"] <= end]
 
-def search_by_category(events: list[dict], categories: list[str]) -> list[dict]:
-    """Return events that belong to any of the given categories."""
-    return [e for e in events if e["eventType"] in categories]
+def search_by_category(events: Iterable[dict] | None, categories: list[str], match: str = "any",
+                       *, load_categories: bool = False) -> list[dict]:
+    """
+    Return events that belong to any (match="any") or all (match="all") of the given categories.
+    An event's categories are its "categories" list (see attach_categories) plus eventType.
+    load_categories=True reads the lists of rows that lack one from the DB; otherwise no DB access.
+    """
+    if events is None:
+        return query_events({"categories": categories, "category_match": match}, limit=None)
+    if match not in MATCH_MODES:
+        raise ValueError(f"match must be one of: {MATCH_MODES}")
+    wanted = set(categories)
+    if not wanted:
+        return []
+    matches, rows = [], iter(events)
+    while batch := list(islice(rows, CATEGORY_BATCH)):
+        missing = [e["eventID"] for e in batch if "categories" not in e] if load_categories else []
+        found = get_event_categories_many(missing) if missing else {}
+        for e in batch:
+            have = {e["eventType"], *(e["categories"] if "categories" in e else found.get(e["eventID"], ()))}
+            if (wanted <= have) if match == "all" else not wanted.isdisjoint(have):
+                matches.append(e)
+    return matches
 
-def search_by_description(events: list[dict], keyword: str) -> list[dict]:
+def search_by_description(events: Iterable[dict] | None, keyword: str) -> list[dict]:
     """Return events where keyword is found in the description (case-insensitive)."""
-    return [e for e in events if keyword.lower() in e.get("eventDescription", "").lower()]
+    if events is None:
+        return query_events({"description": keyword}, limit=None)
+    q = keyword.casefold()
+    return [e for e in events if q in (e.get("eventDescription") or "").casefold()]
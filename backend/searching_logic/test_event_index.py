@@ -0,0 +1,73 @@
+"""
+Tests for searching_logic/event_index.py (run: python -m pytest -q).
+"""
+
+import random
+
+import pytest
+
+from backend.searching_logic import event_index
+from backend.searching_logic.event_index import CATEGORY_CODES, EventIndex
+
+CATEGORIES = sorted(CATEGORY_CODES)
+
+
+def _event(eventID, rng):
+    day = rng.randrange(1, 29)
+    hour = rng.choice([0, 0, 9, 18])   # many exactly-midnight starts to hit the end bound
+    return {
+        "eventID": eventID,
+        "eventName": rng.choice(["Hackathon", "Chess night", "Math talk", "Game day"]) + f" {eventID}",
+        "eventType": rng.choice(CATEGORIES),
+        "startDateTime": f"2025-11-{day:02d} {hour:02d}:00:00",
+    }
+
+
+def _expected(events, title=None, categories=None, start_date=None, end_date=None, limit=None):
+    found = [
+        e for e in events.values()
+        if (title is None or title.lower() in e["eventName"].lower())
+        and (categories is None or e["eventType"] in categories)
+        and (start_date is None or e["startDateTime"] >= start_date + " 00:00:00")
+        and (end_date is None or e["startDateTime"] <= end_date + " 00:00:00")
+    ]
+    found.sort(key=lambda e: (e["startDateTime"], e["eventID"]))
+    return [e["eventID"] for e in found][:limit]
+
+
+QUERIES = [
+    {},
+    {"title": "hack"},
+    {"categories": CATEGORIES[:2]},
+    {"start_date": "2025-11-05", "end_date": "2025-11-12"},
+    {"start_date": "2025-11-20"},
+    {"end_date": "2025-11-03"},
+    {"title": "night", "start_date": "2025-11-02", "end_date": "2025-11-27", "limit": 7},
+    {"categories": CATEGORIES[:1], "end_date": "2025-11-15", "limit": 3},
+]
+
+
+@pytest.mark.parametrize("query", QUERIES)
+def test_matches_a_plain_scan_through_upserts_and_deletes(query, monkeypatch):
+    monkeypatch.setattr(event_index, "TAIL_LIMIT", 40)   # exercise compaction too
+    rng = random.Random(7)
+    events = {i: _event(i, rng) for i in range(1, 301)}
+    index = EventIndex(events.values())
+
+    def check():
+        got = [e["eventID"] for e in index.query(**query)]
+        assert got == _expected(events, **query)
+
+    check()
+    for step in range(200):
+        eventID = rng.randrange(1, 401)
+        if eventID in events and step % 3 == 0:
+            del events[eventID]
+            assert index.delete(eventID)
+        else:
+            events[eventID] = _event(eventID, rng)
+            index.upsert(events[eventID])
+        if step % 25 == 0:
+            check()
+    check()
+    assert len(index) == len(events)
@@ -0,0 +1,34 @@
+"""
+Tests for searching_logic/query_builder.py (run: python -m pytest -q).
+"""
+
+import pytest
+
+from backend.events.create import create_event
+from backend.searching_logic.event_index import EventIndex
+from backend.searching_logic.query_builder import query_events
+from backend.searching_logic.searching_logic import search_by_description, search_by_title
+
+
+@pytest.fixture
+def events(db):
+    for name, description in [("Émile's Chess Night", "Café meetup"),
+                              ("STRASSE fest", "100% fun_day"),
+                              ("Hackathon", "ÉCOLE visit")]:
+        create_event(1, name, description, "Library Lab", "Computer Science",
+                     "2099-11-01 09:00:00", "2099-11-02 09:00:00")
+    return query_events(limit=None)
+
+
+@pytest.mark.parametrize("text", ["émile", "ÉMILE", "straße", "hack", "%", "_", "nothing"])
+def test_title_matches_on_sql_and_python_paths(events, text):
+    sql = [e["eventID"] for e in query_events({"title": text}, limit=None)]
+    assert sql == [e["eventID"] for e in search_by_title(events, text)]
+    assert sql == [e["eventID"] for e in EventIndex(events).query(title=text)]
+
+
+@pytest.mark.parametrize("text", ["café", "école", "100%", "n_d", "fun_"])
+def test_description_matches_on_sql_and_python_paths(events, text):
+    sql = [e["eventID"] for e in query_events({"description": text}, limit=None)]
+    assert sql == [e["eventID"] for e in search_by_description(events, text)]
+    assert sql
@@ -0,0 +1,40 @@
+"""
+Tests for searching_logic/searching_logic.py (run: python -m pytest -q).
+"""
+
+import pytest
+
+from backend.events.categories import attach_categories, events_in_categories
+from backend.events.create import create_event
+from backend.events.read import read_events
+from backend.searching_logic import searching_logic
+from backend.searching_logic.searching_logic import search_by_category
+
+
+@pytest.fixture
+def events(db):
+    create_event(1, "Pickup game", "d", "Rec Center", "Sports", "2099-11-01 09:00:00", "2099-11-01 11:00:00")
+    create_event(1, "Stats for athletes", "d", "Ross Hall", "Math", "2099-11-02 09:00:00", "2099-11-02 11:00:00",
+                 categories=["Sports"])
+    create_event(1, "Proof workshop", "d", "Ross Hall", "Math", "2099-11-03 09:00:00", "2099-11-03 11:00:00")
+    return read_events()
+
+
+def _ids(rows):
+    return [row["eventID"] for row in rows]
+
+
+@pytest.mark.parametrize("categories, match", [(["Sports"], "any"), (["Sports", "Math"], "all")])
+def test_attached_rows_match_the_category_index(events, categories, match):
+    rows = attach_categories([dict(e) for e in events])
+    assert _ids(search_by_category(rows, categories, match)) == events_in_categories(categories, match)
+    assert _ids(search_by_category(events, categories, match, load_categories=True)) == \
+        events_in_categories(categories, match)
+
+
+def test_plain_rows_are_filtered_without_the_database(events, monkeypatch):
+    def no_db(*args, **kwargs):
+        raise AssertionError("search_by_category read eventCategories")
+
+    monkeypatch.setattr(searching_logic, "get_event_categories_many", no_db)
+    assert [e["eventName"] for e in search_by_category(events, ["Sports"])] == ["Pickup game"]
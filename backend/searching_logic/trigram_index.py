@@ -0,0 +1,235 @@
+"""
+=========================================================
+TRIGRAM INDEX (typo-tolerant substring search + autocomplete)
+=========================================================
+
+Purpose:
+- In-memory trigram inverted index over event names and locations, for
+  search-as-you-type: suggest(prefix, k) and search_by_title(query,
+  max_edits=1) only look at events whose trigrams overlap the query,
+  instead of scanning every title on every keystroke.
+- Misspelled queries ("hack nigt") still find "Hack Night".
+
+What Changed:
+- New module next to event_index.py (same build-once / upsert / delete
+  lifecycle).
+- Each field is casefolded (like the other search paths), whitespace-
+  collapsed and padded (" text "), then split into 3-character grams. Word starts also get an anchored
+  gram ("  h") so 1-character prefixes are indexed too.
+- Posting lists are array('I') of slot numbers (4 bytes per entry),
+  appended in slot order so they stay sorted.
+- Fuzzy matching uses the q-gram bound: one edit changes at most 3 of
+  the query's trigrams, so only events sharing at least
+  len(grams) - 3 * max_edits of them are verified with an edit-distance
+  check.
+
+Frontend Use:
+- SearchBar.tsx autocomplete → suggest(text, k=8).
+- Search results for typed text → search_by_title(text, max_edits=1).
+- Keep one index per process; call upsert()/delete() after writes.
+"""
+
+import heapq
+from array import array
+from collections import defaultdict
+from collections.abc import Iterable
+
+INDEXED_FIELDS = ("eventName", "location")
+
+
+def _normalize(text: str | None) -> str:
+    """Casefold and collapse whitespace."""
+    return " ".join((text or "").casefold().split())
+
+
+def _grams(text: str) -> set[str]:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def _document_grams(text: str) -> set[str]:
+    """Trigrams of a normalized field, plus one anchored gram per word start."""
+    grams = _grams(f" {text} ")
+    grams.update("  " + word[0] for word in text.split())
+    return grams
+
+
+def _prefix_grams(prefix: str) -> set[str]:
+    """Grams every field with a word starting with `prefix` must contain."""
+    grams = _grams(f" {prefix}")
+    grams.add("  " + prefix[0])
+    return grams
+
+
+def _within_edits(pattern: str, text: str, max_edits: int) -> bool:
+    """
+    True if some substring of `text` is within `max_edits` edits of `pattern`.
+    Myers' bit-parallel edit distance: one column of the DP table per
+    text character, held as bit vectors in Python ints.
+    """
+    if pattern in text or len(pattern) <= max_edits:
+        return True
+    peq = {}
+    for i, ch in enumerate(pattern):
+        peq[ch] = peq.get(ch, 0) | (1 << i)
+    mask = (1 << len(pattern)) - 1
+    high = 1 << (len(pattern) - 1)
+    pv, mv, score = mask, 0, len(pattern)
+    for ch in text:
+        eq = peq.get(ch, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | (~(xh | pv) & mask)
+        mh = pv & xh
+        if ph & high:
+            score += 1
+        elif mh & high:
+            score -= 1
+        ph = (ph << 1) & mask  # shift in 0: a match may start anywhere in text
+        mh = (mh << 1) & mask
+        pv = mh | (~(xv | ph) & mask)
+        mv = ph & xv
+        if score <= max_edits:
+            return True
+    return False
+
+
+class TrigramIndex:
+    """
+    Trigram postings per indexed field: gram → array('I') of slots.
+    Each event occupies one slot; deleted slots are skipped and
+    dropped by compaction.
+    """
+
+    def __init__(self, events: Iterable[dict] = ()):
+        self._rows = []      # slot → event dict (None if deleted)
+        self._text = {field: [] for field in INDEXED_FIELDS}  # slot → normalized text
+        self._postings = {field: defaultdict(lambda: array("I")) for field in INDEXED_FIELDS}
+        self._slot_of = {}   # eventID → slot
+        self._free = 0
+        for event in events:
+            self.upsert(event)
+
+    def __len__(self) -> int:
+        return len(self._slot_of)
+
+    def __contains__(self, event_id: int) -> bool:
+        return event_id in self._slot_of
+
+    # -----------------------------
+    # WRITES
+    # -----------------------------
+    def upsert(self, event: dict):
+        """Index an event, or re-index it after its name/location changed."""
+        self.delete(event["eventID"])
+        slot = len(self._rows)
+        self._rows.append(dict(event))
+        self._slot_of[event["eventID"]] = slot
+        for field in INDEXED_FIELDS:
+            text = _normalize(event.get(field))
+            self._text[field].append(text)
+            postings = self._postings[field]
+            for gram in _document_grams(text):
+                postings[gram].append(slot)
+
+    def delete(self, event_id: int) -> bool:
+        """Remove an event. Returns False if it was not indexed."""
+        slot = self._slot_of.pop(event_id, None)
+        if slot is None:
+            return False
+        self._rows[slot] = None
+        self._free += 1
+        if self._free > 1024 and self._free * 2 > len(self._rows):
+            self._compact()
+        return True
+
+    def _compact(self):
+        """Rebuild without deleted slots (shrinks the posting lists)."""
+        live = [row for row in self._rows if row is not None]
+        self.__init__(live)
+
+    # -----------------------------
+    # CANDIDATES
+    # -----------------------------
+    def _all_of(self, field: str, grams: set[str]) -> set[int]:
+        """Slots whose `field` contains every gram (smallest posting list first)."""
+        postings = self._postings[field]
+        lists = sorted((postings.get(g, ()) for g in grams), key=len)
+        if not lists or not lists[0]:
+            return set()
+        slots = set(lists[0])
+        for plist in lists[1:]:
+            slots.intersection_update(plist)
+            if not slots:
+                break
+        return slots
+
+    def _at_least(self, field: str, grams: set[str], needed: int) -> list[int]:
+        """Slots whose `field` shares at least `needed` (>= 1) grams with the query."""
+        postings = self._postings[field]
+        hits = defaultdict(int)
+        for gram in grams:
+            for slot in postings.get(gram, ()):
+                hits[slot] += 1
+        return [slot for slot, n in hits.items() if n >= needed]
+
+    def _ranked(self, slots: Iterable[int], field: str, key, limit: int | None = None) -> list[int]:
+        """Live slots ordered by (key(text), text length, eventID); top `limit` only if given."""
+        texts = self._text[field]
+        live = (s for s in slots if self._rows[s] is not None)
+        sort_key = lambda s: (key(texts[s]), len(texts[s]), self._rows[s]["eventID"])
+        if limit is not None:
+            return heapq.nsmallest(limit, live, key=sort_key)
+        return sorted(live, key=sort_key)
+
+    # -----------------------------
+    # QUERIES
+    # -----------------------------
+    def suggest(self, prefix: str, k: int = 8, fields: Iterable[str] = INDEXED_FIELDS) -> list[dict]:
+        """
+        Up to k events with a word in one of `fields` starting with `prefix`
+        (matched across words, e.g. "hack ni" → "Hack Night").
+        Names starting with the prefix rank first, then shorter names.
+        """
+        prefix = _normalize(prefix)
+        if not prefix or k <= 0:
+            return []
+        matches, seen = [], set()
+        for field in fields:
+            if field not in self._text:
+                raise ValueError(f"Field '{field}' is not indexed")
+            texts = self._text[field]
+            slots = [s for s in self._all_of(field, _prefix_grams(prefix))
+                     if texts[s].startswith(prefix) or f" {prefix}" in texts[s]]
+            for slot in self._ranked(slots, field, lambda t: not t.startswith(prefix), limit=k):
+                if slot not in seen:
+                    seen.add(slot)
+                    matches.append(slot)
+        return [dict(self._rows[s]) for s in matches[:k]]
+
+    def search_by_title(self, title_query: str, max_edits: int = 0, limit: int | None = None) -> list[dict]:
+        """
+        Events whose eventName contains `title_query` (case-insensitive),
+        allowing up to `max_edits` typos (insert/delete/substitute).
+        Exact matches rank before fuzzy ones.
+        Short queries get fewer edits (at most (len(grams) - 1) // 3), so
+        the trigram bound can always prune: "hak" is matched exactly,
+        "hack nigt" with one typo.
+        """
+        if max_edits < 0:
+            raise ValueError("max_edits must be >= 0")
+        query = _normalize(title_query)
+        if not query:
+            return []
+        texts = self._text["eventName"]
+        grams = _grams(query)
+
+        max_edits = min(max_edits, max(len(grams) - 1, 0) // 3)
+        if max_edits == 0:
+            slots = self._all_of("eventName", grams) if grams else range(len(self._rows))
+            slots = [s for s in slots if query in texts[s]]
+        else:
+            slots = [s for s in self._at_least("eventName", grams, len(grams) - 3 * max_edits)
+                     if _within_edits(query, texts[s], max_edits)]
+
+        ranked = self._ranked(slots, "eventName", lambda t: query not in t, limit=limit)
+        return [dict(self._rows[s]) for s in ranked]